@@ -0,0 +1,67 @@
+# Standard library imports
+import asyncio
+import importlib.util
+
+# Third-party imports
+import pytest
+
+# Local imports
+from benchmarks import consumers, stubs
+
+BASE_URL = "https://api.github.com/"
+
+collect_ignore_glob = []
+if importlib.util.find_spec("pytest_benchmark") is None:  # pragma: no cover
+    # Benchmarks require `pytest-benchmark`; see the Benchmarks section of CONTRIBUTING.md.
+    collect_ignore_glob.append("test_pipeline.py")
+
+
+def _make_github(client, hooks=()):
+    return consumers.GitHub(
+        base_url=BASE_URL,
+        client=client,
+        converters=consumers.repo_json_writer,
+        hooks=list(hooks),
+    )
+
+
+@pytest.fixture
+def make_github():
+    """Returns a factory of blocking consumers backed by a stub client."""
+
+    def factory(body=None, hooks=()):
+        client = stubs.StubClient(stubs.StubResponse(body))
+        return _make_github(client, hooks)
+
+    return factory
+
+
+@pytest.fixture
+def make_async_github():
+    """Returns a factory of asyncio consumers backed by a stub client."""
+
+    def factory(body=None, hooks=()):
+        client = stubs.AsyncStubClient(stubs.StubResponse(body))
+        return _make_github(client, hooks)
+
+    return factory
+
+
+@pytest.fixture
+def run_async():
+    """
+    Returns a function that benchmarks a batch of calls on one event
+    loop, so the loop's startup cost isn't measured.
+    """
+    loop = asyncio.new_event_loop()
+
+    def run(benchmark, call, batch_size=100):
+        async def batch():
+            for _ in range(batch_size):
+                await call()
+
+        benchmark.extra_info["batch_size"] = batch_size
+        return benchmark(lambda: loop.run_until_complete(batch()))
+
+    yield run
+    loop.close()
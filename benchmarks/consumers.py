@@ -0,0 +1,94 @@
+# Standard library imports
+import typing
+
+# Third-party imports
+import marshmallow
+import pydantic
+
+# Local imports
+import uplink
+
+UNLIMITED = 10**9
+
+
+class User(pydantic.BaseModel):
+    id: int
+    login: str
+    site_admin: bool
+
+
+class UserSchema(marshmallow.Schema):
+    id = marshmallow.fields.Int()
+    login = marshmallow.fields.Str()
+    site_admin = marshmallow.fields.Bool()
+
+
+class Repo(typing.NamedTuple):
+    owner: str
+    name: str
+
+
+class Hook(uplink.hooks.TransactionHook):
+    def audit_request(self, consumer, request_builder):
+        request_builder.info["headers"]["X-Audited"] = "1"
+
+    def handle_response(self, consumer, response):
+        return response
+
+
+class GitHub(uplink.Consumer):
+    @uplink.get("/users")
+    def list_users(self):
+        pass
+
+    @uplink.get("/repos/{owner}/{repo}/issues")
+    def list_issues(
+        self,
+        owner,
+        repo,
+        state: uplink.Query = "open",
+        sort: uplink.Query = None,
+        page: uplink.Query(type=int) = 1,
+    ):
+        pass
+
+    @uplink.json
+    @uplink.post("/user/repos")
+    def create_repo(self, repo: uplink.Body(type=Repo)):
+        pass
+
+    @uplink.returns.json
+    @uplink.get("/users/{username}")
+    def get_user_json(self, username):
+        pass
+
+    @uplink.returns.json(type=User)
+    @uplink.get("/users/{username}")
+    def get_user_pydantic(self, username):
+        pass
+
+    @uplink.returns.json(type=UserSchema)
+    @uplink.get("/users/{username}")
+    def get_user_marshmallow(self, username):
+        pass
+
+    @uplink.returns.json(type=typing.List[User])  # noqa: UP006
+    @uplink.get("/users")
+    def list_users_pydantic(self):
+        pass
+
+    @uplink.retry(max_attempts=3)
+    @uplink.ratelimit(calls=UNLIMITED, period=1)
+    @uplink.returns.json
+    @uplink.get("/users/{username}")
+    def get_user_resilient(self, username):
+        pass
+
+
+@uplink.dumps.to_json(Repo)
+def repo_json_writer(_, repo):
+    return repo._asdict()
+
+
+USER = {"id": 1, "login": "prkumar", "site_admin": False}
+USERS = [dict(USER, id=i) for i in range(20)]
@@ -0,0 +1,490 @@
+"""
+A load-testing harness that drives a consumer at a target concurrency
+against a local stand-in HTTP server.
+
+The server simulates latency, server errors, and rate limiting, so the
+harness can exercise retries, rate limits, and connection pooling under
+contention without outside services. Each run reports throughput,
+latency percentiles, and the peak number of open sockets and resident
+memory of the process.
+
+Run one client per process, since the Twisted reactor can't restart:
+
+    python -m benchmarks.load --client requests --concurrency 32 --requests 2000
+    python -m benchmarks.load --client aiohttp --latency 0.05 --error-rate 0.01 --retry
+    python -m benchmarks.load --client twisted --server-rate-limit 200 --retry --json
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+import concurrent.futures
+import http.server
+import json
+import math
+import os
+import random
+import resource
+import sys
+import threading
+import time
+
+# Local imports
+import uplink
+
+CLIENTS = ("requests", "aiohttp", "twisted")
+
+
+class ServerConfig:
+    """
+    Describes how the stand-in server responds.
+
+    Args:
+        latency: The number of seconds to wait before responding.
+        jitter: The maximum number of seconds added to or removed from
+            the latency at random.
+        error_rate: The fraction of requests that fail with a 503.
+        rate_limit: If given, the number of requests per second that the
+            server accepts before responding with a 429.
+        seed: Seeds the random choice of latency and failures.
+    """
+
+    def __init__(
+        self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=None, seed=0
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.seed = seed
+
+
+class _TokenBucket:
+    def __init__(self, rate, clock=time.monotonic):
+        self._rate = rate
+        self._tokens = rate
+        self._clock = clock
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Returns 0 if a token is available, else the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self._rate, self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self._rate
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    # Keep connections alive so clients can pool them.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status, headers, delay = self.server.decide()
+        if delay > 0:
+            time.sleep(delay)
+        body = json.dumps({"path": self.path, "status": status}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.record(status)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    """
+    An in-process HTTP server that responds to any `GET` request
+    according to the given `ServerConfig`.
+
+    Use it as a context manager to serve from a background thread:
+
+        with StandInServer(ServerConfig(latency=0.01)) as server:
+            ...  # Send requests to server.url
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, config, host="127.0.0.1", port=0):
+        super().__init__((host, port), _Handler)
+        self.config = config
+        self.statuses = {}
+        self._random = random.Random(config.seed)
+        self._bucket = (
+            None if config.rate_limit is None else _TokenBucket(config.rate_limit)
+        )
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    @property
+    def url(self):
+        return f"http://{self.server_address[0]}:{self.port}/"
+
+    def decide(self):
+        """Returns the status, headers, and delay of the next response."""
+        config = self.config
+        with self._lock:
+            jitter = self._random.uniform(-config.jitter, config.jitter)
+            fails = self._random.random() < config.error_rate
+        delay = max(0.0, config.latency + jitter)
+        if self._bucket is not None:
+            wait = self._bucket.take()
+            if wait:
+                return 429, {"Retry-After": str(math.ceil(wait))}, 0.0
+        if fails:
+            return 503, {}, delay
+        return 200, {}, delay
+
+    def record(self, status):
+        with self._lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+
+# Resource sampling
+
+
+def count_open_sockets(port):
+    """
+    Returns the number of established connections to the given local
+    port, or `None` if the platform doesn't expose them.
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return sum(
+            1
+            for connection in psutil.Process().net_connections(kind="tcp")
+            if connection.raddr
+            and connection.raddr.port == port
+            and connection.status == psutil.CONN_ESTABLISHED
+        )
+    count, found = 0, False
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as file:
+                lines = file.readlines()[1:]
+        except OSError:
+            continue
+        found = True
+        for line in lines:
+            fields = line.split()
+            remote_port = int(fields[2].rsplit(":", 1)[1], 16)
+            if remote_port == port and fields[3] == "01":  # ESTABLISHED
+                count += 1
+    return count if found else None
+
+
+def current_rss():
+    """Returns the resident memory of this process, in bytes."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Fall back to the peak, reported in kilobytes on Linux and in
+        # bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class ResourceSampler:
+    """Tracks the peak open sockets and memory in a background thread."""
+
+    def __init__(self, port, interval=0.05):
+        self._port = port
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.peak_sockets = None
+        self.peak_rss = 0
+
+    def sample(self):
+        sockets = count_open_sockets(self._port)
+        if sockets is not None:
+            self.peak_sockets = max(self.peak_sockets or 0, sockets)
+        self.peak_rss = max(self.peak_rss, current_rss())
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self.sample()
+
+    def __enter__(self):
+        self.sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+
+# Consumers
+
+
+def make_consumer(base_url, client, retry=False, rate_limit=None):
+    """
+    Returns a consumer with a single `get_item` method, optionally
+    decorated with a retry policy and a client-side rate limit.
+    """
+
+    def get_item(self, item):
+        pass
+
+    method = uplink.get("items/{item}")(get_item)
+    if rate_limit is not None:
+        method = uplink.ratelimit(calls=rate_limit, period=1)(method)
+    if retry:
+        method = uplink.retry(
+            when=uplink.retry.when.status(429, 503),
+            on_exception=uplink.retry.CONNECTION_ERROR,
+            backoff=uplink.retry.backoff.retry_after()
+            | uplink.retry.backoff.jittered(multiplier=0.05, maximum=1),
+            max_attempts=5,
+        )(method)
+    consumer_cls = type("LoadTarget", (uplink.Consumer,), {"get_item": method})
+    return consumer_cls(base_url=base_url, client=client)
+
+
+def _outcome(response):
+    status_code = getattr(response, "status_code", None)
+    if status_code is not None and status_code >= 400:
+        return f"http_{status_code}"
+    return "ok"
+
+
+# Drivers: each returns a list of (latency, outcome) tuples.
+
+
+def drive_requests(base_url, total, concurrency, **consumer_options):
+    import requests
+
+    session = requests.Session()
+    consumer = make_consumer(
+        base_url, uplink.RequestsClient(session), **consumer_options
+    )
+
+    def call(item):
+        start = time.perf_counter()
+        try:
+            outcome = _outcome(consumer.get_item(item))
+        except Exception as error:
+            outcome = type(error).__name__
+        return time.perf_counter() - start, outcome
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(concurrency) as executor:
+            return list(executor.map(call, range(total)))
+    finally:
+        session.close()
+
+
+def drive_aiohttp(base_url, total, concurrency, **consumer_options):
+    import aiohttp
+
+    async def run():
+        items, results = iter(range(total)), []
+        async with aiohttp.ClientSession() as session:
+            consumer = make_consumer(
+                base_url, uplink.AiohttpClient(session), **consumer_options
+            )
+
+            async def worker():
+                for item in items:
+                    start = time.perf_counter()
+                    try:
+                        outcome = _outcome(await consumer.get_item(item))
+                    except Exception as error:
+                        outcome = type(error).__name__
+                    results.append((time.perf_counter() - start, outcome))
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return results
+
+    return asyncio.run(run())
+
+
+def drive_twisted(base_url, total, concurrency, **consumer_options):
+    from twisted.internet import defer, reactor
+
+    reactor.suggestThreadPoolSize(concurrency)
+    consumer = make_consumer(base_url, uplink.TwistedClient(), **consumer_options)
+    items, results, errors = iter(range(total)), [], []
+
+    @defer.inlineCallbacks
+    def worker():
+        for item in items:
+            start = time.perf_counter()
+            try:
+                response = yield consumer.get_item(item)
+                outcome = _outcome(response)
+            except Exception as error:
+                outcome = type(error).__name__
+            results.append((time.perf_counter() - start, outcome))
+
+    def run():
+        workers = defer.gatherResults([worker() for _ in range(concurrency)])
+        workers.addErrback(errors.append)
+        workers.addBoth(lambda _: reactor.stop())
+
+    reactor.callWhenRunning(run)
+    reactor.run(installSignalHandlers=False)
+    if errors:
+        errors[0].raiseException()
+    return results
+
+
+DRIVERS = {
+    "requests": drive_requests,
+    "aiohttp": drive_aiohttp,
+    "twisted": drive_twisted,
+}
+
+
+# Reporting
+
+
+def percentile(ordered, p):
+    """Returns the p-th percentile of a sorted, non-empty list."""
+    index = min(len(ordered) - 1, max(0, math.ceil(len(ordered) * p / 100.0) - 1))
+    return ordered[index]
+
+
+def summarize(client, results, elapsed, sampler, server, concurrency):
+    latencies = sorted(latency for latency, _ in results)
+    outcomes = {}
+    for _, outcome in results:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    ok = outcomes.get("ok", 0)
+    return {
+        "client": client,
+        "concurrency": concurrency,
+        "requests": len(results),
+        "elapsed": elapsed,
+        "throughput": len(results) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50) if latencies else None,
+        "p99": percentile(latencies, 99) if latencies else None,
+        "error_rate": 1 - ok / len(results) if results else 0.0,
+        "outcomes": outcomes,
+        "server_statuses": {str(k): v for k, v in sorted(server.statuses.items())},
+        "peak_open_sockets": sampler.peak_sockets,
+        "peak_rss_mb": sampler.peak_rss / 2**20,
+    }
+
+
+def format_report(report):
+    def ms(seconds):
+        return "n/a" if seconds is None else f"{seconds * 1000:.2f} ms"
+
+    sockets = report["peak_open_sockets"]
+    lines = [
+        f"client:            {report['client']} (concurrency {report['concurrency']})",
+        f"requests:          {report['requests']} in {report['elapsed']:.2f} s",
+        f"throughput:        {report['throughput']:.1f} req/s",
+        f"latency p50/p99:   {ms(report['p50'])} / {ms(report['p99'])}",
+        f"error rate:        {report['error_rate']:.2%} {report['outcomes']}",
+        f"server statuses:   {report['server_statuses']}",
+        f"peak open sockets: {'n/a' if sockets is None else sockets}",
+        f"peak RSS:          {report['peak_rss_mb']:.1f} MiB",
+    ]
+    return "\n".join(lines)
+
+
+def run(
+    client,
+    total=1000,
+    concurrency=16,
+    server_config=None,
+    retry=False,
+    rate_limit=None,
+):
+    """Runs a load test and returns its report as a dictionary."""
+    server_config = ServerConfig() if server_config is None else server_config
+    driver = DRIVERS[client]
+    with StandInServer(server_config) as server:
+        with ResourceSampler(server.port) as sampler:
+            start = time.perf_counter()
+            results = driver(
+                server.url,
+                total,
+                concurrency,
+                retry=retry,
+                rate_limit=rate_limit,
+            )
+            elapsed = time.perf_counter() - start
+    return summarize(client, results, elapsed, sampler, server, concurrency)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--client", choices=CLIENTS, default="requests")
+    parser.add_argument("--requests", type=int, default=1000, dest="total")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--server-rate-limit",
+        type=float,
+        help="requests per second the server accepts before responding with 429",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--retry", action="store_true", help="retry 429 and 503 responses"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        help="client-side limit on calls per second, with uplink.ratelimit",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.client,
+        total=args.total,
+        concurrency=args.concurrency,
+        server_config=ServerConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit=args.server_rate_limit,
+            seed=args.seed,
+        ),
+        retry=args.retry,
+        rate_limit=args.rate_limit,
+    )
+    print(json.dumps(report) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
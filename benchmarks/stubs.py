@@ -0,0 +1,60 @@
+# Standard library imports
+import json
+
+# Local imports
+from uplink.clients import interfaces, io
+
+
+class StubResponse:
+    """A canned response that quacks like a `requests` response."""
+
+    def __init__(self, body=None, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {"Content-Type": "application/json"}
+        self.content = json.dumps(body).encode()
+        self._json = body
+
+    @property
+    def text(self):
+        return self.content.decode()
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class StubClient(interfaces.HttpClientAdapter):
+    """
+    A blocking client that returns a canned response without touching
+    the network, so benchmarks measure only the library's overhead.
+    """
+
+    def __init__(self, response=None):
+        self._response = StubResponse() if response is None else response
+
+    def io(self):
+        return io.BlockingStrategy()
+
+    def send(self, request):
+        return self._response
+
+    def apply_callback(self, callback, response):
+        return callback(response)
+
+
+class AsyncStubClient(StubClient):
+    """An asyncio counterpart to `StubClient`."""
+
+    def io(self):
+        return io.AsyncioStrategy()
+
+    async def send(self, request):
+        return self._response
+
+    async def apply_callback(self, callback, response):
+        return callback(response)
@@ -0,0 +1,60 @@
+"""Smoke tests of the load-testing harness, small enough to run in CI."""
+
+# Standard library imports
+import json
+import subprocess
+import sys
+
+# Third-party imports
+import pytest
+
+# Local imports
+from benchmarks import load
+
+
+@pytest.mark.parametrize("client", ["requests", "aiohttp"])
+def test_load(client):
+    if client == "aiohttp":
+        pytest.importorskip("aiohttp")
+    server_config = load.ServerConfig(latency=0.001, error_rate=0.1)
+
+    report = load.run(
+        client, total=50, concurrency=4, server_config=server_config, retry=True
+    )
+
+    assert report["requests"] == 50
+    assert report["outcomes"] == {"ok": 50}
+    assert report["server_statuses"]["503"] > 0
+    assert report["throughput"] > 0
+    assert report["p50"] <= report["p99"]
+    assert report["peak_rss_mb"] > 0
+
+
+def test_load_with_server_rate_limit():
+    server_config = load.ServerConfig(rate_limit=5)
+
+    report = load.run("requests", total=10, concurrency=2, server_config=server_config)
+
+    # Without retries, requests beyond the limit fail with a 429.
+    assert report["outcomes"]["http_429"] > 0
+    assert report["error_rate"] > 0
+
+
+def test_load_cli_with_twisted():
+    pytest.importorskip("twisted")
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.load",
+            "--client=twisted",
+            "--requests=20",
+            "--concurrency=4",
+            "--json",
+        ],
+        timeout=60,
+    )
+
+    report = json.loads(output)
+    assert report["client"] == "twisted"
+    assert report["outcomes"] == {"ok": 20}
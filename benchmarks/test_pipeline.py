@@ -0,0 +1,60 @@
+"""
+Benchmarks of the per-call overhead of the request pipeline, from
+binding arguments to converting the response, with a stub client in
+place of the network.
+"""
+
+# Third-party imports
+import pytest
+
+# Local imports
+from benchmarks import consumers
+
+SCENARIOS = {
+    "bare_get": (None, lambda github: github.list_users()),
+    "get_with_path_and_query": (
+        None,
+        lambda github: github.list_issues("prkumar", "uplink", sort="updated", page=2),
+    ),
+    "post_json_body": (
+        None,
+        lambda github: github.create_repo(consumers.Repo("prkumar", "uplink")),
+    ),
+    "returns_json": (consumers.USER, lambda github: github.get_user_json("prkumar")),
+    "returns_pydantic": (
+        consumers.USER,
+        lambda github: github.get_user_pydantic("prkumar"),
+    ),
+    "returns_marshmallow": (
+        consumers.USER,
+        lambda github: github.get_user_marshmallow("prkumar"),
+    ),
+    "returns_pydantic_list": (
+        consumers.USERS,
+        lambda github: github.list_users_pydantic(),
+    ),
+    "retry_ratelimit_hooks": (
+        consumers.USER,
+        lambda github: github.get_user_resilient("prkumar"),
+    ),
+}
+
+
+def _hooks_for(name):
+    return [consumers.Hook()] if name == "retry_ratelimit_hooks" else []
+
+
+@pytest.mark.benchmark(group="blocking")
+@pytest.mark.parametrize("name", list(SCENARIOS))
+def test_blocking(benchmark, make_github, name):
+    body, call = SCENARIOS[name]
+    github = make_github(body, hooks=_hooks_for(name))
+    benchmark(call, github)
+
+
+@pytest.mark.benchmark(group="asyncio")
+@pytest.mark.parametrize("name", list(SCENARIOS))
+def test_asyncio(benchmark, make_async_github, run_async, name):
+    body, call = SCENARIOS[name]
+    github = make_async_github(body, hooks=_hooks_for(name))
+    run_async(benchmark, lambda: call(github))
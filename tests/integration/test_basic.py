@@ -113,3 +113,127 @@ def test_handle_client_exceptions(mock_client):
 
     with pytest.raises(service.exceptions.BaseClientException):
         service.list_repos("prkumar")
+
+
+def test_lazy_consumer_builds_definitions_on_first_use(mock_client):
+    calls = []
+
+    class Service(uplink.Consumer, lazy=True):
+        @uplink.get("/users/{user}")
+        def get_user(self, user):
+            calls.append(user)
+
+    definition = Service.__dict__["get_user"]
+    assert definition._request_definition is None
+
+    service = Service(base_url=BASE_URL, client=mock_client)
+    service.get_user("prkumar")
+    request = mock_client.history[0]
+    assert request.url == BASE_URL + "users/prkumar"
+    assert definition._request_definition is not None
+
+
+def test_lazy_consumer_validate():
+    class Service(uplink.Consumer, lazy=True):
+        @uplink.get("/users/{user}")
+        def get_user(self, user):
+            pass
+
+    class Subclass(Service):
+        # The URI template references an undefined argument.
+        @uplink.get("/repos/{repo}")
+        def get_repo(self, user):
+            pass
+
+    assert Subclass._lazy_definitions
+    Service.validate()
+    with pytest.raises(uplink.exceptions.UplinkBuilderError):
+        Subclass.validate()
+
+
+def test_derive(mock_client):
+    github = GitHubService(base_url=BASE_URL, client=mock_client)
+    github.session.headers["X-Client"] = "uplink"
+
+    tenant = github.derive(
+        base_url="https://tenant.example.com/",
+        auth=("user", "pass"),
+        headers={"X-Tenant": "acme"},
+    )
+    tenant.list_repos("prkumar")
+    github.list_repos("prkumar")
+
+    tenant_request, request = mock_client.history
+    assert isinstance(tenant, GitHubService)
+    assert tenant.exceptions is github.exceptions
+    assert tenant_request.has_base_url("https://tenant.example.com/")
+    assert tenant_request.headers["X-Client"] == "uplink"
+    assert tenant_request.headers["X-Tenant"] == "acme"
+    assert tenant_request.headers["Authorization"].startswith("Basic ")
+    assert request.has_base_url(BASE_URL)
+    assert "X-Tenant" not in request.headers
+    assert "Authorization" not in request.headers
+
+
+def test_derive_keeps_class_level_annotations(mock_client):
+    @uplink.params({"per_page": "100"})
+    @uplink.headers({"Accept": "application/vnd.github.v3.full+json"})
+    class Service(uplink.Consumer):
+        @uplink.get("/users/{user}/repos")
+        def list_repos(self, user):
+            pass
+
+    service = Service(base_url=BASE_URL, client=mock_client)
+    tenant = service.derive(headers={"X-Tenant": "acme"})
+    tenant.session.headers["X-Trace"] = "on"
+    tenant.session.params["page"] = "2"
+
+    tenant.list_repos("prkumar")
+    service.list_repos("prkumar")
+
+    tenant_request, request = mock_client.history
+    assert tenant_request.headers == {
+        "Accept": "application/vnd.github.v3.full+json",
+        "X-Tenant": "acme",
+        "X-Trace": "on",
+    }
+    assert tenant_request.params == {"per_page": "100", "page": "2"}
+    assert request.headers == {"Accept": "application/vnd.github.v3.full+json"}
+    assert request.params == {"per_page": "100"}
+    assert service.session.headers == {}
+    assert service.session.params == {}
+
+
+def test_max_response_size_with_custom_client(mocker):
+    import requests
+
+    # Setup: a client that passes the request's options to the session
+    class Client(uplink.clients.interfaces.HttpClientAdapter):
+        def __init__(self, session):
+            self._session = session
+
+        def io(self):
+            return uplink.clients.io.BlockingStrategy()
+
+        def apply_callback(self, callback, response):
+            return callback(response)
+
+        def send(self, request):
+            method, url, extras = request
+            return self._session.request(method, url, **extras)
+
+    class Service(uplink.Consumer):
+        @uplink.max_response_size(1024)
+        @uplink.get("/users/{user}/repos")
+        def list_repos(self, user):
+            pass
+
+    session = mocker.create_autospec(requests.Session, instance=True)
+    service = Service(base_url=BASE_URL, client=Client(session))
+
+    # Run
+    response = service.list_repos("prkumar")
+
+    # Verify: the limit isn't passed to the session
+    assert response is session.request.return_value
+    assert "max_response_size" not in session.request.call_args.kwargs
@@ -0,0 +1,128 @@
+# Third-party imports
+import pytest
+
+# Local imports
+import uplink
+from uplink.circuit_breaker import CircuitBreakerOpen
+
+# Constants
+BASE_URL = "https://api.github.com/"
+DIFFERENT_BASE_URL = "https://hostedgithub.com/"
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+class CustomException(Exception):
+    pass
+
+
+def create_github_class(clock):
+    class GitHub(uplink.Consumer):
+        @uplink.circuit_breaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        @uplink.get("users/{user}")
+        def get_user(self, user):
+            pass
+
+        @uplink.circuit_breaker(
+            failure_threshold=1,
+            reset_timeout=10,
+            when=uplink.retry.when.status_5xx(),
+            clock=clock,
+        )
+        @uplink.get("repos/{user}/{repo}")
+        def get_repo(self, user, repo):
+            pass
+
+    return GitHub
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+# Tests
+
+
+def test_circuit_opens_after_consecutive_failures(mock_client, clock):
+    # Setup
+    mock_client.with_side_effect([CustomException, CustomException])
+    github = create_github_class(clock)(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    for _ in range(2):
+        with pytest.raises(CustomException):
+            github.get_user("prkumar")
+
+    # Verify: the request fails fast without touching the network
+    with pytest.raises(CircuitBreakerOpen):
+        github.get_user("prkumar")
+    assert len(mock_client.history) == 2
+
+
+def test_success_resets_failure_count(mock_client, mock_response, clock):
+    # Setup
+    mock_client.with_side_effect(
+        [CustomException, mock_response, CustomException, mock_response]
+    )
+    github = create_github_class(clock)(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    with pytest.raises(CustomException):
+        github.get_user("prkumar")
+    github.get_user("prkumar")
+    with pytest.raises(CustomException):
+        github.get_user("prkumar")
+
+    # Verify: the circuit is still closed
+    assert github.get_user("prkumar") == mock_response
+    assert len(mock_client.history) == 4
+
+
+def test_half_open_after_reset_timeout(mock_client, mock_response, clock):
+    # Setup
+    mock_response.status_code = 503
+    mock_client.with_response(mock_response)
+    github = create_github_class(clock)(base_url=BASE_URL, client=mock_client)
+    github.get_repo("prkumar", "uplink")
+    with pytest.raises(CircuitBreakerOpen):
+        github.get_repo("prkumar", "uplink")
+
+    # Run: a failed trial request should reopen the circuit
+    clock.time = 10
+    github.get_repo("prkumar", "uplink")
+    with pytest.raises(CircuitBreakerOpen):
+        github.get_repo("prkumar", "uplink")
+
+    # Run: a successful trial request should close the circuit
+    clock.time = 20
+    mock_response.status_code = 200
+    github.get_repo("prkumar", "uplink")
+    github.get_repo("prkumar", "uplink")
+
+    # Verify
+    assert len(mock_client.history) == 4
+
+
+def test_circuit_grouped_by_host_and_port(mock_client, mock_response, clock):
+    # Setup
+    mock_response.status_code = 500
+    mock_client.with_response(mock_response)
+    github_class = create_github_class(clock)
+    github1 = github_class(base_url=BASE_URL, client=mock_client)
+    github2 = github_class(base_url=DIFFERENT_BASE_URL, client=mock_client)
+
+    # Run
+    github1.get_repo("prkumar", "uplink")
+    with pytest.raises(CircuitBreakerOpen):
+        github1.get_repo("prkumar", "uplink")
+
+    # Verify: the circuit for the other host is still closed
+    github2.get_repo("prkumar", "uplink")
+    assert len(mock_client.history) == 2
@@ -0,0 +1,275 @@
+# Standard library imports
+import importlib
+import inspect
+import sys
+import warnings
+
+# Third-party imports
+import pytest
+
+# Local imports
+from uplink import codegen
+
+BASE_URL = "https://petstore.example.com/v1/"
+
+DOCUMENT = {
+    "openapi": "3.0.0",
+    "info": {"title": "Swagger Petstore", "version": "1.0.0"},
+    "servers": [{"url": "https://petstore.example.com/v1"}],
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "listPets",
+                "summary": "List all pets",
+                "tags": ["pets"],
+                "parameters": [
+                    {"name": "limit", "in": "query", "schema": {"type": "integer"}},
+                    {"name": "X-Request-Id", "in": "header"},
+                ],
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Pets"}
+                            }
+                        }
+                    }
+                },
+            },
+            "post": {
+                "operationId": "createPet",
+                "tags": ["pets"],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Pet"}
+                        }
+                    },
+                },
+                "responses": {"201": {"description": "Created"}},
+            },
+        },
+        "/pets/{petId}": {
+            "parameters": [{"name": "petId", "in": "path", "required": True}],
+            "get": {
+                "operationId": "showPetById",
+                "tags": ["pets"],
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Pet"}
+                            }
+                        }
+                    }
+                },
+            },
+        },
+        "/store/inventory": {
+            "get": {
+                "operationId": "getInventory",
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "additionalProperties": {"type": "integer"},
+                                }
+                            }
+                        }
+                    }
+                },
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "Pet": {
+                "type": "object",
+                "required": ["id", "name"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "pet-type": {"type": "string"},
+                    "owner": {"$ref": "#/components/schemas/Owner"},
+                },
+            },
+            "Pets": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}},
+            "Owner": {
+                "type": "object",
+                "properties": {"pets": {"$ref": "#/components/schemas/Pets"}},
+            },
+        }
+    },
+}
+
+# A self-referencing model, with a property named after a keyword.
+TREE_DOCUMENT = {
+    "openapi": "3.0.0",
+    "info": {"title": "Tree", "version": "1.0.0"},
+    "servers": [{"url": "https://tree.example.com"}],
+    "paths": {
+        "/nodes/{nodeId}": {
+            "get": {
+                "operationId": "getNode",
+                "parameters": [{"name": "nodeId", "in": "path", "required": True}],
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Node"}
+                            }
+                        }
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "Node": {
+                "type": "object",
+                "required": ["id"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "class": {"type": "string"},
+                    "parent": {"$ref": "#/components/schemas/Node"},
+                },
+            }
+        }
+    },
+}
+
+
+@pytest.fixture
+def write_module(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def write(name, plans=False, document=DOCUMENT):
+        path = tmp_path / f"{name}.py"
+        path.write_text(codegen.generate(document, plans=plans))
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        importlib.invalidate_caches()
+        return importlib.import_module(name)
+
+    return write
+
+
+def _check_client(module, mock_client, mock_response):
+    pets = module.PetsApi(base_url=module.BASE_URL, client=mock_client)
+    mock_client.with_response(
+        mock_response.with_json([{"id": 1, "name": "Rex", "pet-type": "dog"}])
+    )
+
+    result = pets.list_pets(limit=10, x_request_id="abc")
+
+    request = mock_client.history[-1]
+    assert request.url == BASE_URL + "pets"
+    assert request.params == {"limit": "10"}
+    assert request.headers == {"X-Request-Id": "abc"}
+    assert result == [module.Pet(id=1, name="Rex", pet_type="dog")]
+
+    pets.create_pet(module.Pet(id=2, name="Fido", pet_type="dog"))
+    assert mock_client.history[-1].json == {
+        "id": 2,
+        "name": "Fido",
+        "pet-type": "dog",
+        "owner": None,
+    }
+
+    mock_response.with_json({"id": 3, "name": "Ace"})
+    assert pets.show_pet_by_id("p 1") == module.Pet(id=3, name="Ace")
+    assert mock_client.history[-1].url == BASE_URL + "pets/p%201"
+
+
+def test_generate(write_module, mock_client, mock_response):
+    module = write_module("petstore_client")
+
+    assert module.BASE_URL == BASE_URL
+    assert module.SwaggerPetstore.get_inventory.__name__ == "get_inventory"
+    params = inspect.signature(module.PetsApi.list_pets).parameters
+    assert list(params) == ["self", "limit", "x_request_id"]
+    _check_client(module, mock_client, mock_response)
+
+
+def test_plans(write_module, tmp_path, mock_client, mock_response):
+    module = write_module("petstore_plans", plans=True)
+    assert module._plans is None
+
+    codegen.write_plans(module, codegen.fingerprint(DOCUMENT))
+    assert (tmp_path / "petstore_plans.plans").exists()
+    module = write_module("petstore_plans", plans=True)
+
+    assert module._plans is not None
+    assert module.PetsApi.__module__ == "petstore_plans"
+    assert module.PetsApi.list_pets.__doc__ == "List all pets"
+    params = inspect.signature(module.PetsApi.list_pets).parameters
+    assert list(params) == ["self", "limit", "x_request_id"]
+    _check_client(module, mock_client, mock_response)
+
+
+def test_stale_plans_are_ignored(write_module, tmp_path):
+    module = write_module("petstore_stale", plans=True)
+    codegen.write_plans(module, "outdated")
+
+    module = write_module("petstore_stale", plans=True)
+
+    assert module._plans is None
+
+
+@pytest.mark.parametrize("plans", [False, True])
+def test_recursive_model(write_module, mock_client, mock_response, plans):
+    name = f"tree_client_{'plans' if plans else 'basic'}"
+    module = write_module(name, plans=plans, document=TREE_DOCUMENT)
+    if plans:
+        codegen.write_plans(module, codegen.fingerprint(TREE_DOCUMENT))
+        module = write_module(name, plans=plans, document=TREE_DOCUMENT)
+        assert module._plans is not None
+
+    tree = module.Tree(base_url=module.BASE_URL, client=mock_client)
+    mock_client.with_response(
+        mock_response.with_json({"id": 2, "class": "leaf", "parent": {"id": 1}})
+    )
+
+    node = tree.get_node(2)
+
+    assert isinstance(node, module.Node)
+    assert node == module.Node(id=2, class_="leaf", parent=module.Node(id=1))
+    assert node.class_ == "leaf"
+
+
+def test_model_with_reserved_properties(write_module):
+    document = {
+        "openapi": "3.0.0",
+        "info": {"title": "Models", "version": "1.0.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Model": {
+                    "type": "object",
+                    "properties": {
+                        "model_config": {"type": "string"},
+                        "model_id": {"type": "integer"},
+                        "json": {"type": "string"},
+                    },
+                }
+            }
+        },
+    }
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        module = write_module("models_client", document=document)
+
+    # Verify: the properties are renamed, and keep their names on the wire
+    data = {"model_config": "a", "model_id": 1, "json": "b"}
+    model = module.Model.model_validate(data)
+    assert (model.model_config_, model.model_id_, model.json_) == ("a", 1, "b")
+    assert model.model_dump() == data
+
+
+def test_generate_rejects_swagger_2():
+    with pytest.raises(ValueError, match="OpenAPI 3"):
+        codegen.generate({"swagger": "2.0", "paths": {}})
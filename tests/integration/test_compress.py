@@ -0,0 +1,70 @@
+# Standard library imports
+import gzip
+import json
+
+# Local imports
+from uplink import Body, Consumer, compress, get, post
+from uplink import json as json_
+
+# Constants
+BASE_URL = "https://example.com/"
+
+
+@compress(min_size=100)
+class Events(Consumer):
+    @json_
+    @post("/events")
+    def ingest(self, events: Body):
+        pass
+
+    @compress("deflate")
+    @post("/raw")
+    def upload(self, body: Body):
+        pass
+
+    @get("/events")
+    def list_events(self):
+        pass
+
+
+def test_compress(mock_response, mock_client):
+    mock_client.with_response(mock_response)
+    events = Events(base_url=BASE_URL, client=mock_client)
+    batch = [{"id": i, "kind": "event"} for i in range(100)]
+
+    # Run
+    events.ingest(batch)
+
+    # Verify: the JSON body is encoded, then compressed
+    request = mock_client.history[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(gzip.decompress(request.data)) == batch
+
+
+def test_compress_skips_small_bodies(mock_response, mock_client):
+    mock_client.with_response(mock_response)
+    events = Events(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    events.ingest([])
+
+    # Verify
+    request = mock_client.history[0]
+    assert request.data == b"[]"
+    assert "Content-Encoding" not in request.headers
+
+
+def test_method_overrides_consumer(mock_response, mock_client):
+    mock_client.with_response(mock_response)
+    events = Events(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    events.upload(b"event")
+    events.list_events()
+
+    # Verify: the method's encoding applies, even to small bodies
+    request = mock_client.history[0]
+    assert request.headers["Content-Encoding"] == "deflate"
+    assert request.data != b"event"
+    assert not mock_client.history[1].headers
@@ -0,0 +1,74 @@
+# Third-party imports
+import pytest
+
+# Local imports
+import uplink
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+class CustomException(Exception):
+    pass
+
+
+class GitHub(uplink.Consumer):
+    @uplink.deadline(5)
+    @uplink.retry(backoff=uplink.retry.backoff.fixed(10))
+    @uplink.get("users/{user}")
+    def get_user(self, user):
+        pass
+
+    @uplink.deadline(5)
+    @uplink.timeout(60)
+    @uplink.get("repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+    @uplink.timeout((3, 60))
+    @uplink.get("repos/{user}/{repo}/issues")
+    def get_issues(self, user, repo, deadline: uplink.Deadline = None):
+        pass
+
+
+# Tests
+
+
+def test_sleep_past_deadline_fails_immediately(mock_client):
+    # Setup
+    mock_client.with_side_effect([CustomException])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run: the retry's backoff would exceed the deadline
+    with pytest.raises(uplink.DeadlineExceeded):
+        github.get_user("prkumar")
+
+    # Verify
+    assert len(mock_client.history) == 1
+
+
+def test_timeout_capped_to_deadline(mock_client):
+    # Setup
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    github.get_repo("prkumar", "uplink")
+
+    # Verify
+    request = mock_client.history[0]
+    assert 0 < request.timeout <= 5
+
+
+def test_deadline_argument(mock_client):
+    # Setup
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    github.get_issues("prkumar", "uplink")
+    github.get_issues("prkumar", "uplink", deadline=10)
+
+    # Verify: each part of a (connect, read) timeout is capped
+    assert mock_client.history[0].timeout == (3, 60)
+    connect_timeout, read_timeout = mock_client.history[1].timeout
+    assert connect_timeout == 3
+    assert 0 < read_timeout <= 10
@@ -0,0 +1,189 @@
+# Standard library imports
+import asyncio
+import threading
+import time
+
+# Third-party imports
+import pytest
+
+# Local imports
+import uplink
+from uplink.clients import io
+from uplink.hedge import LatencyTracker
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+class GitHub(uplink.Consumer):
+    @uplink.hedge(delay=0.01)
+    @uplink.get("users/{user}")
+    def get_user(self, user):
+        pass
+
+    @uplink.hedge(delay=0.01, max_extra=0)
+    @uplink.get("repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+    @uplink.retry(max_attempts=2, backoff=uplink.retry.backoff.fixed(0))
+    @uplink.hedge(delay=0.01)
+    @uplink.get("repos/{user}/{repo}/issues")
+    def get_issues(self, user, repo):
+        pass
+
+
+# Tests
+
+
+def test_hedge_returns_first_response(mock_client, mocker):
+    # Setup: the original request blocks until the test is done
+    release = threading.Event()
+    slow_response, fast_response = mocker.Mock(), mocker.Mock()
+
+    def slow(*_):
+        release.wait(5)
+        return slow_response
+
+    mock_client.with_side_effect(_call_each([slow, lambda *_: fast_response]))
+    mock_release = mocker.spy(mock_client, "release")
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    start = time.monotonic()
+    response = github.get_user("prkumar")
+    elapsed = time.monotonic() - start
+    release.set()
+
+    # Verify: the duplicate wins, and the original's response is released
+    assert response is fast_response
+    assert elapsed < 1
+    assert len(mock_client.history) == 2
+    _wait_for(lambda: mock_release.call_count == 1)
+    mock_release.assert_called_once_with(slow_response)
+
+
+def test_hedge_shutdown(mock_client, mock_response):
+    # Setup
+    policy = uplink.hedge(delay=0.01)
+
+    class Service(uplink.Consumer):
+        @policy
+        @uplink.get("users/{user}")
+        def get_user(self, user):
+            pass
+
+    mock_client.with_response(mock_response)
+    service = Service(base_url=BASE_URL, client=mock_client)
+    service.get_user("prkumar")
+    executor = policy.executor
+
+    # Run
+    policy.shutdown()
+
+    # Verify: the pool is shut down, and replaced if used again
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+    assert service.get_user("prkumar") == mock_response
+    assert policy.executor is not executor
+    policy.shutdown()
+
+
+def test_hedge_without_extra_requests(mock_client, mock_response):
+    # Setup
+    mock_client.with_response(mock_response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = github.get_repo("prkumar", "uplink")
+
+    # Verify
+    assert response == mock_response
+    assert len(mock_client.history) == 1
+
+
+def test_hedge_with_retry(mock_client, mock_response):
+    # Setup
+    mock_client.with_side_effect([Exception, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = github.get_issues("prkumar", "uplink")
+
+    # Verify: the failed attempt is retried through the hedging client
+    assert response == mock_response
+    assert len(mock_client.history) == 2
+
+
+@pytest.mark.asyncio
+async def test_hedge_with_asyncio(mock_client, mocker):
+    slow_response, fast_response = mocker.Mock(), mocker.Mock()
+
+    async def slow():
+        await asyncio.sleep(5)
+        return slow_response
+
+    async def fast():
+        return fast_response
+
+    # Setup
+    mock_client.with_side_effect([slow(), fast()])
+    mock_client.with_io(io.AsyncioStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = await github.get_user("prkumar")
+
+    # Verify
+    assert response is fast_response
+    assert len(mock_client.history) == 2
+
+
+def test_hedge_delay_from_percentile():
+    # Setup
+    policy = uplink.hedge(delay=0.5, percentile=90, min_samples=10)
+
+    # Verify: the fixed delay is used until enough requests are tracked
+    for latency in range(1, 10):
+        policy.record_latency(latency / 100)
+    assert policy.delay == 0.5
+
+    # Verify: then the tracked percentile is used
+    policy.record_latency(0.1)
+    assert policy.delay == 0.09
+    for latency in range(11, 101):
+        policy.record_latency(latency / 100)
+    assert policy.delay == 0.9
+
+
+def test_latency_tracker():
+    tracker = LatencyTracker(50, window=3, refresh_every=2)
+    assert tracker.value is None
+
+    # Every sample refreshes the value until there are `refresh_every`.
+    tracker.record(3)
+    assert tracker.value == 3
+    tracker.record(1)
+    assert tracker.value == 1
+
+    # Then the value is refreshed periodically, over the recent samples.
+    tracker.record(2)
+    assert tracker.value == 1
+    tracker.record(8)
+    assert tracker.value == 2
+    assert len(tracker) == 3
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def _call_each(functions):
+    functions = iter(functions)
+
+    def side_effect(*args):
+        return next(functions)(*args)
+
+    return side_effect
@@ -0,0 +1,181 @@
+# Third-party imports
+import pytest
+
+# Local imports
+import uplink
+from uplink import instrumentation
+from uplink.ratelimit import RateLimitExceeded
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+class CustomException(Exception):
+    pass
+
+
+class GitHub(uplink.Consumer):
+    @uplink.retry(max_attempts=3, backoff=uplink.retry.backoff.fixed(0))
+    @uplink.get("users/{user}")
+    def get_user(self, user):
+        pass
+
+    @uplink.ratelimit(calls=1, period=10, raise_on_limit=True)
+    @uplink.get("repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+
+class RecordingInstrument(instrumentation.Instrument):
+    def __init__(self):
+        self.events = []
+
+    def on_prepare(self, event):
+        self.events.append(event)
+
+    def on_send(self, event):
+        self.events.append(event)
+
+    def on_response(self, event):
+        self.events.append(event)
+
+    def on_exception(self, event):
+        self.events.append(event)
+
+    def on_sleep(self, event):
+        self.events.append(event)
+
+    def on_finish(self, event):
+        self.events.append(event)
+
+    @property
+    def kinds(self):
+        return [event.kind for event in self.events]
+
+
+# Tests
+
+
+def test_instrument_observes_retries(mock_client, mock_response):
+    # Setup
+    instrument = RecordingInstrument()
+    mock_client.with_side_effect([CustomException, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client, hooks=[instrument])
+
+    # Run
+    response = github.get_user("prkumar")
+
+    # Verify
+    assert response == mock_response
+    assert instrument.kinds == [
+        "prepare",
+        "send",
+        "exception",
+        "sleep",
+        "prepare",
+        "send",
+        "response",
+        "finish",
+    ]
+    sleep, finish = instrument.events[3], instrument.events[-1]
+    assert sleep.reason == "retry"
+    assert sleep.duration == 0
+    assert finish.attempt == 2
+    assert finish.response == mock_response
+    assert not finish.failed
+    assert finish.duration >= 0
+    assert {event.method_name for event in instrument.events} == {"GitHub.get_user"}
+    assert len({id(event.scope) for event in instrument.events}) == 1
+
+
+def test_instrument_observes_failure(mock_client):
+    # Setup
+    instrument = RecordingInstrument()
+    mock_client.with_side_effect(CustomException)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+    github.session.inject(instrument)
+
+    # Run
+    with pytest.raises(CustomException):
+        github.get_user("prkumar")
+
+    # Verify
+    finish = instrument.events[-1]
+    assert finish.kind == "finish"
+    assert finish.failed
+    assert finish.exc_info[0] is CustomException
+    assert finish.attempt == 3
+
+
+def test_instrument_observes_template_errors(mock_client):
+    # Setup
+    instrument = RecordingInstrument()
+    github = GitHub(base_url=BASE_URL, client=mock_client, hooks=[instrument])
+    github.get_repo("prkumar", "uplink")
+    del instrument.events[:]
+
+    # Run
+    with pytest.raises(RateLimitExceeded):
+        github.get_repo("prkumar", "uplink")
+
+    # Verify: the call ends before the request is sent
+    assert instrument.kinds == ["prepare", "finish"]
+    assert instrument.events[-1].exc_info[0] is RateLimitExceeded
+
+
+def test_opentelemetry_instrument(mock_client, mock_response):
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    export = pytest.importorskip("opentelemetry.sdk.trace.export")
+    in_memory = pytest.importorskip(
+        "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+    )
+
+    # Setup
+    exporter = in_memory.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    instrument = instrumentation.OpenTelemetryInstrument(provider.get_tracer("test"))
+    mock_response.status_code = 200
+    mock_client.with_side_effect([CustomException, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client, hooks=[instrument])
+
+    # Run
+    github.get_user("prkumar")
+
+    # Verify
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GitHub.get_user"
+    assert span.attributes["http.request.method"] == "GET"
+    assert span.attributes["http.request.resend_count"] == 1
+    assert span.attributes["http.response.status_code"] == 200
+    assert [event.name for event in span.events] == ["exception", "sleep"]
+
+
+def test_prometheus_instrument(mock_client, mock_response):
+    prometheus_client = pytest.importorskip("prometheus_client")
+
+    # Setup
+    registry = prometheus_client.CollectorRegistry()
+    instrument = instrumentation.PrometheusInstrument(registry=registry)
+    mock_client.with_side_effect([CustomException, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client, hooks=[instrument])
+
+    # Run
+    github.get_user("prkumar")
+
+    # Verify
+    labels = {"method": "GitHub.get_user"}
+    assert registry.get_sample_value("uplink_attempts_total", labels) == 2
+    assert (
+        registry.get_sample_value(
+            "uplink_request_duration_seconds_count",
+            dict(labels, outcome="success"),
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "uplink_sleep_seconds_count", dict(labels, reason="retry")
+        )
+        == 1
+    )
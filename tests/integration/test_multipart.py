@@ -1,5 +1,8 @@
+# Standard library imports
+import io
+
 # Local imports
-from uplink import Consumer, PartMap, multipart, post
+from uplink import Consumer, Field, Part, PartMap, bodies, multipart, post
 
 # Constants
 BASE_URL = "https://example.com/"
@@ -22,3 +25,27 @@ def test_without_converter(mock_response, mock_client):
     # Assertion: should not convert if converter is None
     request = mock_client.history[0]
     assert request.files == {"file": file}
+
+
+def test_stream(mock_response, mock_client):
+    class Calendar(Consumer):
+        @multipart(stream=True)
+        @post("/attachments")
+        def upload_attachment(self, file: Part, note: Field):
+            pass
+
+    mock_client.with_response(mock_response)
+    calendar = Calendar(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    calendar.upload_attachment(io.BytesIO(b"contents"), "note")
+
+    # Assertion: should send the parts with a streaming encoder
+    request = mock_client.history[0]
+    encoder = request.data
+    assert isinstance(encoder, bodies.MultipartEncoder)
+    assert request.headers["Content-Type"] == encoder.content_type
+    assert request.headers["Content-Length"] == str(encoder.len)
+    body = encoder.read()
+    assert b'name="note"\r\n\r\nnote\r\n' in body
+    assert b'name="file"; filename="file"\r\n\r\ncontents\r\n' in body
@@ -0,0 +1,114 @@
+# Standard library imports
+import collections
+import time
+
+# Third-party imports
+import pytest
+
+# Local imports
+import uplink
+from uplink import profiling
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+User = collections.namedtuple("User", "id name")
+
+
+class CustomException(Exception):
+    pass
+
+
+@uplink.loads(User)
+def slow_user_reader(cls, response):
+    time.sleep(0.02)
+    return cls(**response.json())
+
+
+@uplink.response_handler
+def slow_handler(response):
+    time.sleep(0.02)
+    return response
+
+
+class GitHub(uplink.Consumer):
+    @uplink.returns(User)
+    @slow_handler
+    @uplink.retry(max_attempts=2, backoff=uplink.retry.backoff.fixed(0.01))
+    @uplink.get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @uplink.get("/users/{user}/repos")
+    def list_repos(self, user):
+        pass
+
+
+# Tests
+
+
+def test_profile_phases(mock_client, mock_response):
+    # Setup
+    profiles = []
+    profiler = profiling.Profiler(callback=profiles.append)
+    mock_response.with_json({"id": 123, "name": "prkumar"})
+    mock_client.with_side_effect([CustomException, mock_response])
+    github = GitHub(
+        base_url=BASE_URL,
+        client=mock_client,
+        converters=slow_user_reader,
+        hooks=[profiler],
+    )
+
+    # Run
+    user = github.get_user("prkumar")
+
+    # Verify
+    assert user == User(id=123, name="prkumar")
+    (profile,) = profiles
+    assert profile.method_name == "GitHub.get_user"
+    assert not profile.failed
+    assert profile.phases["retry_sleep"] == pytest.approx(0.01)
+    assert profile.phases["throttle"] == 0
+    assert profile.phases["convert_response"] >= 0.02
+    assert profile.phases["callbacks"] >= 0.02
+    assert profile.phases["callbacks"] < profile.phases["convert_response"] + 0.02
+    assert profile.total >= sum(profile.phases.values())
+
+
+def test_profiler_aggregates_by_method(mock_client):
+    # Setup
+    profiler = profiling.Profiler()
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+    github.session.inject(profiler)
+
+    # Run
+    github.list_repos("prkumar")
+    github.list_repos("prkumar")
+
+    # Verify
+    stats = profiler.stats["GitHub.list_repos"]
+    assert stats.count == 2
+    assert stats.mean() == stats.total / 2
+    assert stats.mean("send") >= 0
+    profiler.reset()
+    assert profiler.stats == {}
+
+
+def test_profiler_records_failures(mock_client):
+    # Setup
+    profiles = []
+    mock_client.with_side_effect(CustomException)
+    github = GitHub(
+        base_url=BASE_URL,
+        client=mock_client,
+        hooks=[profiling.Profiler(callback=profiles.append)],
+    )
+
+    # Run
+    with pytest.raises(CustomException):
+        github.list_repos("prkumar")
+
+    # Verify
+    (profile,) = profiles
+    assert profile.failed
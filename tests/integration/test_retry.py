@@ -1,9 +1,13 @@
+# Standard library imports
+import io as io_
+
 # Third-party imports
 import pytest
 import pytest_twisted
+import requests
 
 # Local imports.
-from uplink import Consumer, get, retry
+from uplink import Body, Consumer, error_handler, exceptions, get, json, post, retry
 from uplink.clients import io
 
 # Constants
@@ -41,6 +45,26 @@ class GitHub(Consumer):
     def get_issues(self, user, repo):
         pass
 
+    @retry(
+        when=retry.when.status(429),
+        backoff=retry.backoff.retry_after() | backoff_default,
+        max_attempts=2,
+    )
+    @get("repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+    @retry(max_attempts=2, backoff=retry.backoff.fixed(0))
+    @json
+    @post("repos/{user}/{repo}/issues")
+    def create_issue(self, user, repo, issue: Body):
+        pass
+
+    @retry(max_attempts=2, backoff=retry.backoff.fixed(0))
+    @post("repos/{user}/{repo}/releases/assets")
+    def upload_asset(self, user, repo, asset: Body):
+        pass
+
 
 # Tests
 
@@ -124,6 +148,67 @@ def test_retry_with_status_501(mock_client, mock_response):
     assert len(mock_client.history) == 2
 
 
+def test_retry_releases_discarded_response(mocker, mock_client):
+    # Setup
+    unavailable = mocker.Mock(spec=requests.Response, status_code=503)
+    ok = mocker.Mock(spec=requests.Response, status_code=200)
+    mock_client.with_side_effect([unavailable, ok])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = github.get_issues("prkumar", "uplink")
+
+    # Verify
+    assert response is ok
+    unavailable.close.assert_called_once_with()
+    ok.close.assert_not_called()
+
+
+def test_retry_with_retry_after_header(mock_client, mock_response):
+    # Setup
+    mock_response.status_code = 429
+    mock_response.headers = {"Retry-After": "0"}
+    mock_client.with_side_effect([mock_response, CustomException])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    with pytest.raises(CustomException):
+        github.get_repo("prkumar", "uplink")
+
+    # Verify
+    assert len(mock_client.history) == 2
+
+
+def test_retry_budget_shared_across_methods(mock_client, mock_response):
+    # Setup: the budget allows a single retry
+    budget = retry.budget.RetryBudget(
+        ratio=0, min_retries_per_second=0.1, window=10, clock=lambda: 0
+    )
+
+    @retry(max_attempts=3, backoff=retry.backoff.fixed(0), budget=budget)
+    class BudgetedGitHub(Consumer):
+        @get("/users/{user}")
+        def get_user(self, user):
+            pass
+
+        @get("repos/{user}/{repo}")
+        def get_repo(self, user, repo):
+            pass
+
+    mock_client.with_side_effect(
+        [CustomException, mock_response, CustomException, mock_response]
+    )
+    github = BudgetedGitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run: the first method consumes the only retry
+    github.get_user("prkumar")
+
+    # Verify: the second method fails without retrying
+    with pytest.raises(CustomException):
+        github.get_repo("prkumar", "uplink")
+    assert len(mock_client.history) == 3
+
+
 @pytest_twisted.inlineCallbacks
 def test_retry_with_twisted(mock_client, mock_response):
     from twisted.internet import defer
@@ -166,3 +251,76 @@ def test_retry_fail_with_twisted(mock_client, mock_response):
         yield github.get_user("prkumar")
 
     assert len(mock_client.history) == 2
+
+
+def test_retry_encodes_body_once(mock_client, mock_response):
+    # Setup
+    mock_client.with_side_effect([CustomException, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    github.create_issue("prkumar", "uplink", {"title": "Bug"})
+
+    # Verify
+    first, second = mock_client.history
+    assert first.data == b'{"title": "Bug"}'
+    assert second.data is first.data
+    assert second.json is None
+    assert second.headers["Content-Type"] == "application/json"
+
+
+def _read_and_fail_once(mock_response, sent):
+    def send(method, url, extras):
+        sent.append(b"".join(iter(lambda: extras["data"].read(2), b"")))
+        if len(sent) == 1:
+            raise CustomException
+        return mock_response
+
+    return send
+
+
+def test_retry_rewinds_file_body(mock_client, mock_response):
+    # Setup
+    sent = []
+    mock_client.with_side_effect(_read_and_fail_once(mock_response, sent))
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+    asset = io_.BytesIO(b"#!payload")
+    asset.seek(2)
+
+    # Run
+    github.upload_asset("prkumar", "uplink", asset)
+
+    # Verify
+    assert sent == [b"payload", b"payload"]
+
+
+def test_retry_rejects_generator_body(mock_client):
+    # Setup
+    mock_client.with_side_effect(CustomException)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run & Verify
+    with pytest.raises(exceptions.UnreplayableBody):
+        github.upload_asset("prkumar", "uplink", (chunk for chunk in [b"a", b"b"]))
+    assert len(mock_client.history) == 1
+
+
+def test_retry_with_invalid_json_body(mock_client):
+    # Setup
+    @error_handler
+    def handle_error(exc_type, exc_val, exc_tb):
+        raise CustomException from exc_val
+
+    @handle_error
+    class Service(GitHub):
+        pass
+
+    github = Service(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    with pytest.raises(CustomException) as info:
+        github.create_issue("prkumar", "uplink", {"weight": float("nan")})
+
+    # Verify: the request fails through the error handler, without being sent
+    assert isinstance(info.value.__cause__, exceptions.InvalidRequestBody)
+    assert mock_client.history == []
@@ -1,5 +1,10 @@
 # Standard library imports
 import collections
+import hashlib
+import io
+
+# Third-party imports
+import requests
 
 # Local imports.
 import uplink
@@ -69,6 +74,11 @@ class GitHub(uplink.Consumer):
     def list_users(self):
         pass
 
+    @uplink.returns.to_file(checksum="sha256")
+    @uplink.get("/repos/{user}/{repo}/tarball")
+    def download_tarball(self, user, repo, destination: uplink.Destination):
+        pass
+
 
 @uplink.returns.json
 class GitHubV2(uplink.Consumer):
@@ -204,3 +214,21 @@ def test_post_json(mock_client):
     github.create_repo("prkumar", Repo(owner="prkumar", name="uplink"))
     request = mock_client.history[0]
     assert request.json == {"owner": "prkumar", "name": "uplink"}
+
+
+def test_returns_to_file(mock_client, tmp_path):
+    # Setup
+    response = requests.Response()
+    response.raw = io.BytesIO(b"tarball")
+    mock_client.with_response(response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+    path = tmp_path / "uplink.tar.gz"
+
+    # Run
+    download = github.download_tarball("prkumar", "uplink", path)
+
+    # Verify
+    assert mock_client.history[0].stream is True
+    assert path.read_bytes() == b"tarball"
+    assert download.size == 7
+    assert download.digest == hashlib.sha256(b"tarball").hexdigest()
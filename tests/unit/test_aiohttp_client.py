@@ -1,6 +1,8 @@
 # Standard library imports
 import asyncio
 import contextlib
+import io as io_
+import mmap
 
 # Third-party imports
 import aiohttp
@@ -61,6 +63,39 @@ class TestAiohttp:
         client = register.get_client(aiohttp_session_mock)
         assert isinstance(client, aiohttp_.AiohttpClient)
 
+    def test_release(self, mocker, aiohttp_session_mock):
+        response = mocker.Mock()
+        client = aiohttp_.AiohttpClient(aiohttp_session_mock)
+
+        client.release(response)
+
+        response.release.assert_called_once_with()
+        response.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_streams_sync_iterable(self):
+        extras = aiohttp_._adapt_body({"data": iter([b"a", b"bc"])})
+
+        assert [chunk async for chunk in extras["data"]] == [b"a", b"bc"]
+
+    @pytest.mark.asyncio
+    async def test_send_streams_memory_map(self, mocker):
+        mocker.patch.object(aiohttp_, "_CHUNK_SIZE", 4)
+        buffer = mmap.mmap(-1, 10)
+        buffer.write(b"0123456789")
+
+        extras = aiohttp_._adapt_body({"data": buffer, "headers": {"X": "y"}})
+
+        chunks = [bytes(chunk) async for chunk in extras["data"]]
+        assert chunks == [b"0123", b"4567", b"89"]
+        assert extras["headers"] == {"X": "y", "Content-Length": "10"}
+        buffer.close()
+
+    def test_send_leaves_supported_bodies(self):
+        for data in (b"bytes", memoryview(b"view"), io_.BytesIO(), {"key": "value"}):
+            extras = {"data": data}
+            assert aiohttp_._adapt_body(extras) is extras
+
     @pytest.mark.asyncio
     async def test_request_send(self, mocker, aiohttp_session_mock):
         # Setup
@@ -78,6 +113,87 @@ class TestAiohttp:
         # Verify
         assert response == expected_response
 
+    @staticmethod
+    def _response(mocker, chunks, content_length=None):
+        async def iter_chunked(size):
+            for chunk in chunks:
+                yield chunk
+
+        response = mocker.Mock(method="GET", content_length=content_length)
+        response.content.iter_chunked = iter_chunked
+        return response
+
+    @pytest.mark.asyncio
+    async def test_request_send_with_max_response_size(
+        self, mocker, aiohttp_session_mock
+    ):
+        # Setup
+        expected_response = self._response(mocker, [b"bo", b"dy"])
+        request_kwargs = {}
+
+        async def request(*args, **kwargs):
+            request_kwargs.update(kwargs)
+            return expected_response
+
+        aiohttp_session_mock.request = request
+        client = aiohttp_.AiohttpClient(aiohttp_session_mock)
+
+        # Run
+        response = await client.send_limited(("GET", "url", {}), 4)
+
+        # Verify
+        assert response._body == b"body"
+        assert request_kwargs == {}
+
+    @pytest.mark.asyncio
+    async def test_read_response_after_max_response_size(self):
+        from aiohttp import test_utils, web
+
+        # Setup: a real response, so the body is read through aiohttp
+        async def handler(request):
+            return web.json_response({"id": 1})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        async with (
+            test_utils.TestServer(app) as server,
+            aiohttp.ClientSession() as session,
+        ):
+            client = aiohttp_.AiohttpClient(session)
+
+            # Run
+            response = await client.send_limited(
+                ("GET", str(server.make_url("/")), {}), 100
+            )
+
+            # Verify
+            assert await response.read() == b'{"id": 1}'
+            assert await response.text() == '{"id": 1}'
+            assert await response.json() == {"id": 1}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("chunks", "content_length"), [([b"bo", b"dy!"], None), ([], 100)]
+    )
+    async def test_request_send_with_response_too_large(
+        self, mocker, aiohttp_session_mock, chunks, content_length
+    ):
+        # Setup
+        expected_response = self._response(mocker, chunks, content_length)
+
+        async def request(*args, **kwargs):
+            return expected_response
+
+        aiohttp_session_mock.request = request
+        client = aiohttp_.AiohttpClient(aiohttp_session_mock)
+
+        # Run
+        with pytest.raises(client.exceptions.ResponseTooLarge):
+            await client.send_limited(("GET", "url", {}), 4)
+
+        # Verify
+        expected_response.close.assert_called_once_with()
+
     @pytest.mark.asyncio
     async def test_callback(self, mocker, aiohttp_session_mock):
         # Setup
@@ -416,6 +416,24 @@ class TestTimeout(ArgumentTestCase, FuncDecoratorTestCase):
         assert request_builder.info["timeout"] == 10
 
 
+class TestDeadline(ArgumentTestCase, FuncDecoratorTestCase):
+    type_cls = arguments.Deadline
+    expected_converter_key = keys.Identity()
+
+    def test_modify_request(self, request_builder):
+        arguments.Deadline().modify_request(request_builder, 10)
+        request_builder.add_deadline.assert_called_with(10)
+
+
+class TestDestination(ArgumentTestCase, FuncDecoratorTestCase):
+    type_cls = arguments.Destination
+    expected_converter_key = keys.Identity()
+
+    def test_modify_request(self, request_builder):
+        arguments.Destination().modify_request(request_builder, "report.csv")
+        assert request_builder.destination == "report.csv"
+
+
 class TestContext(ArgumentTestCase, FuncDecoratorTestCase):
     type_cls = arguments.Context
     expected_converter_key = keys.Identity()
@@ -0,0 +1,223 @@
+# Standard library imports
+import gzip
+import io
+import mmap
+import os
+import zlib
+
+# Third-party imports
+import pytest
+from requests import models
+
+# Local imports
+from uplink import bodies, exceptions
+
+
+def test_encode_json():
+    info = {"json": {"id": 1}, "headers": {"content-type": "application/vnd+json"}}
+
+    assert bodies.encode(info)
+    assert info == {
+        "data": b'{"id": 1}',
+        "headers": {"content-type": "application/vnd+json"},
+    }
+
+
+def test_encode_form():
+    info = {"data": {"name": "uplink", "tags": ["a", "b"]}}
+
+    assert bodies.encode(info)
+    assert info["data"] == b"name=uplink&tags=a&tags=b"
+    assert info["headers"] == {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+def test_encode_files():
+    info = {"files": {"file": io.BytesIO(b"contents")}, "data": {"name": "x"}}
+
+    assert bodies.encode(info)
+    assert "files" not in info
+    assert b"contents" in info["data"]
+    assert info["headers"]["Content-Type"].startswith("multipart/form-data")
+
+
+@pytest.mark.parametrize(
+    "info", [{"json": {"value": float("nan")}}, {"data": [("name", "value", "extra")]}]
+)
+def test_encode_invalid_body(info):
+    with pytest.raises(exceptions.InvalidRequestBody):
+        bodies.encode(info)
+
+
+def test_encode_leaves_raw_and_streamed_bodies():
+    generator = iter([b"chunk"])
+    for data in ("text", b"bytes", io.BytesIO(b"file"), generator):
+        info = {"data": data}
+        assert not bodies.encode(info)
+        assert info == {"data": data}
+
+
+def test_prepare_returns_replay_for_streams():
+    assert bodies.prepare({"json": {}}) is None
+    assert bodies.prepare({"data": b"bytes"}) is None
+    assert bodies.prepare({"data": io.BytesIO()}) is not None
+    assert bodies.is_stream(iter(()))
+    assert not bodies.is_stream({"key": "value"})
+
+
+def test_buffers_are_not_streams():
+    buffer = mmap.mmap(-1, 4)
+    assert not bodies.is_stream(buffer)
+    assert not bodies.is_stream(memoryview(b"view"))
+    assert bodies.prepare({"data": buffer}) is None
+    buffer.close()
+
+
+def test_async_iterables_are_streams():
+    async def body():
+        yield b"chunk"
+
+    stream = body()
+    assert bodies.is_async_stream(stream)
+    assert bodies.is_stream(stream)
+    assert not bodies.encode({"data": stream})
+
+
+def test_multipart_encoder_matches_requests():
+    data = {"name": "x", "tags": ["a", "b"]}
+    files = {
+        "file": ("file.txt", io.BytesIO(b"contents"), "text/plain"),
+        "blob": b"blob",
+        "extra": ("extra.bin", b"extra", None, {"X-Part": "1"}),
+    }
+    expected, content_type = models.RequestEncodingMixin._encode_files(files, data)
+    boundary = content_type.partition("boundary=")[2]
+    files["file"][1].seek(0)
+
+    encoder = bodies.MultipartEncoder(data, files, boundary=boundary)
+
+    assert encoder.content_type == content_type
+    assert encoder.len == len(expected)
+    assert encoder.read() == expected
+
+
+def test_multipart_encoder_streams_parts(tmp_path):
+    path = tmp_path / "upload.bin"
+    path.write_bytes(b"f" * 100)
+    buffer = mmap.mmap(-1, 50)
+    with open(path, "rb") as fp:
+        encoder = bodies.MultipartEncoder(files={"file": fp, "map": buffer})
+        chunks = list(iter(lambda: encoder.read(40), b""))
+
+        # Buffers are sliced without copying, and files are read lazily.
+        assert any(isinstance(chunk, memoryview) for chunk in chunks)
+        assert b"f" * 40 in chunks
+        assert encoder.len == sum(map(len, chunks))
+        assert encoder.tell() == encoder.len
+
+        # Rewinding sends the same body again.
+        body = b"".join(chunks)
+        assert encoder.seek(0) == 0
+        assert encoder.read() == body
+    del chunks
+    buffer.close()
+
+
+def test_multipart_encoder_with_unknown_length():
+    read_end, write_end = os.pipe()
+    with os.fdopen(read_end, "rb") as fp:
+        os.write(write_end, b"piped")
+        os.close(write_end)
+        encoder = bodies.MultipartEncoder(files={"file": fp})
+
+        assert encoder.len is None
+        assert b"piped" in encoder.read()
+        with pytest.raises(io.UnsupportedOperation):
+            encoder.tell()
+        with pytest.raises(io.UnsupportedOperation):
+            encoder.seek(0, io.SEEK_END)
+
+
+def test_multipart_encoder_rejects_unknown_parts():
+    with pytest.raises(TypeError, match="Can't stream"):
+        bodies.MultipartEncoder(files={"file": object()})
+
+
+@pytest.mark.asyncio
+async def test_multipart_encoder_async_iteration():
+    files = {"file": io.BytesIO(b"contents"), "blob": b"blob"}
+    encoder = bodies.MultipartEncoder(files=files)
+
+    body = b"".join([bytes(chunk) async for chunk in encoder])
+
+    assert len(body) == encoder.len
+    encoder.seek(0)
+    assert encoder.read() == body
+
+
+def test_compress_buffers():
+    info = {"json": {"id": 1}, "headers": {"Content-Length": "9"}}
+
+    assert bodies.compress(info, "gzip")
+    assert gzip.decompress(info["data"]) == b'{"id": 1}'
+    assert info["headers"] == {
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+    }
+
+    info = {"data": memoryview(b"x" * 100)}
+    assert bodies.compress(info, "deflate")
+    assert zlib.decompress(info["data"]) == b"x" * 100
+
+
+def test_compress_skips_bodies():
+    assert not bodies.compress({"data": b"small"}, "gzip", min_size=10)
+    assert not bodies.compress({"data": b""}, "gzip")
+    assert not bodies.compress({}, "gzip")
+    info = {"data": b"encoded", "headers": {"content-encoding": "br"}}
+    assert not bodies.compress(info, "gzip")
+    assert info["data"] == b"encoded"
+
+
+def test_compress_streams_files():
+    fp = io.BytesIO(b"contents" * 1000)
+    info = {"data": fp}
+
+    assert bodies.compress(info, "gzip", min_size=100)
+    reader = info["data"]
+    body = b"".join(iter(lambda: reader.read(512), b""))
+    assert gzip.decompress(body) == b"contents" * 1000
+
+    # Rewinding compresses the body again.
+    assert reader.tell() == len(body)
+    assert reader.seek(0) == 0
+    assert reader.read() == body
+
+
+def test_compress_streams_iterables():
+    info = {"data": (chunk for chunk in (b"a", "b", b"c"))}
+
+    assert bodies.compress(info, "deflate")
+    assert zlib.decompress(b"".join(info["data"])) == b"abc"
+
+
+@pytest.mark.asyncio
+async def test_compress_streams_async_iterables():
+    async def body():
+        yield b"async"
+
+    info = {"data": body()}
+    assert bodies.compress(info, "gzip")
+    body = b"".join([chunk async for chunk in info["data"]])
+    assert gzip.decompress(body) == b"async"
+
+    encoder = bodies.MultipartEncoder(files={"file": io.BytesIO(b"contents")})
+    info = {"data": encoder}
+    assert bodies.compress(info, "gzip")
+    body = b"".join([chunk async for chunk in info["data"]])
+    encoder.seek(0)
+    assert gzip.decompress(body) == encoder.read()
+
+
+def test_get_compressor_rejects_unknown_encodings():
+    with pytest.raises(ValueError, match="Unsupported content encoding"):
+        bodies.get_compressor("br")
@@ -32,6 +32,7 @@ class TestRequestPreparer:
         uplink_builder = mocker.Mock(spec=builder.Builder)
         uplink_builder.converters = ()
         uplink_builder.hooks = ()
+        request_builder.client = uplink_builder.client
         request_preparer = builder.RequestPreparer(uplink_builder)
         execution_builder = mocker.Mock(spec=io.RequestExecutionBuilder)
         request_preparer.prepare_request(request_builder, execution_builder)
@@ -49,6 +50,7 @@ class TestRequestPreparer:
         request_builder.request_template = "request_template"
         uplink_builder.base_url = "https://example.com"
         request_builder.transaction_hooks = [transaction_hook_mock]
+        request_builder.client = uplink_builder.client
         request_preparer = builder.RequestPreparer(uplink_builder)
         execution_builder = mocker.Mock(spec=io.RequestExecutionBuilder)
         request_preparer.prepare_request(request_builder, execution_builder)
@@ -1,5 +1,7 @@
 # Standard library imports
+import concurrent.futures
 import contextlib
+import io as io_
 
 # Third-party imports
 import pytest
@@ -35,6 +37,49 @@ def test_get_default_client_with_non_callable():
     assert default_client == "client"
 
 
+def test_set_default_client_shared():
+    old_default = register._registrar[0]
+    try:
+        register.set_default_client(requests_.RequestsClient, shared=True)
+        client = register.get_default_client()
+        assert register.get_default_client() is client
+        assert register.get_client() is client
+
+        register.set_default_client(requests_.RequestsClient, shared=True, verify=False)
+        other = register.get_default_client()
+        assert other is not client
+        assert other is register.get_shared_client(
+            requests_.RequestsClient, verify=False
+        )
+    finally:
+        register.set_default_client(old_default)
+
+
+def test_set_default_client_with_kwargs():
+    old_default = register._registrar[0]
+    try:
+        register.set_default_client(requests_.RequestsClient, verify=False)
+        client = register.get_default_client()
+        assert isinstance(client, requests_.RequestsClient)
+        assert register.get_default_client() is not client
+    finally:
+        register.set_default_client(old_default)
+
+
+def test_get_shared_client_across_threads():
+    class HttpClientAdapterMock(interfaces.HttpClientAdapter):
+        pass
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        clients = list(
+            executor.map(
+                lambda _: register.get_shared_client(HttpClientAdapterMock), range(8)
+            )
+        )
+
+    assert all(client is clients[0] for client in clients)
+
+
 def test_get_client_with_http_client_adapter_subclass():
     class HttpClientAdapterMock(interfaces.HttpClientAdapter):
         pass
@@ -47,6 +92,44 @@ def test_get_client_with_unrecognized_key():
     assert register.get_client("no client for this key") is None
 
 
+def test_release_closes_response(mocker):
+    client = interfaces.HttpClientAdapter()
+    response = mocker.Mock()
+
+    client.release(response)
+
+    response.close.assert_called_once_with()
+
+
+def test_release_ignores_connection_errors(mocker):
+    client = interfaces.HttpClientAdapter()
+    response = mocker.Mock()
+    response.close.side_effect = ConnectionResetError
+
+    client.release(response)
+
+    response.close.assert_called_once_with()
+
+
+def test_release_propagates_other_errors(mocker):
+    client = interfaces.HttpClientAdapter()
+    response = mocker.Mock()
+    response.close.side_effect = RuntimeError
+
+    with pytest.raises(RuntimeError):
+        client.release(response)
+
+
+def _requests_response(body, headers=None, method="GET"):
+    import requests
+
+    response = requests.Response()
+    response.raw = io_.BytesIO(body)
+    response.headers.update(headers or {})
+    response.request = requests.Request(method, "https://example.com").prepare()
+    return response
+
+
 class TestRequests:
     def test_get_client(self, mocker):
         import requests
@@ -80,6 +163,66 @@ class TestRequests:
         client.apply_callback(callback, response)
         callback.assert_called_with(session_mock.request.return_value)
 
+    def test_client_send_rejects_async_iterable(self, mocker):
+        import requests
+
+        async def body():
+            yield b"chunk"
+
+        session_mock = mocker.Mock(spec=requests.Session)
+        client = requests_.RequestsClient(session_mock)
+
+        with pytest.raises(TypeError, match="async iterable"):
+            client.send(("POST", "url", {"data": body()}))
+        session_mock.request.assert_not_called()
+
+    def test_client_send_with_max_response_size(self, mocker):
+        import requests
+
+        session_mock = mocker.Mock(spec=requests.Session)
+        session_mock.request.return_value = _requests_response(b"body")
+        client = requests_.RequestsClient(session_mock)
+        extras = {}
+
+        # Run
+        response = client.send_limited(("GET", "url", extras), 4)
+
+        # Verify: the body is streamed, and read up to the limit
+        session_mock.request.assert_called_with(method="GET", url="url", stream=True)
+        assert response.content == b"body"
+        assert extras == {}
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            _requests_response(b"too large"),
+            _requests_response(b"", headers={"Content-Length": "100"}),
+        ],
+    )
+    def test_client_send_with_response_too_large(self, mocker, response):
+        import requests
+
+        session_mock = mocker.Mock(spec=requests.Session)
+        session_mock.request.return_value = response
+        client = requests_.RequestsClient(session_mock)
+
+        with pytest.raises(client.exceptions.ResponseTooLarge) as info:
+            client.send_limited(("GET", "url", {}), 4)
+        assert info.value.max_size == 4
+        assert info.value.response is response
+
+    def test_client_send_head_with_max_response_size(self, mocker):
+        import requests
+
+        response = _requests_response(
+            b"", headers={"Content-Length": "100"}, method="HEAD"
+        )
+        session_mock = mocker.Mock(spec=requests.Session)
+        session_mock.request.return_value = response
+        client = requests_.RequestsClient(session_mock)
+
+        assert client.send_limited(("HEAD", "url", {}), 4) is response
+
     def test_dont_close_provided_session(self, mocker):
         # Setup
         import gc
@@ -163,6 +306,12 @@ class TestTwisted:
         request.send((1, 2, 3))
         deferToThread.assert_called_with(http_client_mock.send, (1, 2, 3))
 
+    def test_client_send_limited(self, mocker, http_client_mock):
+        deferToThread = mocker.patch.object(twisted_.threads, "deferToThread")
+        request = twisted_.TwistedClient(http_client_mock)
+        request.send_limited((1, 2, 3), 4)
+        deferToThread.assert_called_with(http_client_mock.send_limited, (1, 2, 3), 4)
+
     def test_client_callback(self, mocker, http_client_mock):
         # Setup
         callback = mocker.stub()
@@ -5,7 +5,7 @@ import collections
 import pytest
 
 # Local imports
-from uplink import decorators, interfaces
+from uplink import bodies, decorators, interfaces
 
 
 @pytest.fixture
@@ -194,6 +194,22 @@ def test_multipart(request_builder):
     assert "headers" not in request_builder.info
 
 
+def test_multipart_stream(request_builder):
+    multipart = decorators.multipart(stream=True)
+    multipart.modify_request(request_builder)
+    request_builder.add_transaction_hook.assert_called_with(multipart._hook)
+
+    request_builder.info["files"] = {"file": b"contents"}
+    multipart.set_streaming_body(request_builder)
+    encoder = request_builder.info["data"]
+    assert isinstance(encoder, bodies.MultipartEncoder)
+    assert "files" not in request_builder.info
+    assert request_builder.info["headers"] == {
+        "Content-Type": encoder.content_type,
+        "Content-Length": str(encoder.len),
+    }
+
+
 def test_json(request_builder):
     json = decorators.json()
 
@@ -247,6 +263,37 @@ def test_timeout(request_builder):
     assert request_builder.info["timeout"] == 60
 
 
+def test_compress(request_builder):
+    compress = decorators.compress("deflate", min_size=1024)
+    compress.modify_request(request_builder)
+    request_builder.set_compression.assert_called_with("deflate", 1024)
+
+
+def test_compress_with_unsupported_encoding():
+    with pytest.raises(ValueError, match="'br'"):
+        decorators.compress("br")
+
+
+def test_max_response_size(request_builder):
+    client = request_builder.client
+    decorators.max_response_size(1024).modify_request(request_builder)
+    request_builder.client.send("request")
+    client.send_limited.assert_called_with("request", 1024)
+    assert "max_response_size" not in request_builder.info
+
+    # Verify: the smallest limit applies
+    decorators.max_response_size(2048).modify_request(request_builder)
+    decorators.max_response_size(512).modify_request(request_builder)
+    request_builder.client.send("request")
+    client.send_limited.assert_called_with("request", 512)
+
+
+def test_deadline(request_builder):
+    deadline = decorators.deadline(60)
+    deadline.modify_request(request_builder)
+    request_builder.add_deadline.assert_called_with(60)
+
+
 def test_args(request_definition_builder):
     args = decorators.args(str, str, name=str)
     args.modify_request_definition(request_definition_builder)
@@ -1,3 +1,7 @@
+# Standard library imports
+import zlib
+
+# Third-party imports
 import pytest
 
 # Local imports
@@ -75,3 +79,31 @@ class TestRequestBuilder:
         # Run
         with pytest.raises(TypeError):
             builder.relative_url = 1
+
+    def test_add_deadline(self):
+        # Setup
+        builder = helpers.RequestBuilder(None, {}, "base_url")
+
+        # Run
+        builder.add_deadline(10)
+        builder.add_deadline(20)
+
+        # Verify: the shortest deadline applies
+        assert builder.deadline == 10
+
+    def test_compress_body(self):
+        # Setup
+        builder = helpers.RequestBuilder(None, {}, "base_url")
+        builder.info["data"] = b"contents"
+        builder.compress_body()
+        assert builder.info["data"] == b"contents"
+
+        # Run
+        builder.set_compression("gzip", min_size=100)
+        builder.set_compression("deflate")
+        builder.compress_body()
+
+        # Verify: the last setting applies
+        assert builder.compression == ("deflate", 0)
+        assert zlib.decompress(builder.info["data"]) == b"contents"
+        assert builder.info["headers"]["Content-Encoding"] == "deflate"
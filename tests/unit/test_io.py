@@ -1,8 +1,20 @@
+# Standard library imports
+import sys
+
 # Third-party imports
 import pytest
 
 # Local imports
-from uplink.clients.io import interfaces, state, transitions
+from uplink.clients.io import (
+    AsyncioStrategy,
+    BlockingStrategy,
+    CompositeRequestTemplate,
+    RequestExecutionBuilder,
+    interfaces,
+    state,
+    transitions,
+)
+from uplink.clients.io import execution as execution_module
 
 
 @pytest.fixture
@@ -162,3 +174,124 @@ def test_prepare_transition(request_state_mock):
     request = object()
     transitions.prepare(request)(request_state_mock)
     request_state_mock.prepare.assert_called_with(request)
+
+
+def test_transition_equality():
+    assert transitions.sleep(10) == transitions.sleep(10)
+    assert transitions.sleep(10) != transitions.sleep(5)
+    assert transitions.send(10) != transitions.sleep(10)
+
+
+def test_per_request_objects_have_no_instance_dict():
+    objects = [
+        state.BeforeRequest(None),
+        state.Finish(None, None),
+        state.SendRequest.SendCallback(None, None),
+        transitions.fail(Exception, Exception(), None),
+    ]
+    assert not any(hasattr(obj, "__dict__") for obj in objects)
+
+
+def _build_execution(client, template, **kwargs):
+    builder = RequestExecutionBuilder()
+    builder.with_client(client).with_io(BlockingStrategy()).with_template(template)
+    if "deadline" in kwargs:
+        builder.with_deadline(kwargs["deadline"])
+    if "errback" in kwargs:
+        builder.with_errbacks(kwargs["errback"])
+    return builder.build()
+
+
+def test_execution_without_templates_skips_state_machine(mocker):
+    client = mocker.Mock()
+    client.apply_callback.side_effect = lambda callback, response: callback(response)
+    builder = RequestExecutionBuilder()
+    builder.with_client(client).with_io(BlockingStrategy())
+    builder.with_template(CompositeRequestTemplate(()))
+    builder.with_callbacks(lambda response: (response, "handled"))
+    execution = builder.build()
+
+    assert isinstance(execution, execution_module.DirectRequestExecution)
+    assert execution.start("request") == (client.send.return_value, "handled")
+    client.send.assert_called_once_with("request")
+
+
+def test_direct_execution_failure_reaches_errbacks(mocker):
+    client = mocker.Mock()
+    client.send.side_effect = error = OSError()
+    errback = mocker.Mock()
+
+    execution = _build_execution(client, CompositeRequestTemplate(()), errback=errback)
+
+    assert execution.start("request") is errback.return_value
+    errback.assert_called_once_with(OSError, error, mocker.ANY)
+
+
+def test_execution_with_templates_or_deadline_uses_state_machine(mocker):
+    client = mocker.Mock()
+    template = CompositeRequestTemplate([mocker.Mock(spec=interfaces.RequestTemplate)])
+
+    assert isinstance(
+        _build_execution(client, template), execution_module.DefaultRequestExecution
+    )
+    assert isinstance(
+        _build_execution(client, CompositeRequestTemplate(()), deadline=1),
+        execution_module.DefaultRequestExecution,
+    )
+
+
+class _RetryTemplate(interfaces.RequestTemplate):
+    def __init__(self, attempts):
+        self._attempts = attempts
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        self._attempts -= 1
+        if self._attempts > 0:
+            return transitions.sleep(0)
+        return None
+
+
+def _stack_depth():
+    frame, depth = sys._getframe(1), 0
+    while frame is not None:
+        frame, depth = frame.f_back, depth + 1
+    return depth
+
+
+def test_blocking_retries_keep_constant_stack_depth(mocker):
+    depths = []
+
+    def send(request):
+        depths.append(_stack_depth())
+        raise OSError("unavailable")
+
+    client = mocker.Mock(send=send)
+    execution = _build_execution(client, CompositeRequestTemplate([_RetryTemplate(50)]))
+
+    with pytest.raises(OSError, match="unavailable"):
+        execution.start("request")
+    assert len(depths) == 50
+    assert len(set(depths)) == 1
+
+
+@pytest.mark.asyncio
+async def test_asyncio_retries_keep_constant_stack_depth(mocker):
+    depths = []
+
+    async def send(request):
+        depths.append(_stack_depth())
+        if len(depths) < 50:
+            raise OSError
+        return "response"
+
+    client = mocker.Mock(send=send)
+    execution = (
+        RequestExecutionBuilder()
+        .with_client(client)
+        .with_io(AsyncioStrategy())
+        .with_template(CompositeRequestTemplate([_RetryTemplate(50)]))
+        .build()
+    )
+
+    assert await execution.start("request") == "response"
+    assert len(set(depths)) == 1
@@ -0,0 +1,49 @@
+# Standard library imports
+import sys
+
+# Local imports
+import uplink
+from uplink import __main__ as cli
+
+
+class GitHub(uplink.Consumer):
+    @uplink.get("users/{username}")
+    def get_user(self, username):
+        """Get a single user."""
+
+    @uplink.get("users/{username}/repos")
+    def list_repos(self, username, sort: uplink.Query):
+        """List a user's public repositories."""
+
+    class Nested(uplink.Consumer):
+        @uplink.get("users")
+        def list_users(self):
+            """List all users."""
+
+
+def test_load_object():
+    assert cli._load_object("tests.unit.test_main:GitHub") is GitHub
+    assert cli._load_object("tests.unit.test_main:GitHub.Nested") is GitHub.Nested
+    assert cli._load_object("tests.unit.test_main") is sys.modules[__name__]
+
+
+def test_main_reports_definition_costs(capsys):
+    cli.main(["tests.unit.test_main:GitHub", "tests.unit.test_main:GitHub.Nested"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("tests.unit.test_main:GitHub: 2 methods, ")
+    assert sorted(line.split()[0] for line in lines[1:3]) == [
+        "get_user",
+        "list_repos",
+    ]
+    assert lines[3].startswith("tests.unit.test_main:GitHub.Nested: 1 methods, ")
+    assert lines[4].split()[0] == "list_users"
+    assert len(lines) == 5
+
+
+def test_main_limits_methods_listed(capsys):
+    cli.main(["tests.unit.test_main:GitHub", "--top", "1"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert lines[1].split()[0] in ("get_user", "list_repos")
@@ -0,0 +1,76 @@
+# Local imports
+from uplink import profiling
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+class TestProfile:
+    def test_measure_nested_phases_exclusively(self):
+        clock = FakeClock()
+        profile = profiling.Profile("GitHub.get_user", clock=clock)
+
+        with profile.measure("bind_arguments"):
+            clock.time += 1
+            with profile.measure("convert_request"):
+                clock.time += 2
+            clock.time += 3
+
+        assert profile.phases["bind_arguments"] == 4
+        assert profile.phases["convert_request"] == 2
+
+    def test_timed_converter_phase(self, mocker):
+        clock = FakeClock()
+        profile = profiling.Profile("GitHub.get_user", clock=clock)
+
+        def convert(value):
+            clock.time += 1
+            return value
+
+        converter = profile.timed_converter(convert)
+        assert converter(1) == 1
+        profile.on_response(mocker.Mock(duration=5))
+        assert converter(2) == 2
+
+        assert profile.phases["convert_request"] == 1
+        assert profile.phases["convert_response"] == 1
+        assert profile.phases["send"] == 5
+
+    def test_on_finish_reports_to_profilers(self, mocker):
+        clock = FakeClock()
+        profiler = profiling.Profiler()
+        profile = profiling.Profile("GitHub.get_user", (profiler,), clock=clock)
+        profile.on_exception(mocker.Mock(duration=1))
+        clock.time += 3
+        profile.on_finish(mocker.Mock(failed=True))
+
+        assert profile.total == 3
+        assert profile.phases["callbacks"] == 3
+        stats = profiler.stats["GitHub.get_user"]
+        assert stats.count == 1
+        assert stats.mean("send") == 1
+
+
+def test_definition_costs(mocker):
+    clock = FakeClock()
+
+    def builder(seconds):
+        definition_builder = mocker.Mock()
+        definition_builder.build.side_effect = lambda: setattr(
+            clock, "time", clock.time + seconds
+        )
+        return definition_builder
+
+    mocker.patch(
+        "uplink.helpers.get_api_definitions",
+        return_value=[("get_user", builder(1)), ("list_repos", builder(3))],
+    )
+
+    costs = profiling.definition_costs(object, clock=clock)
+
+    assert list(costs.items()) == [("list_repos", 3), ("get_user", 1)]
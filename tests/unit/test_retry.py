@@ -1,6 +1,9 @@
+# Third-party imports
+import pytest
+
 # Local imports
 from uplink import retry
-from uplink.retry import backoff, stop, when
+from uplink.retry import backoff, budget, stop, when
 
 
 def test_jittered_backoff():
@@ -55,6 +58,60 @@ def test_compose_backoff(mocker):
     right.handle_after_final_retry.assert_called_once_with()
 
 
+def test_retry_after_backoff_with_seconds(mocker):
+    response = mocker.Mock(headers={"Retry-After": "7"})
+    strategy = backoff.retry_after()
+    assert strategy.get_timeout_after_response(None, response) == 7
+
+
+def test_retry_after_backoff_with_http_date(mocker):
+    response = mocker.Mock(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:30 GMT"})
+    strategy = backoff.retry_after(clock=lambda: 1445412500)
+    assert strategy.get_timeout_after_response(None, response) == 10
+
+
+def test_retry_after_backoff_with_reset_timestamp(mocker):
+    response = mocker.Mock(headers={"X-RateLimit-Reset": "1445412530"})
+    strategy = backoff.retry_after(clock=lambda: 1445412500)
+    assert strategy.get_timeout_after_response(None, response) == 30
+
+
+def test_retry_after_backoff_caps_delay(mocker):
+    response = mocker.Mock(headers={"Retry-After": "3600"})
+    strategy = backoff.retry_after(maximum=60)
+    assert strategy.get_timeout_after_response(None, response) == 60
+
+    # Dates in the past should not produce a negative delay
+    response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    strategy = backoff.retry_after(clock=lambda: 1445412500)
+    assert strategy.get_timeout_after_response(None, response) == 0
+
+
+def test_retry_after_backoff_falls_back(mocker):
+    response = mocker.Mock(headers={"Retry-After": "invalid"})
+    strategy = backoff.retry_after() | backoff.fixed(3)
+    assert strategy.get_timeout_after_response(None, response) == 3
+
+    response.headers = {}
+    assert strategy.get_timeout_after_response(None, response) == 3
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf", "Infinity"])
+def test_retry_after_backoff_rejects_non_finite(mocker, value):
+    response = mocker.Mock(headers={"Retry-After": value})
+    strategy = backoff.retry_after() | backoff.fixed(3)
+    assert strategy.get_timeout_after_response(None, response) == 3
+
+
+def test_retry_after_backoff_with_exception(mocker):
+    strategy = backoff.retry_after()
+    error = Exception()
+    assert strategy.get_timeout_after_exception(None, Exception, error, None) is None
+
+    error.response = mocker.Mock(headers={"Retry-After": "2"})
+    assert strategy.get_timeout_after_exception(None, Exception, error, None) == 2
+
+
 def test_retry_stop_default():
     decorator = retry()
     assert stop.NEVER == decorator._stop
@@ -99,6 +156,38 @@ def test_retry_decorator_exposes_submodules_as_properties():
     assert retry.backoff is backoff
     assert retry.stop is stop
     assert retry.when is when
+    assert retry.budget is budget
+
+
+def test_retry_budget_min_retries_per_second():
+    clock = [0]
+    retry_budget = budget.RetryBudget(
+        ratio=0, min_retries_per_second=1, window=2, clock=lambda: clock[0]
+    )
+
+    # Verify: The reserve allows `min_retries_per_second * window` retries
+    assert retry_budget.try_withdraw() is True
+    assert retry_budget.try_withdraw() is True
+    assert retry_budget.try_withdraw() is False
+
+    # Verify: Withdrawals expire once they fall outside the window
+    clock[0] = 3
+    assert retry_budget.try_withdraw() is True
+
+
+def test_retry_budget_ratio():
+    retry_budget = budget.RetryBudget(
+        ratio=0.5, min_retries_per_second=0, clock=lambda: 0
+    )
+    assert retry_budget.try_withdraw() is False
+
+    # Verify: Each successful request earns half a retry
+    retry_budget.deposit()
+    assert retry_budget.try_withdraw() is False
+    retry_budget.deposit()
+    assert retry_budget.balance == 1
+    assert retry_budget.try_withdraw() is True
+    assert retry_budget.try_withdraw() is False
 
 
 def test_stop_after_delay():
@@ -228,3 +317,30 @@ class TestClientExceptionProxies:
     def test_ssl_error(self, request_builder):
         exc = self._get_exception(retry.SSL_ERROR, request_builder)
         assert request_builder.client.exceptions.BaseClientException == exc
+
+
+def test_backoff_for_request_is_independent():
+    strategy = backoff.exponential(base=2) | backoff.retry_after()
+    first, second = strategy.for_request(), strategy.for_request()
+
+    assert first.get_timeout_after_exception(None, None, None, None) == 1
+    assert first.get_timeout_after_exception(None, None, None, None) == 2
+    assert second.get_timeout_after_exception(None, None, None, None) == 1
+
+    first.handle_after_final_retry()
+    assert second.get_timeout_after_exception(None, None, None, None) == 2
+
+
+def test_backoff_for_request_without_state():
+    strategy = backoff.retry_after() | backoff.retry_after()
+    assert strategy.for_request() is strategy
+
+
+def test_backoff_for_request_from_iterable():
+    strategy = backoff.from_iterable([0, 1])
+    timeouts = strategy.for_request()
+
+    assert timeouts.get_timeout_after_response(None, None) == 0
+    assert timeouts.get_timeout_after_response(None, None) == 1
+    assert timeouts.get_timeout_after_response(None, None) is None
+    assert strategy.for_request().get_timeout_after_response(None, None) == 0
@@ -1,5 +1,13 @@
+# Standard library imports
+import hashlib
+import io
+
+# Third-party imports
+import pytest
+
 # Local imports
 from uplink import returns
+from uplink.clients import io as io_
 
 
 def test_returns(request_builder):
@@ -116,3 +124,115 @@ def test_returns_JsonStrategy(mocker):
 
     converter = returns.JsonStrategy(lambda y: y + "!", "hello")
     assert converter(response) == "world!"
+
+
+def _file_response(body):
+    import requests
+
+    response = requests.Response()
+    response.raw = io.BytesIO(body)
+    response.headers["Content-Type"] = "application/octet-stream"
+    return response
+
+
+def _use_to_file(request_builder, decorator, destination=None):
+    request_builder.destination = destination
+    request_builder.return_type = returns.ReturnType.with_decorator(None, decorator)
+    decorator.modify_request(request_builder)
+    return request_builder.return_type
+
+
+def test_returns_to_file(request_builder, tmp_path):
+    path = tmp_path / "report.csv"
+    return_type = _use_to_file(request_builder, returns.to_file(path, "sha256"))
+
+    # Run
+    download = return_type(_file_response(b"a,b\n1,2\n"))
+
+    # Verify: the body is streamed to the file
+    assert request_builder.info["stream"] is True
+    assert path.read_bytes() == b"a,b\n1,2\n"
+    assert download == returns.Download(
+        path,
+        8,
+        hashlib.sha256(b"a,b\n1,2\n").hexdigest(),
+        {"Content-Type": "application/octet-stream"},
+    )
+
+
+def test_returns_to_file_with_destination(request_builder, tmp_path):
+    fp = io.BytesIO()
+    return_type = _use_to_file(
+        request_builder, returns.to_file(tmp_path / "unused"), destination=fp
+    )
+
+    download = return_type(_file_response(b"body"))
+
+    assert fp.getvalue() == b"body"
+    assert download.destination is fp
+    assert download.digest is None
+    assert not (tmp_path / "unused").exists()
+
+
+def test_returns_to_file_removes_partial_file(request_builder, tmp_path, mocker):
+    path = tmp_path / "report.csv"
+    return_type = _use_to_file(request_builder, returns.to_file(path))
+    response = mocker.Mock()
+    response.iter_content.side_effect = OSError("connection reset")
+
+    with pytest.raises(OSError, match="connection reset"):
+        return_type(response)
+
+    assert not path.exists()
+    response.close.assert_called_once_with()
+
+
+def test_returns_to_file_without_destination(request_builder):
+    with pytest.raises(ValueError, match="Destination"):
+        _use_to_file(request_builder, returns.to_file())
+
+
+@pytest.mark.asyncio
+async def test_returns_to_file_async(request_builder, tmp_path, mocker):
+    async def iter_chunked(size):
+        yield b"bo"
+        yield b"dy"
+
+    path = tmp_path / "report.csv"
+    request_builder.client.io.return_value = io_.AsyncioStrategy()
+    return_type = _use_to_file(request_builder, returns.to_file(path, "md5"))
+    response = mocker.Mock(headers={})
+    response.content.at_eof.return_value = False
+    response.content.iter_chunked = iter_chunked
+
+    # Run
+    download = await return_type(response)
+
+    # Verify
+    assert "stream" not in request_builder.info
+    assert path.read_bytes() == b"body"
+    assert download.size == 4
+    assert download.digest == hashlib.md5(b"body").hexdigest()
+    response.release.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_returns_to_file_async_removes_partial_file(
+    request_builder, tmp_path, mocker
+):
+    async def iter_chunked(size):
+        yield b"bo"
+        raise OSError("connection reset")
+
+    path = tmp_path / "report.csv"
+    request_builder.client.io.return_value = io_.AsyncioStrategy()
+    return_type = _use_to_file(request_builder, returns.to_file(path))
+    response = mocker.Mock(headers={})
+    response.content.at_eof.return_value = False
+    response.content.iter_chunked = iter_chunked
+
+    with pytest.raises(OSError, match="connection reset"):
+        await return_type(response)
+
+    assert not path.exists()
+    response.release.assert_called_once_with()
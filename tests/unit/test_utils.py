@@ -1,4 +1,6 @@
 # Standard library imports
+import subprocess
+import sys
 
 # Local imports
 from uplink import utils
@@ -38,3 +40,27 @@ class TestURIBuilder:
         assert builder.remaining_variables() == {"variable"}
         builder.set_variable(variable="resource")
         assert len(builder.remaining_variables()) == 0
+
+
+def test_lazy_import():
+    module = utils.lazy_import("json")
+    assert module is not None
+    assert module.dumps({}) == "{}"
+    assert utils.is_imported(module)
+
+
+def test_lazy_import_missing_module():
+    assert utils.lazy_import("not_a_real_module_name") is None
+    assert not utils.is_imported(None)
+
+
+def test_import_defers_optional_dependencies():
+    # Run in a fresh interpreter, since the test session has already
+    # imported these libraries.
+    code = (
+        "import sys, uplink; "
+        "print(sorted(m for m in ('aiohttp', 'marshmallow', 'pydantic', "
+        "'twisted.internet.reactor') if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "[]"
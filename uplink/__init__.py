@@ -1,11 +1,13 @@
 # Local imports
-from uplink import returns, types
+from uplink import instrumentation, profiling, returns, types
 from uplink.__about__ import __version__
 from uplink._extras import install
 from uplink._extras import load_entry_points as _load_entry_points
 from uplink.arguments import (
     Body,
     Context,
+    Deadline,
+    Destination,
     Field,
     FieldMap,
     Header,
@@ -19,6 +21,7 @@ from uplink.arguments import (
     Url,
 )
 from uplink.builder import Consumer, build
+from uplink.circuit_breaker import circuit_breaker
 from uplink.clients import AiohttpClient, RequestsClient, TwistedClient
 from uplink.commands import delete, get, head, patch, post, put
 
@@ -26,11 +29,14 @@ from uplink.commands import delete, get, head, patch, post, put
 from uplink.converters import MarshmallowConverter
 from uplink.decorators import (
     args,
+    compress,
+    deadline,
     error_handler,
     form_url_encoded,
     headers,
     inject,
     json,
+    max_response_size,
     multipart,
     params,
     response_handler,
@@ -38,10 +44,13 @@ from uplink.decorators import (
 )
 from uplink.exceptions import (
     AnnotationError,
+    DeadlineExceeded,
     Error,
     InvalidRequestDefinition,
+    ResponseTooLarge,
     UplinkBuilderError,
 )
+from uplink.hedge import hedge
 from uplink.models import dumps, loads
 from uplink.ratelimit import ratelimit
 from uplink.retry import retry
@@ -52,6 +61,9 @@ __all__ = [
     "Body",
     "Consumer",
     "Context",
+    "Deadline",
+    "DeadlineExceeded",
+    "Destination",
     "Error",
     "Field",
     "FieldMap",
@@ -65,6 +77,7 @@ __all__ = [
     "Query",
     "QueryMap",
     "RequestsClient",
+    "ResponseTooLarge",
     "Timeout",
     "TwistedClient",
     "UplinkBuilderError",
@@ -72,6 +85,9 @@ __all__ = [
     "__version__",
     "args",
     "build",
+    "circuit_breaker",
+    "compress",
+    "deadline",
     "delete",
     "dumps",
     "error_handler",
@@ -79,14 +95,18 @@ __all__ = [
     "get",
     "head",
     "headers",
+    "hedge",
     "inject",
     "install",
+    "instrumentation",
     "json",
     "loads",
+    "max_response_size",
     "multipart",
     "params",
     "patch",
     "post",
+    "profiling",
     "put",
     "ratelimit",
     "response_handler",
@@ -0,0 +1,56 @@
+"""
+Reports how long it takes to build each consumer's request definitions:
+
+```bash
+python -m uplink myapi.client:GitHub --top 10
+```
+"""
+
+# Standard library imports
+import argparse
+import importlib
+import time
+
+# Local imports
+from uplink import profiling
+
+
+def _load_object(path):
+    module_name, _, attr = path.partition(":")
+    obj = importlib.import_module(module_name)
+    for name in filter(None, attr.split(".")):
+        obj = getattr(obj, name)
+    return obj
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m uplink",
+        description="Reports the cost of building each consumer's definitions.",
+    )
+    parser.add_argument(
+        "consumers",
+        nargs="+",
+        metavar="MODULE:CLASS",
+        help="a consumer class to measure, e.g. 'myapi.client:GitHub'",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="the number of slowest methods to list"
+    )
+    args = parser.parse_args(argv)
+
+    for path in args.consumers:
+        start = time.perf_counter()
+        consumer_cls = _load_object(path)
+        load_time = time.perf_counter() - start
+        costs = profiling.definition_costs(consumer_cls)
+        print(
+            f"{path}: {len(costs)} methods, {sum(costs.values()) * 1000:.2f} ms to "
+            f"build (import: {load_time * 1000:.2f} ms)"
+        )
+        for name, seconds in list(costs.items())[: args.top]:
+            print(f"  {name:<40} {seconds * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
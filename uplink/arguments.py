@@ -16,6 +16,8 @@ from uplink.converters import keys
 __all__ = [
     "Body",
     "Context",
+    "Deadline",
+    "Destination",
     "Field",
     "FieldMap",
     "Header",
@@ -638,6 +640,24 @@ class Body(TypedArgument):
     def update_user(self, **info: Body):
         \"""Update the current user.\"""
     ```
+
+    Without `uplink.json`, the body is sent as is, so it can also be
+    streamed from a file object, a memory map (`mmap.mmap`), or a
+    generator of byte chunks, which the request reads as it's sent.
+    Files and memory maps are sent with their `Content-Length`, and
+    generators with chunked transfer encoding:
+
+    ```python
+    @put("/artifacts/{name}")
+    def upload_artifact(self, name, artifact: Body):
+        \"""Upload a build artifact.\"""
+
+    with open("build.tar.gz", "rb") as artifact:
+        api.upload_artifact("build.tar.gz", artifact)
+    ```
+
+    With an asyncio client (e.g., `uplink.AiohttpClient`), the body can
+    also be an async iterable of byte chunks.
     """
 
     @property
@@ -724,6 +744,68 @@ class Timeout(FuncDecoratorMixin, ArgumentAnnotation):
         request_builder.info["timeout"] = value
 
 
+class Deadline(FuncDecoratorMixin, ArgumentAnnotation):
+    """
+    Passes an overall deadline for the call as a method argument at
+    runtime.
+
+    While [`uplink.deadline`][uplink.deadline] attaches a static deadline
+    to all calls of a consumer method, this class turns a method argument
+    into a dynamic deadline value.
+
+    Example:
+        ```python
+        @retry(max_attempts=5)
+        @get("/user/posts")
+        def get_posts(self, deadline: Deadline() = 10):
+            \"""Fetch all posts for the current users giving up after given
+            number of seconds, including retries.\"""
+        ```
+    """
+
+    @property
+    def type(self):
+        return float
+
+    @property
+    def converter_key(self):
+        """Do not convert passed argument."""
+        return keys.Identity()
+
+    def _modify_request(self, request_builder, value):
+        """Modifies request deadline."""
+        if value is not None:
+            request_builder.add_deadline(value)
+
+
+class Destination(FuncDecoratorMixin, ArgumentAnnotation):
+    """
+    Passes the file to write the response body to as a method argument
+    at runtime, for consumer methods decorated with
+    [`returns.to_file`][uplink.returns.to_file].
+
+    The argument's value is either a path or a writable binary file
+    object, and overrides the destination given to `returns.to_file`.
+
+    Example:
+        ```python
+        @returns.to_file(checksum="sha256")
+        @get("/reports/{report_id}")
+        def download_report(self, report_id, destination: Destination):
+            \"""Write a report to the given file.\"""
+        ```
+    """
+
+    @property
+    def converter_key(self):
+        """Do not convert passed argument."""
+        return keys.Identity()
+
+    def _modify_request(self, request_builder, value):
+        """Modifies the destination of the response body."""
+        request_builder.destination = value
+
+
 class Context(FuncDecoratorMixin, NamedArgument):
     """
     Defines a name-value pair that is accessible to middleware at
@@ -0,0 +1,584 @@
+"""
+This module prepares request bodies for requests that may be sent more
+than once, such as requests that are retried or hedged, and streams
+multipart and compressed bodies.
+"""
+
+# Standard library imports
+import asyncio
+import binascii
+import functools
+import io
+import mmap
+import os
+import zlib
+from collections import abc
+
+# Third-party imports
+from requests import exceptions as requests_exceptions
+from requests import models, utils
+from urllib3 import fields as fields_
+
+# Local imports
+from uplink import exceptions
+from uplink.clients.io import RequestTemplate, transitions
+
+__all__ = [
+    "MultipartEncoder",
+    "compress",
+    "encode",
+    "get_compressor",
+    "is_async_stream",
+    "is_stream",
+    "prepare",
+    "reject",
+]
+
+# Raised by `requests` (2.27+) for bodies that aren't valid JSON.
+_InvalidJSONError = getattr(requests_exceptions, "InvalidJSONError", ValueError)
+
+#: Bodies that are already in memory, and can be sent any number of times.
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+_RAW_TYPES = (str, list, tuple, abc.Mapping, *BUFFER_TYPES)
+
+
+def is_stream(data):
+    """
+    Returns whether the given body is read as it's sent (e.g., a file,
+    a generator, or an async iterable), rather than encoded up front.
+    """
+    if isinstance(data, _RAW_TYPES):
+        return False
+    return hasattr(data, "read") or hasattr(data, "__iter__") or is_async_stream(data)
+
+
+def is_async_stream(data):
+    """Returns whether the given body is an async iterable."""
+    return hasattr(data, "__aiter__")
+
+
+def _set_content_type(headers, content_type):
+    if not any(name.lower() == "content-type" for name in headers):
+        headers["Content-Type"] = content_type
+
+
+def encode(info):
+    """
+    Encodes the JSON, form, or multipart body of a request to bytes, in
+    place, following the conventions of `requests`.
+
+    Bodies that are already encoded (e.g., strings) and streams are
+    left as is.
+
+    Returns:
+        `True` if the request has a body that was encoded.
+
+    Raises:
+        uplink.exceptions.InvalidRequestBody: If the body can't be
+            encoded (e.g., JSON with a `NaN` value).
+    """
+    data, files, json = info.get("data"), info.get("files"), info.get("json")
+    if is_stream(data):
+        return False
+    if not (
+        files
+        or (not data and json is not None)
+        or (data and not isinstance(data, (str, *BUFFER_TYPES)))
+    ):
+        return False
+
+    # Let `requests` encode the body, as it would before sending it.
+    request = models.PreparedRequest()
+    request.prepare_headers(None)
+    try:
+        request.prepare_body(data, files, json)
+    except (TypeError, ValueError, _InvalidJSONError) as error:
+        raise exceptions.InvalidRequestBody(error) from error
+    body, content_type = request.body, request.headers.get("Content-Type")
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    info["data"] = body
+    info.pop("json", None)
+    info.pop("files", None)
+    _set_content_type(info.setdefault("headers", {}), content_type)
+    return True
+
+
+class _StreamReplay(RequestTemplate):
+    """Rewinds a streamed body before each attempt to send it."""
+
+    def __init__(self, body):
+        self._body = body
+        self._position = None
+        self._sent = False
+        if hasattr(body, "seek") and hasattr(body, "tell"):
+            try:
+                self._position = body.tell()
+            except OSError:
+                pass
+
+    def before_request(self, request):
+        if self._sent:
+            if self._position is None:
+                raise exceptions.UnreplayableBody(self._body)
+            self._body.seek(self._position)
+            self._sent = False
+
+    def after_response(self, request, response):
+        self._sent = True
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        self._sent = True
+
+
+def prepare(info):
+    """
+    Prepares the body of a request that may be sent more than once
+    (e.g., retried), so that each attempt sends the same body.
+
+    JSON, form, and multipart bodies are encoded once, so they aren't
+    encoded again for each attempt. Streamed bodies must be rewound
+    instead: file objects are rewound to their starting position, and
+    other streams (e.g., generators) can't be sent again.
+
+    Returns:
+        A request template that rewinds a streamed body before each
+        attempt, or `None` if the body doesn't need rewinding.
+
+    Raises:
+        uplink.exceptions.InvalidRequestBody: If the body can't be
+            encoded.
+    """
+    if encode(info):
+        return None
+    data = info.get("data")
+    if is_stream(data):
+        return _StreamReplay(data)
+    return None
+
+
+class _Rejection(RequestTemplate):
+    """Fails a request instead of sending it."""
+
+    def __init__(self, error):
+        self._error = error
+
+    def before_request(self, request):
+        error = self._error
+        return transitions.fail(type(error), error, error.__traceback__)
+
+
+def reject(error):
+    """
+    Returns a request template that fails the request with the given
+    error (e.g., `uplink.exceptions.InvalidRequestBody`) instead of
+    sending it, so that the request's error handlers receive the error.
+    """
+    return _Rejection(error)
+
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class _BufferSegment:
+    """Reads slices of an in-memory buffer, without copying it."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._offset = 0
+        with memoryview(buffer) as view:
+            self.length = view.nbytes
+        self.can_rewind = True
+
+    def read(self, size):
+        start = self._offset
+        stop = self.length if size < 0 else min(start + size, self.length)
+        self._offset = stop
+        # Each slice holds its own view, so the buffer is only exported
+        # (e.g., a memory map can't be closed) while a chunk is in use.
+        return memoryview(self._buffer).cast("B")[start:stop]
+
+    def rewind(self):
+        self._offset = 0
+
+    async def iterate(self):
+        while self._offset < self.length:
+            yield self.read(_CHUNK_SIZE)
+
+
+class _FileSegment:
+    """Reads a file object lazily, from its current position."""
+
+    def __init__(self, fp):
+        self._fp = fp
+        try:
+            self._start = fp.tell()
+        except (AttributeError, OSError):
+            self._start = None
+        self.can_rewind = self._start is not None and hasattr(fp, "seek")
+        self.length = self._get_length()
+
+    def _get_length(self):
+        if self._start is None:
+            return None
+        try:
+            return os.fstat(self._fp.fileno()).st_size - self._start
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            pass
+        if not self.can_rewind:
+            return None
+        try:
+            end = self._fp.seek(0, io.SEEK_END)
+        except OSError:
+            return None
+        finally:
+            self._fp.seek(self._start)
+        return end - self._start
+
+    def read(self, size):
+        data = self._fp.read(size)
+        return data.encode("utf-8") if isinstance(data, str) else data
+
+    def rewind(self):
+        self._fp.seek(self._start)
+
+    async def iterate(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, self.read, _CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _parts(data, files):
+    # Mirrors how `requests` names and encodes the fields and files of
+    # a multipart body.
+    for name, values in models.to_key_val_list(data or {}):
+        if isinstance(values, str | bytes) or not hasattr(values, "__iter__"):
+            values = [values]
+        for value in values:
+            if value is not None:
+                if not isinstance(value, BUFFER_TYPES):
+                    value = str(value)
+                yield fields_.RequestField(name, b""), None, value
+
+    for name, value in models.to_key_val_list(files or {}):
+        content_type = headers = None
+        if isinstance(value, tuple | list):
+            filename, value, *rest = value
+            content_type, headers = (*rest, None, None)[:2]
+        else:
+            filename = utils.guess_filename(value) or name
+        field = fields_.RequestField(name, b"", filename=filename, headers=headers)
+        yield field, content_type, value
+
+
+def _segment(value):
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    if isinstance(value, BUFFER_TYPES):
+        return _BufferSegment(value)
+    if hasattr(value, "read"):
+        return _FileSegment(value)
+    raise TypeError(
+        f"Can't stream multipart part of type {type(value).__name__!r}: "
+        f"expected a string, bytes-like object, or file object."
+    )
+
+
+class MultipartEncoder:
+    """
+    A multipart form data body that's encoded as it's sent.
+
+    Unlike `requests`, which builds the whole body in memory, the
+    encoder reads file parts lazily, and sends parts from in-memory
+    buffers (e.g., `bytes`, `memoryview`, or `mmap.mmap`) without
+    copying them. The body has a known length, unless a part is a file
+    object whose size can't be determined (e.g., a pipe), in which case
+    it's sent with chunked transfer encoding.
+
+    The encoder is a file-like object for sync clients, and an async
+    iterable for `aiohttp`. If each file part can seek, the encoder can
+    be rewound to send it again (e.g., when a request is retried).
+
+    Args:
+        data: The form fields of the body, as a mapping or list of
+            pairs.
+        files: The parts of the body, as a mapping or list of pairs.
+            Following the conventions of `requests`, each part is
+            either the part's content, or a tuple of its filename,
+            content, and optionally its content type and headers.
+        boundary: The boundary between parts. Defaults to a random
+            string.
+    """
+
+    def __init__(self, data=None, files=None, boundary=None):
+        if boundary is None:
+            boundary = binascii.hexlify(os.urandom(16)).decode("ascii")
+        self.boundary = boundary
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._segments = []
+        header = b""
+        for field, content_type, value in _parts(data, files):
+            field.make_multipart(content_type=content_type)
+            header += f"--{boundary}\r\n".encode("latin-1")
+            header += field.render_headers().encode("utf-8")
+            self._segments += [_BufferSegment(header), _segment(value)]
+            header = b"\r\n"
+        header += f"--{boundary}--\r\n".encode("latin-1")
+        self._segments.append(_BufferSegment(header))
+        self._index = 0
+        self._position = 0
+        lengths = [segment.length for segment in self._segments]
+        self.len = None if None in lengths else sum(lengths)
+
+    def read(self, size=-1):
+        """
+        Reads up to `size` bytes of the body, or the rest of the body if
+        `size` is negative.
+
+        A chunk never spans two parts, so it may be shorter than `size`
+        even before the end of the body.
+        """
+        if size is None or size < 0:
+            return b"".join(bytes(chunk) for chunk in iter(self._read_chunk, b""))
+        return self._read_chunk(size)
+
+    def _read_chunk(self, size=_CHUNK_SIZE):
+        while self._index < len(self._segments):
+            chunk = self._segments[self._index].read(size)
+            if chunk:
+                self._position += len(chunk)
+                return chunk
+            self._index += 1
+        return b""
+
+    def tell(self):
+        """Returns the number of bytes of the body read so far."""
+        if not all(segment.can_rewind for segment in self._segments):
+            raise io.UnsupportedOperation("A part of the body can't be rewound.")
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Rewinds the body to its start, with `seek(0)`.
+
+        The encoder can also seek to its end, with `seek(0, io.SEEK_END)`,
+        if its length is known.
+        """
+        if offset == 0 and whence == io.SEEK_END and self.len is not None:
+            self._index = len(self._segments)
+            self._position = self.len
+            return self._position
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Multipart bodies can only be rewound.")
+        self.tell()
+        for segment in self._segments:
+            segment.rewind()
+        self._index = self._position = 0
+        return 0
+
+    async def __aiter__(self):
+        while self._index < len(self._segments):
+            async for chunk in self._segments[self._index].iterate():
+                self._position += len(chunk)
+                yield chunk
+            self._index += 1
+
+
+def _zstd_compressor():
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        try:
+            import zstandard
+        except ImportError:  # pragma: no cover
+            raise ImportError("No module named 'zstandard'") from None
+        return zstandard.ZstdCompressor().compressobj
+    return zstd.ZstdCompressor
+
+
+_COMPRESSORS = {
+    "gzip": lambda: functools.partial(zlib.compressobj, wbits=zlib.MAX_WBITS | 16),
+    "deflate": lambda: zlib.compressobj,
+    "zstd": _zstd_compressor,
+}
+
+
+def get_compressor(encoding):
+    """
+    Returns a factory of compression objects for the given content
+    encoding.
+
+    !!! note
+        The `"zstd"` encoding requires Python 3.14+ or the `zstandard`
+        package.
+
+    Args:
+        encoding (str): The content encoding: `"gzip"`, `"deflate"`,
+            or `"zstd"`.
+    """
+    try:
+        return _COMPRESSORS[encoding]()
+    except KeyError:
+        raise ValueError(
+            f"Unsupported content encoding {encoding!r}: expected one of "
+            f"{', '.join(map(repr, _COMPRESSORS))}."
+        ) from None
+
+
+def _as_bytes(chunk):
+    return chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _compress_chunks(chunks, compressor):
+    for chunk in chunks:
+        data = compressor.compress(_as_bytes(chunk))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def _compress_async_chunks(chunks, compressor):
+    async for chunk in chunks:
+        data = compressor.compress(_as_bytes(chunk))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class _CompressedReader:
+    """
+    Compresses a file-like body as it's read. The body can be rewound
+    if the underlying body can seek.
+    """
+
+    def __init__(self, body, make_compressor):
+        self._body = body
+        self._make_compressor = make_compressor
+        try:
+            self._start = body.tell()
+        except (AttributeError, OSError):
+            self._start = None
+        self._rewind()
+
+    def _rewind(self):
+        self._compressor = self._make_compressor()
+        self._position = 0
+        self._done = False
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            read_chunk = functools.partial(self.read, _CHUNK_SIZE)
+            return b"".join(iter(read_chunk, b""))
+        while not self._done:
+            chunk = _as_bytes(self._body.read(size))
+            if chunk:
+                data = self._compressor.compress(chunk)
+            else:
+                data, self._done = self._compressor.flush(), True
+            if data:
+                self._position += len(data)
+                return data
+        return b""
+
+    def tell(self):
+        if self._start is None or not hasattr(self._body, "seek"):
+            raise io.UnsupportedOperation("The body can't be rewound.")
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # The compressed size isn't known up front, so the body can
+        # only be rewound.
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Compressed bodies can only be rewound.")
+        self.tell()
+        self._body.seek(self._start)
+        self._rewind()
+        return 0
+
+    async def _read_in_thread(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, self._body.read, _CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    async def __aiter__(self):
+        if is_async_stream(self._body):
+            chunks = self._body.__aiter__()
+        else:
+            chunks = self._read_in_thread()
+        async for data in _compress_async_chunks(chunks, self._compressor):
+            self._position += len(data)
+            yield data
+        self._done = True
+
+
+def _length(data):
+    if isinstance(data, BUFFER_TYPES):
+        with memoryview(data) as view:
+            return view.nbytes
+    if hasattr(data, "len"):
+        return data.len
+    if hasattr(data, "read"):
+        return _FileSegment(data).length
+    return None
+
+
+def _remove_header(headers, name):
+    for key in [key for key in headers if key.lower() == name]:
+        del headers[key]
+
+
+def compress(info, encoding, min_size=0):
+    """
+    Compresses the body of a request in place, and sets its
+    `Content-Encoding` header.
+
+    JSON, form, and multipart bodies are encoded first. In-memory
+    bodies are compressed up front, and streamed bodies are compressed
+    as they're sent.
+
+    Args:
+        info: The request's keyword arguments for the HTTP client.
+        encoding (str): The content encoding: `"gzip"`, `"deflate"`,
+            or `"zstd"`.
+        min_size (int): The size, in bytes, of the smallest body to
+            compress. Streamed bodies of unknown size are always
+            compressed.
+
+    Returns:
+        `True` if the request has a body that was compressed.
+
+    Raises:
+        uplink.exceptions.InvalidRequestBody: If the body can't be
+            encoded.
+    """
+    make_compressor = get_compressor(encoding)
+    encode(info)
+    data = _as_bytes(info.get("data"))
+    headers = info.setdefault("headers", {})
+    if data is None or any(name.lower() == "content-encoding" for name in headers):
+        return False
+    size = _length(data)
+    if size == 0 or (size is not None and size < min_size):
+        return False
+
+    if isinstance(data, BUFFER_TYPES):
+        compressor = make_compressor()
+        data = compressor.compress(data) + compressor.flush()
+    elif hasattr(data, "read"):
+        data = _CompressedReader(data, make_compressor)
+    elif is_async_stream(data):
+        data = _compress_async_chunks(data, make_compressor())
+    else:
+        data = _compress_chunks(data, make_compressor())
+    info["data"] = data
+    _remove_header(headers, "content-length")
+    headers["Content-Encoding"] = encoding
+    return True
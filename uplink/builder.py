@@ -1,5 +1,8 @@
 # Standard library imports
+import copy
 import functools
+import inspect
+import threading
 import warnings
 
 # Local imports
@@ -9,7 +12,9 @@ from uplink import (
     compat,
     exceptions,
     helpers,
+    instrumentation,
     interfaces,
+    profiling,
     session,
     utils,
 )
@@ -39,12 +44,25 @@ class RequestPreparer:
             self._session_chain = hooks_.TransactionHookChain(*builder.hooks)
         else:
             self._session_chain = None
+        self._instruments = [
+            hook
+            for hook in builder.hooks
+            if isinstance(hook, instrumentation.Instrument)
+        ]
+        self._profilers = tuple(
+            hook for hook in builder.hooks if isinstance(hook, profiling.Profiler)
+        )
 
     @staticmethod
     def _get_request_hooks(contract):
         chain = list(contract.transaction_hooks)
         if callable(contract.return_type):
-            chain.append(hooks_.ResponseHandler(contract.return_type))
+            return_type = contract.return_type
+            if contract.profile is not None:
+                return_type = contract.profile.timed(
+                    profiling.CONVERT_RESPONSE, return_type
+                )
+            chain.append(hooks_.ResponseHandler(return_type))
         return chain
 
     def _wrap_hook(self, func):
@@ -72,20 +90,52 @@ class RequestPreparer:
         request_hooks = self._get_request_hooks(request_builder)
         if request_hooks:
             chain = hooks_.TransactionHookChain(*request_hooks)
-            chain.audit_request(self._consumer, request_builder)
+            with request_builder.measure(profiling.AUDIT_HOOKS):
+                chain.audit_request(self._consumer, request_builder)
             self.apply_hooks(execution_builder, chain)
         if self._session_chain:
             self.apply_hooks(execution_builder, self._session_chain)
 
-        execution_builder.with_client(self._client)
-        execution_builder.with_io(self._client.io())
+        # Method annotations can wrap the client for a single request
+        # (e.g., `uplink.hedge`).
+        client = request_builder.client
+        try:
+            # Compress the body once the hooks have finished building it.
+            request_builder.compress_body()
+            if request_builder.has_request_templates or client is not self._client:
+                # The request may be sent more than once (e.g., retried).
+                request_builder.prepare_to_resend()
+        except exceptions.InvalidRequestBody as error:
+            # Fail the request instead of sending it, so that its error
+            # handlers receive the error.
+            request_builder.reject(error)
+        execution_builder.with_client(client)
+        execution_builder.with_io(client.io())
         execution_builder.with_template(request_builder.request_template)
+        execution_builder.with_deadline(request_builder.deadline)
+
+        instruments = [
+            hook
+            for hook in request_hooks
+            if isinstance(hook, instrumentation.Instrument)
+        ]
+        instruments.extend(self._instruments)
+        if request_builder.profile is not None:
+            instruments.append(request_builder.profile)
+        if instruments:
+            execution_builder.with_instrument(
+                instrumentation.InstrumentChain(*instruments),
+                request_builder.method_name,
+            )
 
     def create_request_builder(self, definition):
         registry = definition.make_converter_registry(self._converters)
         req = helpers.RequestBuilder(self._client, registry, self._base_url)
+        if self._profilers:
+            req.profile = profiling.Profile(definition.name, self._profilers)
         if self._session_chain:
-            self._session_chain.audit_request(self._consumer, req)
+            with req.measure(profiling.AUDIT_HOOKS):
+                self._session_chain.audit_request(self._consumer, req)
         return req
 
 
@@ -163,6 +213,15 @@ class Builder(interfaces.CallBuilder):
         if auth is not None:
             self._auth = auth_.get_auth(auth)
 
+    def derive(self):
+        """
+        Returns a copy of this builder that shares its client and
+        converters, and starts with its hooks.
+        """
+        builder = copy.copy(self)
+        builder._hooks = list(self._hooks)
+        return builder
+
     def build(self, definition, consumer=None):
         """
         Creates a callable that uses the provided definition to execute
@@ -182,11 +241,16 @@ class ConsumerMethod:
     for controlling access to the instance.
     """
 
-    def __init__(self, owner_name, attr_name, request_definition_builder):
+    # Guards building definitions on first use, for lazy consumers.
+    _build_lock = threading.Lock()
+
+    def __init__(self, owner_name, attr_name, request_definition_builder, lazy=False):
         self._request_definition_builder = request_definition_builder
         self._owner_name = owner_name
         self._attr_name = attr_name
-        self._request_definition = self._build_definition()
+        self._request_definition = None
+        if not lazy:
+            self._request_definition = self._build_definition()
 
     def _build_definition(self):
         try:
@@ -196,6 +260,14 @@ class ConsumerMethod:
                 self._owner_name, self._attr_name, error
             ) from error
 
+    def build(self):
+        """Returns the request definition, building it if necessary."""
+        if self._request_definition is None:
+            with self._build_lock:
+                if self._request_definition is None:
+                    self._request_definition = self._build_definition()
+        return self._request_definition
+
     def __get__(self, instance, owner):
         # TODO:
         #   Consider caching by instance/owner using WeakKeyDictionary.
@@ -209,7 +281,7 @@ class ConsumerMethod:
             # other siblings (#152).
             value = self._request_definition_builder.copy()
         else:
-            value = instance.session.create(instance, self._request_definition)
+            value = instance.session.create(instance, self.build())
 
         # Make the return value look like the original method (e.g., inherit
         # docstrings and other function attributes).
@@ -220,10 +292,10 @@ class ConsumerMethod:
 
 class ConsumerMeta(type):
     @staticmethod
-    def _wrap_if_definition(cls_name, key, value):
+    def _wrap_if_definition(cls_name, key, value, lazy=False):
         wrapped_value = value
         if isinstance(value, interfaces.RequestDefinitionBuilder):
-            wrapped_value = ConsumerMethod(cls_name, key, value)
+            wrapped_value = ConsumerMethod(cls_name, key, value, lazy=lazy)
             value.update_wrapper(wrapped_value)
         return wrapped_value
 
@@ -247,17 +319,22 @@ class ConsumerMeta(type):
 
             namespace["__init__"] = new_init
 
-    def __new__(mcs, name, bases, namespace):
+    def __new__(mcs, name, bases, namespace, lazy=None):
         mcs._set_init_handler(namespace)
 
+        # Subclasses inherit the lazy mode unless they set it explicitly.
+        if lazy is None:
+            lazy = any(getattr(base, "_lazy_definitions", False) for base in bases)
+        namespace["_lazy_definitions"] = lazy
+
         # Wrap all definition builders with a special descriptor that
         # handles attribute access behavior.
         for key, value in namespace.items():
-            namespace[key] = mcs._wrap_if_definition(name, key, value)
+            namespace[key] = mcs._wrap_if_definition(name, key, value, lazy)
         return super().__new__(mcs, name, bases, namespace)
 
     def __setattr__(cls, key, value):
-        value = cls._wrap_if_definition(cls.__name__, key, value)
+        value = cls._wrap_if_definition(cls.__name__, key, value, cls._lazy_definitions)
         super().__setattr__(key, value)
 
 
@@ -283,6 +360,20 @@ class Consumer(interfaces.Consumer, _Consumer):
     client.get_user("prkumar").json()  # {'login': 'prkumar', ... }
     ```
 
+    Consumers with many methods can defer building each method's
+    request definition until the method is first used, which speeds up
+    defining the class:
+
+    ```python
+    class GitHub(Consumer, lazy=True):
+        ...
+    ```
+
+    Subclasses inherit this mode. Since a lazy consumer reports invalid
+    definitions on first use rather than when the class is defined,
+    call [`validate`][uplink.Consumer.validate] (e.g., in a test) to
+    check all of its definitions up front.
+
     Args:
         base_url (str, optional): The base URL for any request
             sent from this consumer instance.
@@ -320,6 +411,52 @@ class Consumer(interfaces.Consumer, _Consumer):
     def _inject(self, hook, *more_hooks):
         self.session.inject(hook, *more_hooks)
 
+    @classmethod
+    def validate(cls):
+        """
+        Builds the request definition of each consumer method, including
+        inherited methods, that hasn't been built yet.
+
+        Raises:
+            uplink.exceptions.UplinkBuilderError: If a method's
+                definition is invalid.
+        """
+        for name in dir(cls):
+            value = inspect.getattr_static(cls, name)
+            if isinstance(value, ConsumerMethod):
+                value.build()
+
+    def derive(self, base_url=None, auth=None, headers=None):
+        """
+        Returns a view of this consumer that sends requests with a
+        different base URL, authentication, or headers.
+
+        The view shares this consumer's client, converters, and hooks,
+        so it's much cheaper to create than a new consumer (e.g., for
+        a view per tenant of a multi-tenant service):
+
+        ```python
+        github = GitHub(BASE_URL)
+        tenant = github.derive(auth=tenant_token)
+        tenant.get_user("prkumar")
+        ```
+
+        Changes to the view's session don't affect this consumer.
+
+        Args:
+            base_url (str, optional): The base URL for requests sent
+                from the view.
+            auth (tuple or callable, optional): The authentication
+                object for the view.
+            headers (dict, optional): Headers to send with each request
+                from the view, in addition to this consumer's headers.
+        """
+        view = copy.copy(self)
+        view.__session = self.__session.derive(base_url=base_url, auth=auth)
+        if headers:
+            view.__session.headers.update(headers)
+        return view
+
     @property
     def session(self):
         """
@@ -0,0 +1,197 @@
+# Standard library imports
+import threading
+
+# Local imports
+from uplink import decorators, utils
+from uplink.clients.io import RequestTemplate, transitions
+from uplink.ratelimit import _get_host_and_port, now
+from uplink.retry import when as when_mod
+
+__all__ = ["CircuitBreakerOpen", "circuit_breaker"]
+
+
+class CircuitBreakerOpen(RuntimeError):
+    """A request failed fast because the circuit breaker is open."""
+
+    def __init__(self, base_url, remaining):
+        super().__init__(
+            f"Circuit breaker for [{base_url}] is open: requests are blocked "
+            f"for the next [{max(remaining, 0):.2f}] seconds."
+        )
+
+
+class Circuit:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold, reset_timeout, half_open_max_calls, clock):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._half_open_calls = 0
+        self._changed_at = clock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == self.OPEN and self.time_remaining <= 0:
+                self._transition(self.HALF_OPEN)
+            return self._state
+
+    @property
+    def time_remaining(self):
+        return self._reset_timeout - (self._clock() - self._changed_at)
+
+    def _transition(self, state):
+        self._state = state
+        self._failures = 0
+        self._half_open_calls = 0
+        self._changed_at = self._clock()
+
+    def allow_request(self):
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN:
+                if self._half_open_calls >= self._half_open_max_calls:
+                    # Outcomes of trial calls can go unreported (e.g., when
+                    # they are retried), so allow a new round of trial
+                    # calls after another timeout.
+                    if self.time_remaining > 0:
+                        return False
+                    self._transition(self.HALF_OPEN)
+                self._half_open_calls += 1
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._transition(self.CLOSED)
+            else:
+                self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._transition(self.OPEN)
+            elif self._state == self.CLOSED:
+                self._failures += 1
+                if self._failures >= self._failure_threshold:
+                    self._transition(self.OPEN)
+
+
+class CircuitBreakerTemplate(RequestTemplate):
+    def __init__(self, circuit, condition, create_open_circuit_exception):
+        self._circuit = circuit
+        self._condition = condition
+        self._create_open_circuit_exception = create_open_circuit_exception
+
+    def before_request(self, request):
+        if self._circuit.allow_request():
+            return None  # Fallback to default behavior
+        error = self._create_open_circuit_exception(self._circuit.time_remaining)
+        return transitions.fail(type(error), error, None)
+
+    def after_response(self, request, response):
+        if self._condition.should_retry_after_response(response):
+            self._circuit.record_failure()
+        else:
+            self._circuit.record_success()
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        if self._condition.should_retry_after_exception(exc_type, exc_val, exc_tb):
+            self._circuit.record_failure()
+        else:
+            self._circuit.record_success()
+
+
+# noinspection PyPep8Naming
+class circuit_breaker(decorators.MethodAnnotation):
+    """
+    A decorator that stops a consumer method or an entire consumer
+    from sending requests to a service that is failing.
+
+    After `failure_threshold` consecutive failed requests, the circuit
+    opens, and subsequent requests fail immediately with a
+    [`CircuitBreakerOpen`][uplink.circuit_breaker.CircuitBreakerOpen]
+    exception, without touching the network. Once `reset_timeout`
+    seconds have passed, the circuit becomes half-open and lets up to
+    `half_open_max_calls` trial requests through: a successful trial
+    request closes the circuit, while a failed one opens it again.
+
+    ```python
+    @circuit_breaker(failure_threshold=5, reset_timeout=30)
+    @get("/users/{user}")
+    def get_user(self, user):
+        \"""Get user by username.\"""
+    ```
+
+    !!! note
+        Like [`ratelimit`][uplink.ratelimit.ratelimit], the circuit
+        state is kept separately for each host-port combination.
+
+    !!! note
+        When combined with [`retry`][uplink.retry.retry], place
+        `circuit_breaker` below `retry` to count every attempt, or
+        above `retry` to count only the outcome of the final attempt.
+
+    Args:
+        failure_threshold: The number of consecutive failures that
+            opens the circuit.
+        reset_timeout: The number of seconds to wait before allowing
+            trial requests through an open circuit.
+        half_open_max_calls: The maximum number of trial requests to
+            allow while the circuit is half-open.
+        when: A predicate (e.g., from `uplink.retry.when`) that
+            determines which responses and exceptions count as failures.
+            By default, only exceptions count as failures.
+    """
+
+    BY_HOST_AND_PORT = _get_host_and_port
+
+    def __init__(
+        self,
+        failure_threshold=5,
+        reset_timeout=60,
+        half_open_max_calls=1,
+        when=None,
+        group_by=BY_HOST_AND_PORT,
+        clock=now,
+    ):
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._half_open_max_calls = max(1, half_open_max_calls)
+        self._when = when_mod.raises(Exception) if when is None else when
+        self._clock = clock
+        self._circuit_cache = {}
+        self._group_by = utils.no_op if group_by is None else group_by
+
+    def _get_circuit_for_request(self, request_builder):
+        key = self._group_by(request_builder.base_url)
+        try:
+            return self._circuit_cache[key]
+        except KeyError:
+            return self._circuit_cache.setdefault(
+                key,
+                Circuit(
+                    self._failure_threshold,
+                    self._reset_timeout,
+                    self._half_open_max_calls,
+                    self._clock,
+                ),
+            )
+
+    def modify_request(self, request_builder):
+        base_url = request_builder.base_url
+        request_builder.add_request_template(
+            CircuitBreakerTemplate(
+                self._get_circuit_for_request(request_builder),
+                self._when(request_builder),
+                lambda remaining: CircuitBreakerOpen(base_url, remaining),
+            )
+        )
@@ -7,18 +7,19 @@ that returns awaitable responses.
 import asyncio
 import collections
 import inspect
+import mmap
 import threading
 from concurrent import futures
 
-# Third-party imports
-try:
-    import aiohttp
-except ImportError:  # pragma: no cover
-    aiohttp = None
-
 # Local imports
+from uplink import bodies, utils
+from uplink import exceptions as uplink_exceptions
 from uplink.clients import exceptions, interfaces, io, register
 
+# Third-party imports: aiohttp is imported on first use, since it is
+# slow to import.
+aiohttp = utils.lazy_import("aiohttp")
+
 
 def threaded_callback(callback):
     async def new_callback(response):
@@ -33,6 +34,65 @@ def threaded_callback(callback):
     return new_callback
 
 
+# The size of the chunks in which bodies are streamed and read.
+_CHUNK_SIZE = 64 * 1024
+
+_DONE = object()
+
+
+async def _iterate_buffer(buffer):
+    with memoryview(buffer) as view:
+        for start in range(0, view.nbytes, _CHUNK_SIZE):
+            yield view[start : start + _CHUNK_SIZE]
+
+
+async def _iterate_in_thread(iterable):
+    # Pull each chunk from a blocking iterable (e.g., a generator that
+    # reads a file) without blocking the event loop.
+    loop = asyncio.get_running_loop()
+    iterator = iter(iterable)
+    while True:
+        chunk = await loop.run_in_executor(None, next, iterator, _DONE)
+        if chunk is _DONE:
+            return
+        yield chunk
+
+
+def _adapt_body(extras):
+    # `aiohttp` sends in-memory buffers in one write, and doesn't accept
+    # memory maps or sync iterables, so stream these in chunks instead.
+    data = extras.get("data")
+    if isinstance(data, mmap.mmap):
+        headers = dict(extras.get("headers") or {})
+        headers.setdefault("Content-Length", str(len(data)))
+        return dict(extras, data=_iterate_buffer(data), headers=headers)
+    if (
+        bodies.is_stream(data)
+        and not hasattr(data, "read")
+        and not bodies.is_async_stream(data)
+    ):
+        return dict(extras, data=_iterate_in_thread(data))
+    return extras
+
+
+async def _read_limited(response, max_size):
+    # Read the body in chunks, so that a body that exceeds the limit is
+    # abandoned as soon as it does, instead of being read into memory.
+    length = response.content_length
+    if response.method == "HEAD" or length is None or length <= max_size:
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+            body += chunk
+            if len(body) > max_size:
+                break
+        else:
+            # Let `read`, `text`, and `json` return the body that was read.
+            response._body = bytes(body)
+            return response
+    response.close()
+    raise uplink_exceptions.ResponseTooLarge(max_size, response)
+
+
 class AiohttpClient(interfaces.HttpClientAdapter):
     """
     An `aiohttp` client that creates awaitable responses.
@@ -99,7 +159,7 @@ class AiohttpClient(interfaces.HttpClientAdapter):
         Builds a client instance if the first argument is a
         :py:class:`aiohttp.ClientSession`. Otherwise, return :py:obj:`None`.
         """
-        if isinstance(session, aiohttp.ClientSession):
+        if utils.is_imported(aiohttp) and isinstance(session, aiohttp.ClientSession):
             return AiohttpClient(session, *args, **kwargs)
         return None
 
@@ -130,17 +190,25 @@ class AiohttpClient(interfaces.HttpClientAdapter):
 
     async def send(self, request):
         method, url, extras = request
+        extras = _adapt_body(extras)
         session = await self.session()
         response = await session.request(method, url, **extras)
 
         # Make `aiohttp` response "quack" like a `requests` response
         response.status_code = response.status
-
         return response
 
+    async def send_limited(self, request, max_size):
+        response = await self.send(request)
+        return await _read_limited(response, max_size)
+
     def apply_callback(self, callback, response):
         return self.wrap_callback(callback)(response)
 
+    def release(self, response):
+        # Returns the connection to the session's pool, unlike `close`.
+        response.release()
+
     @staticmethod
     def io():
         return io.AsyncioStrategy()
@@ -198,10 +266,25 @@ class AsyncioExecutor(futures.Executor):
 
 
 # === Register client exceptions === #
+class _AiohttpException:
+    """Resolves to an `aiohttp` exception, deferring the import of aiohttp."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        return getattr(aiohttp, self._name)
+
+
+class _AiohttpExceptions(exceptions.Exceptions):
+    BaseClientException = _AiohttpException("ClientError")
+    ConnectionError = _AiohttpException("ClientConnectionError")
+    ConnectionTimeout = _AiohttpException("ClientConnectorError")
+    ServerTimeout = _AiohttpException("ServerTimeoutError")
+    SSLError = _AiohttpException("ClientSSLError")
+    InvalidURL = _AiohttpException("InvalidURL")
+    ResponseTooLarge = uplink_exceptions.ResponseTooLarge
+
+
 if aiohttp is not None:  # pragma: no cover
-    AiohttpClient.exceptions.BaseClientException = aiohttp.ClientError
-    AiohttpClient.exceptions.ConnectionError = aiohttp.ClientConnectionError
-    AiohttpClient.exceptions.ConnectionTimeout = aiohttp.ClientConnectorError
-    AiohttpClient.exceptions.ServerTimeout = aiohttp.ServerTimeoutError
-    AiohttpClient.exceptions.SSLError = aiohttp.ClientSSLError
-    AiohttpClient.exceptions.InvalidURL = aiohttp.InvalidURL
+    AiohttpClient.exceptions = _AiohttpExceptions()
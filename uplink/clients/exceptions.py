@@ -25,3 +25,6 @@ class Exceptions:
 
     InvalidURL = _UnmappedClientException
     """The URL provided was somehow invalid."""
+
+    ResponseTooLarge = _UnmappedClientException
+    """The response body exceeded the limit set with `uplink.max_response_size`."""
@@ -23,5 +23,32 @@ class HttpClientAdapter(io.Client):
     def send(self, request):
         raise NotImplementedError
 
+    def send_limited(self, request, max_size):
+        """
+        Sends the given request, reading the response body before
+        returning the response.
+
+        Clients that support a limit stop reading once the body exceeds
+        `max_size` bytes, close the connection, and raise
+        `uplink.exceptions.ResponseTooLarge`. By default, the request is
+        sent without a limit.
+
+        Args:
+            request: The request to send.
+            max_size (int): The maximum size of the response body, in
+                bytes.
+        """
+        return self.send(request)
+
     def apply_callback(self, callback, response):
         raise NotImplementedError
+
+    def release(self, response):
+        """Releases the connection of a response that won't be read."""
+        close = getattr(response, "close", None)
+        if callable(close):
+            try:
+                close()
+            except OSError:
+                # The connection is discarded either way.
+                pass
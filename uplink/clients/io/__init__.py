@@ -32,13 +32,25 @@ except (ImportError, SyntaxError):  # pragma: no cover
             )
 
 
-try:
-    from uplink.clients.io.twisted_strategy import TwistedStrategy
-except (ImportError, SyntaxError):  # pragma: no cover
+def _load_twisted_strategy():
+    try:
+        from uplink.clients.io.twisted_strategy import TwistedStrategy
+    except (ImportError, SyntaxError):  # pragma: no cover
 
-    class TwistedStrategy(IOStrategy):
-        def __init__(self, *args, **kwargs):
-            raise NotImplementedError(
-                "Failed to load `twisted` execution strategy: you may be not have "
-                "the twisted library installed."
-            )
+        class TwistedStrategy(IOStrategy):
+            def __init__(self, *args, **kwargs):
+                raise NotImplementedError(
+                    "Failed to load `twisted` execution strategy: you may be not "
+                    "have the twisted library installed."
+                )
+
+    return TwistedStrategy
+
+
+def __getattr__(name):
+    # Importing the Twisted strategy installs Twisted's reactor, which is
+    # slow, so defer it until the strategy is first used.
+    if name == "TwistedStrategy":
+        globals()[name] = strategy = _load_twisted_strategy()
+        return strategy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
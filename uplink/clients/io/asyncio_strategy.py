@@ -8,6 +8,14 @@ from uplink.clients.io import interfaces
 __all__ = ["AsyncioStrategy"]
 
 
+async def _proceed(result):
+    # Steps that move the execution to a new state return `CONTINUE`
+    # instead of an awaitable for the next step.
+    if result is interfaces.CONTINUE:
+        return result
+    return await result
+
+
 class AsyncioStrategy(interfaces.IOStrategy):
     """A non-blocking execution strategy using asyncio."""
 
@@ -16,17 +24,20 @@ class AsyncioStrategy(interfaces.IOStrategy):
             response = await func(*args, **kwargs)
         except Exception as error:
             tb = sys.exc_info()[2]
-            response = await callback.on_failure(type(error), error, tb)
+            response = await _proceed(callback.on_failure(type(error), error, tb))
         else:
-            response = await callback.on_success(response)
+            response = await _proceed(callback.on_success(response))
         return response
 
     async def sleep(self, duration, callback):
         await asyncio.sleep(duration)
-        return await callback.on_success()
+        return await _proceed(callback.on_success())
 
     async def finish(self, response):
         return response
 
     async def execute(self, executable):
-        return await executable.execute()
+        response = interfaces.CONTINUE
+        while response is interfaces.CONTINUE:
+            response = await _proceed(executable.execute())
+        return response
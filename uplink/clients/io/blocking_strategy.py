@@ -28,4 +28,7 @@ class BlockingStrategy(interfaces.IOStrategy):
         return response
 
     def execute(self, executable):
-        return executable.execute()
+        response = interfaces.CONTINUE
+        while response is interfaces.CONTINUE:
+            response = executable.execute()
+        return response
@@ -1,14 +1,47 @@
+# Standard library imports
+import sys
+import time
+
 # Local imports
-from uplink.clients.io import interfaces, state
+from uplink import exceptions, instrumentation
+from uplink.clients.io import interfaces, state, templates
 
 __all__ = ["RequestExecutionBuilder"]
 
+# Use monotonic time if available, otherwise fall back to the system clock.
+now = time.monotonic if hasattr(time, "monotonic") else time.time
+
+
+def _cap_timeout(timeout, remaining):
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, int | float):
+        return min(timeout, remaining)
+    if isinstance(timeout, tuple):
+        # E.g., a (connect, read) timeout for `requests`
+        return tuple(_cap_timeout(t, remaining) for t in timeout)
+    return timeout
+
 
 class RequestExecutionBuilder:
+    __slots__ = (
+        "_callbacks",
+        "_client",
+        "_deadline",
+        "_errbacks",
+        "_instrument",
+        "_io",
+        "_name",
+        "_template",
+    )
+
     def __init__(self):
         self._client = None
         self._template = None
         self._io = None
+        self._deadline = None
+        self._instrument = None
+        self._name = None
         self._callbacks = []
         self._errbacks = []
 
@@ -24,6 +57,15 @@ class RequestExecutionBuilder:
         self._io = io
         return self
 
+    def with_deadline(self, seconds):
+        self._deadline = seconds
+        return self
+
+    def with_instrument(self, instrument, name=None):
+        self._instrument = instrument
+        self._name = name
+        return self
+
     def with_callbacks(self, *callbacks):
         self._callbacks.extend(callbacks)
         return self
@@ -32,44 +74,191 @@ class RequestExecutionBuilder:
         self._errbacks.extend(errbacks)
         return self
 
+    def _is_straight_line(self):
+        # Without request templates, a deadline, or an instrument, the
+        # execution always sends the request once and finishes with its
+        # outcome, so it doesn't need to step through the state machine.
+        return (
+            self._instrument is None
+            and self._deadline is None
+            and isinstance(self._template, templates.CompositeRequestTemplate)
+            and self._template.is_default
+        )
+
     def build(self):
         client, io = self._client, self._io
+        if self._instrument is not None:
+            # Report the outcome after all callbacks and errbacks run.
+            io = FinishEventDecorator(io)
         for callback in self._callbacks:
             io = CallbackDecorator(io, client, callback)
         for errback in self._errbacks:
             io = ErrbackDecorator(io, errback)
-        return DefaultRequestExecution(client, io, self._template)
+        if self._is_straight_line():
+            return DirectRequestExecution(client, io)
+        return DefaultRequestExecution(
+            client,
+            io,
+            self._template,
+            self._deadline,
+            instrument=self._instrument,
+            name=self._name,
+        )
 
 
 class DefaultRequestExecution(interfaces.RequestExecution):
-    def __init__(self, client, io, template):
+    __slots__ = (
+        "_attempt",
+        "_client",
+        "_clock",
+        "_deadline",
+        "_expires_at",
+        "_instrument",
+        "_io",
+        "_name",
+        "_scope",
+        "_sent_at",
+        "_sleep_reason",
+        "_started_at",
+        "_state",
+        "_template",
+    )
+
+    def __init__(
+        self, client, io, template, deadline=None, clock=now, instrument=None, name=None
+    ):
         self._client = client
         self._template = template
         self._io = io
         self._state = None
+        self._deadline = deadline
+        self._clock = clock
+        self._expires_at = None
+
+        # Instrumentation
+        self._instrument = instrument
+        self._name = name
+        self._scope = {}
+        self._attempt = 0
+        self._started_at = self._sent_at = None
+        self._sleep_reason = None
+
+    def _emit(self, notify, kind, request, **kwargs):
+        timestamp = self._clock()
+        event = instrumentation.RequestEvent(
+            kind,
+            self._name,
+            self._attempt,
+            timestamp,
+            timestamp - self._started_at,
+            request,
+            self._scope,
+            **kwargs,
+        )
+        notify(event)
+
+    def notify_finish(self, request, response=None, exc_info=None):
+        self._emit(
+            self._instrument.on_finish,
+            "finish",
+            request,
+            response=response,
+            exc_info=exc_info,
+            duration=self._clock() - self._started_at,
+        )
+
+    def _transition(self, request, hook, *args):
+        try:
+            action = hook(request, *args)
+        except Exception:
+            # Request templates may raise (e.g., `ratelimit`), ending the
+            # execution without reaching a terminal state.
+            if self._instrument is not None:
+                self.notify_finish(request, exc_info=sys.exc_info())
+            raise
+        self._state = action(self._state)
+        return interfaces.CONTINUE
 
     def before_request(self, request):
-        action = self._template.before_request(request)
-        next_state = action(self._state)
-        self._state = next_state
-        return self.execute()
+        if self._instrument is not None:
+            self._sleep_reason = "throttle"
+            self._emit(self._instrument.on_prepare, "prepare", request)
+        return self._transition(request, self._template.before_request)
 
     def after_response(self, request, response):
-        action = self._template.after_response(request, response)
-        next_state = action(self._state)
-        self._state = next_state
-        return self.execute()
+        if self._instrument is not None:
+            self._sleep_reason = "retry"
+            self._emit(
+                self._instrument.on_response,
+                "response",
+                request,
+                response=response,
+                duration=self._clock() - self._sent_at,
+            )
+        result = self._transition(request, self._template.after_response, response)
+        if not isinstance(self._state, state.TerminalState):
+            # The response is being retried, so release its connection
+            # instead of holding it while the execution waits.
+            self._client.release(response)
+        return result
 
     def after_exception(self, request, exc_type, exc_val, exc_tb):
-        action = self._template.after_exception(request, exc_type, exc_val, exc_tb)
-        next_state = action(self._state)
-        self._state = next_state
-        return self.execute()
+        if self._instrument is not None:
+            self._sleep_reason = "retry"
+            self._emit(
+                self._instrument.on_exception,
+                "exception",
+                request,
+                exc_info=(exc_type, exc_val, exc_tb),
+                duration=self._clock() - self._sent_at,
+            )
+        return self._transition(
+            request, self._template.after_exception, exc_type, exc_val, exc_tb
+        )
+
+    @property
+    def time_remaining(self):
+        """
+        The number of seconds left before the deadline, or `None` if the
+        execution has no deadline.
+        """
+        if self._expires_at is None:
+            return None
+        return self._expires_at - self._clock()
+
+    def _exceed_deadline(self, request):
+        error = exceptions.DeadlineExceeded(self._deadline)
+        # Skip the `after_exception` hooks, so that request templates
+        # (e.g., `retry`) can't extend the execution past the deadline.
+        self._state = state.Fail(request, type(error), error, None)
+        return interfaces.CONTINUE
 
     def send(self, request, callback):
+        remaining = self.time_remaining
+        if remaining is not None:
+            if remaining <= 0:
+                return self._exceed_deadline(request)
+            method, url, info = request
+            timeout = _cap_timeout(info.get("timeout"), remaining)
+            request = (method, url, dict(info, timeout=timeout))
+        self._attempt += 1
+        if self._instrument is not None:
+            self._sent_at = self._clock()
+            self._emit(self._instrument.on_send, "send", request)
         return self._io.invoke(self._client.send, (request,), {}, callback)
 
     def sleep(self, duration, callback):
+        remaining = self.time_remaining
+        if remaining is not None and duration >= remaining:
+            return self._exceed_deadline(self._state.request)
+        if self._instrument is not None:
+            self._emit(
+                self._instrument.on_sleep,
+                "sleep",
+                self._state.request,
+                duration=duration,
+                reason=self._sleep_reason,
+            )
         return self._io.sleep(duration, callback)
 
     def finish(self, response):
@@ -90,11 +279,43 @@ class DefaultRequestExecution(interfaces.RequestExecution):
         return self.state.execute(self)
 
     def start(self, request):
+        self._started_at = self._clock()
+        if self._deadline is not None:
+            self._expires_at = self._started_at + self._deadline
         self._state = state.BeforeRequest(request)  # Start state
         return self._io.execute(self)
 
 
+class DirectRequestExecution(interfaces.Executable, interfaces.InvokeCallback):
+    """
+    Sends a request once and finishes with the response or error, for
+    executions that have no request templates, deadline, or instrument.
+    """
+
+    __slots__ = ("_client", "_io", "_request")
+
+    def __init__(self, client, io):
+        self._client = client
+        self._io = io
+        self._request = None
+
+    def execute(self):
+        return self._io.invoke(self._client.send, (self._request,), {}, self)
+
+    def on_success(self, response):
+        return self._io.finish(response)
+
+    def on_failure(self, exc_type, exc_val, exc_tb):
+        return self._io.fail(exc_type, exc_val, exc_tb)
+
+    def start(self, request):
+        self._request = request
+        return self._io.execute(self)
+
+
 class FinishingCallback(interfaces.InvokeCallback):
+    __slots__ = ("_io",)
+
     def __init__(self, io):
         self._io = io
 
@@ -106,6 +327,8 @@ class FinishingCallback(interfaces.InvokeCallback):
 
 
 class IOStrategyDecorator(interfaces.IOStrategy):
+    __slots__ = ("_io",)
+
     def __init__(self, io):
         self._io = io
 
@@ -126,11 +349,15 @@ class IOStrategyDecorator(interfaces.IOStrategy):
 
 
 class FinishingDecorator(IOStrategyDecorator):
+    __slots__ = ()
+
     def _invoke(self, func, *args, **kwargs):
         return self._io.invoke(func, args, kwargs, FinishingCallback(self._io))
 
 
 class CallbackDecorator(FinishingDecorator):
+    __slots__ = ("_callback", "_client")
+
     def __init__(self, io, client, callback):
         super().__init__(io)
         self._client = client
@@ -140,7 +367,33 @@ class CallbackDecorator(FinishingDecorator):
         return self._invoke(self._client.apply_callback, self._callback, response)
 
 
+class FinishEventDecorator(IOStrategyDecorator):
+    __slots__ = ("_execution",)
+
+    def __init__(self, io):
+        super().__init__(io)
+        self._execution = None
+
+    def execute(self, executable):
+        self._execution = executable
+        return self._io.execute(executable)
+
+    def finish(self, response):
+        execution = self._execution
+        execution.notify_finish(execution.state.request, response=response)
+        return self._io.finish(response)
+
+    def fail(self, exc_type, exc_val, exc_tb):
+        execution = self._execution
+        execution.notify_finish(
+            execution.state.request, exc_info=(exc_type, exc_val, exc_tb)
+        )
+        return self._io.fail(exc_type, exc_val, exc_tb)
+
+
 class ErrbackDecorator(FinishingDecorator):
+    __slots__ = ("_errback",)
+
     def __init__(self, io, errback):
         super().__init__(io)
         self._errback = errback
@@ -22,6 +22,8 @@ class InvokeCallback:
     a function using the underlying I/O model.
     """
 
+    __slots__ = ()
+
     def on_success(self, result):
         """
         Handles a successful invocation.
@@ -49,6 +51,8 @@ class SleepCallback:
     intended pause.
     """
 
+    __slots__ = ()
+
     def on_success(self):
         """Handles a successful pause."""
         raise NotImplementedError
@@ -65,22 +69,43 @@ class SleepCallback:
         raise NotImplementedError
 
 
+class _Continue:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "CONTINUE"
+
+
+#: Returned by a step of an execution that moved it to a new state,
+#: signaling the `IOStrategy` to run the next step. Steps return this
+#: instead of calling the next one, so that an execution's stack stays
+#: the same depth however many times the request is retried.
+CONTINUE = _Continue()
+
+
 class Executable(compat.abc.Iterator):
     """An abstraction for iterating over the execution of a request."""
 
+    __slots__ = ()
+
     def __next__(self):
         return self.execute()
 
     next = __next__
 
     def execute(self):
-        """Continues the request's execution."""
+        """
+        Continues the request's execution, returning `CONTINUE` if the
+        execution isn't complete.
+        """
         raise NotImplementedError
 
 
 class RequestExecution(Executable):
     """A state machine representing the execution lifecycle of a request."""
 
+    __slots__ = ()
+
     @property
     def state(self):
         """The current state of the request."""
@@ -129,7 +154,10 @@ class RequestExecution(Executable):
         raise NotImplementedError
 
     def execute(self):
-        """Performs the next sequence of steps in the execution."""
+        """
+        Performs the next step in the execution, returning `CONTINUE` if
+        the execution moved to a new state.
+        """
         raise NotImplementedError
 
     def before_request(self, request):
@@ -152,6 +180,8 @@ class RequestExecution(Executable):
 class RequestState:
     """Represents the state of a request in its execution lifecycle."""
 
+    __slots__ = ()
+
     @property
     def request(self):
         """Returns the current request."""
@@ -243,6 +273,8 @@ class RequestTemplate:
     of times).
     """
 
+    __slots__ = ()
+
     def before_request(self, request):
         """
         Handles the request before it is sent.
@@ -303,10 +335,22 @@ class Client:
         """
         raise NotImplementedError
 
+    def release(self, response):
+        """
+        Releases the resources (e.g., the pooled connection) of a
+        response that is being discarded, such as a response that will
+        be retried.
+
+        Args:
+            response: data returned from a server after request.
+        """
+
 
 class IOStrategy:
     """An adapter for a specific I/O model."""
 
+    __slots__ = ()
+
     def invoke(self, func, args, kwargs, callback):
         """
         Invokes the given function using the underlying I/O model.
@@ -316,7 +360,10 @@ class IOStrategy:
             args: The function's positional arguments.
             kwargs: The function's keyword arguments.
             callback (InvokeCallback): A callback that resumes
-                execution after the invocation completes.
+                execution after the invocation completes. The callback
+                may return `CONTINUE`, which should be returned as is
+                instead of being resolved with this strategy's I/O
+                model.
         """
         raise NotImplementedError
 
@@ -327,7 +374,8 @@ class IOStrategy:
         Args:
             duration: The number of seconds to delay execution.
             callback (SleepCallback): A callback that resumes
-                execution after the delay.
+                execution after the delay. Like an `InvokeCallback`,
+                it may return `CONTINUE`.
         """
         raise NotImplementedError
 
@@ -354,7 +402,21 @@ class IOStrategy:
     def execute(self, executable):
         """
         Runs a request's execution to completion using the I/O framework
-        of this strategy.
+        of this strategy, by running the executable's steps until one
+        doesn't return `CONTINUE`.
+
+        Note:
+            Previously, a single call to `executable.execute()` ran the
+            whole execution. Strategies written against that contract
+            must now loop over the executable's steps, e.g.:
+
+            ```python
+            def execute(self, executable):
+                response = interfaces.CONTINUE
+                while response is interfaces.CONTINUE:
+                    response = executable.execute()
+                return response
+            ```
 
         Args:
             executable (Executable): The executable to run.
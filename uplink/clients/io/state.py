@@ -3,6 +3,8 @@ from uplink.clients.io import interfaces
 
 
 class _BaseState(interfaces.RequestState):
+    __slots__ = ("_request",)
+
     def __init__(self, request):
         self._request = request
 
@@ -32,6 +34,8 @@ class _BaseState(interfaces.RequestState):
 
 
 class BeforeRequest(_BaseState):
+    __slots__ = ()
+
     def execute(self, execution):
         return execution.before_request(self._request)
 
@@ -40,20 +44,24 @@ class BeforeRequest(_BaseState):
 
 
 class Sleep(interfaces.RequestState):
+    __slots__ = ("_duration", "_request")
+
     class _Callback(interfaces.SleepCallback):
+        __slots__ = ("_context", "_request")
+
         def __init__(self, execution, request):
             self._context = execution
             self._request = request
 
         def on_success(self):
             self._context.state = BeforeRequest(self._request)
-            return self._context.execute()
+            return interfaces.CONTINUE
 
         def on_failure(self, exc_type, exc_val, exc_tb):
             self._context.state = AfterException(
                 self._request, exc_type, exc_val, exc_tb
             )
-            return self._context.execute()
+            return interfaces.CONTINUE
 
     def __init__(self, request, duration):
         self._request = request
@@ -79,23 +87,27 @@ class Sleep(interfaces.RequestState):
 
 
 class SendRequest(interfaces.RequestState):
+    __slots__ = ("_request",)
+
     def __init__(self, request):
         self._request = request
 
     class SendCallback(interfaces.InvokeCallback):
+        __slots__ = ("_context", "_request")
+
         def __init__(self, execution, request):
             self._context = execution
             self._request = request
 
         def on_success(self, response):
             self._context.state = AfterResponse(self._request, response)
-            return self._context.execute()
+            return interfaces.CONTINUE
 
         def on_failure(self, exc_type, exc_val, exc_tb):
             self._context.state = AfterException(
                 self._request, exc_type, exc_val, exc_tb
             )
-            return self._context.execute()
+            return interfaces.CONTINUE
 
     def execute(self, execution):
         return execution.send(
@@ -111,6 +123,8 @@ class SendRequest(interfaces.RequestState):
 
 
 class AfterResponse(_BaseState):
+    __slots__ = ("_response",)
+
     def __init__(self, request, response):
         super().__init__(request)
         self._response = response
@@ -131,6 +145,8 @@ class AfterResponse(_BaseState):
 
 
 class AfterException(_BaseState):
+    __slots__ = ("_exc_tb", "_exc_type", "_exc_val")
+
     def __init__(self, request, exc_type, exc_val, exc_tb):
         super().__init__(request)
         self._exc_type = exc_type
@@ -165,6 +181,8 @@ class AfterException(_BaseState):
 
 
 class TerminalState(interfaces.RequestState):
+    __slots__ = ("_request",)
+
     def __init__(self, request):
         self._request = request
 
@@ -177,6 +195,8 @@ class TerminalState(interfaces.RequestState):
 
 
 class Fail(TerminalState):
+    __slots__ = ("_exc_tb", "_exc_type", "_exc_val")
+
     def __init__(self, request, exc_type, exc_val, exc_tb):
         super().__init__(request)
         self._exc_type = exc_type
@@ -209,6 +229,8 @@ class Fail(TerminalState):
 
 
 class Finish(TerminalState):
+    __slots__ = ("_response",)
+
     def __init__(self, request, response):
         super().__init__(request)
         self._response = response
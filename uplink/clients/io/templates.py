@@ -2,7 +2,8 @@
 import operator
 
 # Local imports
-from uplink.clients.io import RequestTemplate, transitions
+from uplink.clients.io import transitions
+from uplink.clients.io.interfaces import RequestTemplate
 
 
 class DefaultRequestTemplate(RequestTemplate):
@@ -21,6 +22,8 @@ class DefaultRequestTemplate(RequestTemplate):
 class CompositeRequestTemplate(RequestTemplate):
     """A chain of many templates with fallback behaviors."""
 
+    __slots__ = ("_fallback", "_templates")
+
     __FALLBACK = DefaultRequestTemplate()
 
     def _get_transition(self, method, *args, **kwargs):
@@ -36,6 +39,11 @@ class CompositeRequestTemplate(RequestTemplate):
         self._templates = list(templates)
         self._fallback = fallback
 
+    @property
+    def is_default(self):
+        """Whether this chain only applies the fallback behaviors."""
+        return not self._templates and type(self._fallback) is DefaultRequestTemplate
+
     def before_request(self, request):
         return self._get_transition(RequestTemplate.before_request.__name__, request)
 
@@ -5,6 +5,78 @@ Functions for transitioning between request execution states.
 __all__ = ["fail", "finish", "prepare", "send", "sleep"]
 
 
+class _Action:
+    """
+    Moves an execution from its current state to the next. Each action
+    is a single compact object rather than a closure and its cells,
+    since every request creates a few of them.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, state):  # pragma: no cover
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        return type(other) is type(self) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None
+
+
+class _Sleep(_Action):
+    __slots__ = ("_seconds",)
+
+    def __init__(self, seconds):
+        self._seconds = seconds
+
+    def __call__(self, state):
+        return state.sleep(self._seconds)
+
+
+class _Send(_Action):
+    __slots__ = ("_request",)
+
+    def __init__(self, request):
+        self._request = request
+
+    def __call__(self, state):
+        return state.send(self._request)
+
+
+class _Finish(_Action):
+    __slots__ = ("_response",)
+
+    def __init__(self, response):
+        self._response = response
+
+    def __call__(self, state):
+        return state.finish(self._response)
+
+
+class _Fail(_Action):
+    __slots__ = ("_exc_tb", "_exc_type", "_exc_val")
+
+    def __init__(self, exc_type, exc_val, exc_tb):
+        self._exc_type = exc_type
+        self._exc_val = exc_val
+        self._exc_tb = exc_tb
+
+    def __call__(self, state):
+        return state.fail(self._exc_type, self._exc_val, self._exc_tb)
+
+
+class _Prepare(_Action):
+    __slots__ = ("_request",)
+
+    def __init__(self, request):
+        self._request = request
+
+    def __call__(self, state):
+        return state.prepare(self._request)
+
+
 def sleep(seconds):
     """
     Transitions the execution to pause for the allotted duration.
@@ -12,11 +84,7 @@ def sleep(seconds):
     Args:
         seconds: The number of seconds to delay execution.
     """
-
-    def action(state):
-        return state.sleep(seconds)
-
-    return action
+    return _Sleep(seconds)
 
 
 def send(request):
@@ -26,11 +94,7 @@ def send(request):
     Args:
         request: The intended request data to be sent.
     """
-
-    def action(state):
-        return state.send(request)
-
-    return action
+    return _Send(request)
 
 
 def finish(response):
@@ -40,11 +104,7 @@ def finish(response):
     Args:
         response: The object to return to the execution's invoker.
     """
-
-    def action(state):
-        return state.finish(response)
-
-    return action
+    return _Finish(response)
 
 
 def fail(exc_type, exc_val, exc_tb):
@@ -58,11 +118,7 @@ def fail(exc_type, exc_val, exc_tb):
         exc_val: The exception object.
         exc_tb: The exception's stacktrace.
     """
-
-    def action(state):
-        return state.fail(exc_type, exc_val, exc_tb)
-
-    return action
+    return _Fail(exc_type, exc_val, exc_tb)
 
 
 def prepare(request):
@@ -74,8 +130,4 @@ def prepare(request):
     Args:
         request: The intended request data to be sent.
     """
-
-    def action(state):
-        return state.prepare(request)
-
-    return action
+    return _Prepare(request)
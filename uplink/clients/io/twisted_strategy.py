@@ -44,5 +44,7 @@ class TwistedStrategy(interfaces.IOStrategy):
 
     @defer.inlineCallbacks
     def execute(self, executable):
-        response = yield executable.execute()
+        response = interfaces.CONTINUE
+        while response is interfaces.CONTINUE:
+            response = yield executable.execute()
         defer.returnValue(response)
@@ -1,3 +1,7 @@
+# Standard library imports
+import functools
+import threading
+
 # Local imports
 from uplink.clients import interfaces
 
@@ -8,6 +12,10 @@ DEFAULT_CLIENT = None
 # (default client, handlers)
 _registrar = [None, []]
 
+# (client class, creation kwargs, client) for each shared client
+_shared_clients = []
+_shared_clients_lock = threading.Lock()
+
 
 def handler(func):
     """Registers :py:obj:`func` as a handler."""
@@ -24,7 +32,40 @@ def handle_client_key(key):
     return None
 
 
-def set_default_client(client):
+def get_shared_client(client_cls, **kwargs):
+    """
+    Returns the process-wide instance of the given client class that
+    was created with the given keyword arguments, creating it on first
+    use. This is safe to call from multiple threads.
+    """
+    with _shared_clients_lock:
+        for cls, options, client in _shared_clients:
+            if cls is client_cls and options == kwargs:
+                return client
+        client = client_cls(**kwargs)
+        _shared_clients.append((client_cls, kwargs, client))
+        return client
+
+
+def set_default_client(client, shared=False, **kwargs):
+    """
+    Sets the HTTP client of consumers that are constructed without one.
+
+    Args:
+        client: A client, or a callable (e.g., a client class) that
+            creates one for each consumer.
+        shared (bool): If `True`, consumers share a single instance of
+            the `client` class, so that they reuse its connection pool,
+            instead of each creating their own. Consumers constructed
+            in different threads share it too, so don't share a client
+            whose session is bound to an event loop (e.g.,
+            `AiohttpClient`) across loops.
+        **kwargs: Arguments for creating the client.
+    """
+    if shared:
+        client = functools.partial(get_shared_client, client, **kwargs)
+    elif kwargs:
+        client = functools.partial(client, **kwargs)
     _registrar[0] = client
 
 
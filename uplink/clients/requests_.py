@@ -4,8 +4,32 @@
 import requests
 
 # Local imports
+from uplink import bodies
+from uplink import exceptions as uplink_exceptions
 from uplink.clients import exceptions, interfaces, io, register
 
+_CHUNK_SIZE = 64 * 1024
+
+
+def _read_limited(response, max_size):
+    # Read the body in chunks, so that a body that exceeds the limit is
+    # abandoned as soon as it does, instead of being read into memory.
+    length = response.headers.get("Content-Length", "")
+    if response.request.method == "HEAD" or not (
+        length.isdigit() and int(length) > max_size
+    ):
+        chunks, size = [], 0
+        for chunk in response.iter_content(_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_size:
+                break
+        else:
+            response._content = b"".join(chunks)
+            return response
+    response.close()
+    raise uplink_exceptions.ResponseTooLarge(max_size, response)
+
 
 class RequestsClient(interfaces.HttpClientAdapter):
     """
@@ -46,8 +70,19 @@ class RequestsClient(interfaces.HttpClientAdapter):
 
     def send(self, request):
         method, url, extras = request
+        data = extras.get("data")
+        if bodies.is_async_stream(data) and not hasattr(data, "read"):
+            raise TypeError(
+                "RequestsClient can't send an async iterable body. "
+                "Use a sync iterable, or an asyncio client (e.g., AiohttpClient)."
+            )
         return self.__session.request(method=method, url=url, **extras)
 
+    def send_limited(self, request, max_size):
+        method, url, extras = request
+        response = self.send((method, url, dict(extras, stream=True)))
+        return _read_limited(response, max_size)
+
     def apply_callback(self, callback, response):
         return callback(response)
 
@@ -63,3 +98,4 @@ RequestsClient.exceptions.ConnectionTimeout = requests.ConnectTimeout
 RequestsClient.exceptions.ServerTimeout = requests.ReadTimeout
 RequestsClient.exceptions.SSLError = requests.exceptions.SSLError
 RequestsClient.exceptions.InvalidURL = requests.exceptions.InvalidURL
+RequestsClient.exceptions.ResponseTooLarge = uplink_exceptions.ResponseTooLarge
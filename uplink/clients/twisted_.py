@@ -3,15 +3,14 @@ This module defines an :py:class:`aiohttp.ClientSession` adapter that
 returns :py:class:`twisted.internet.defer.Deferred` responses.
 """
 
-# Third party imports
-try:
-    from twisted.internet import threads
-except ImportError:  # pragma: no cover
-    threads = None
-
 # Local imports
+from uplink import utils
 from uplink.clients import interfaces, io, register
 
+# Third party imports: twisted is imported on first use, since it is
+# slow to import.
+threads = utils.lazy_import("twisted.internet.threads")
+
 
 class TwistedClient(interfaces.HttpClientAdapter):
     """
@@ -51,3 +50,9 @@ class TwistedClient(interfaces.HttpClientAdapter):
 
     def send(self, request):
         return threads.deferToThread(self._proxy.send, request)
+
+    def send_limited(self, request, max_size):
+        return threads.deferToThread(self._proxy.send_limited, request, max_size)
+
+    def release(self, response):
+        self._proxy.release(response)
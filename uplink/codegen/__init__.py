@@ -0,0 +1,25 @@
+"""
+Generates consumer classes and Pydantic models from an OpenAPI 3
+document:
+
+```bash
+python -m uplink.codegen openapi.yaml -o petstore.py --plans
+```
+
+With `--plans`, the generated module loads its consumer classes from a
+serialized cache of their precompiled request definitions (written
+next to the module), instead of applying each method's decorators when
+the module is imported.
+"""
+
+from uplink.codegen.openapi import fingerprint, generate, load_document
+from uplink.codegen.plans import load_plans, plans_path, write_plans
+
+__all__ = [
+    "fingerprint",
+    "generate",
+    "load_document",
+    "load_plans",
+    "plans_path",
+    "write_plans",
+]
@@ -0,0 +1,53 @@
+# Standard library imports
+import argparse
+import importlib
+import os
+import sys
+
+# Local imports
+from uplink import codegen
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m uplink.codegen",
+        description="Generates an Uplink client module from an OpenAPI 3 document.",
+    )
+    parser.add_argument("document", help="an OpenAPI 3 document (JSON or YAML)")
+    parser.add_argument(
+        "-o", "--output", required=True, help="the path of the module to write"
+    )
+    parser.add_argument(
+        "--plans",
+        action="store_true",
+        help="also write precompiled request definitions for the module",
+    )
+    parser.add_argument(
+        "--module",
+        help="the module's import name, if it isn't the output file's name",
+    )
+    args = parser.parse_args(argv)
+
+    document = codegen.load_document(args.document)
+    with open(args.output, "w", encoding="utf-8") as fp:
+        fp.write(codegen.generate(document, plans=args.plans))
+    print(f"Wrote {args.output}")
+    if not args.plans:
+        return
+
+    # Import the fresh module to build its definitions, discarding any
+    # outdated plans so the module defines its classes from source.
+    path = codegen.plans_path(args.output)
+    if os.path.exists(path):
+        os.remove(path)
+    module_name = args.module
+    if module_name is None:
+        module_name = os.path.splitext(os.path.basename(args.output))[0]
+        sys.path.insert(0, os.path.dirname(os.path.abspath(args.output)))
+    module = importlib.import_module(module_name)
+    codegen.write_plans(module, codegen.fingerprint(document), path)
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
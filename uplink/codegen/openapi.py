@@ -0,0 +1,533 @@
+"""
+This module generates the source of a client module, with a consumer
+class for each group of operations and a Pydantic model for each
+schema, from an OpenAPI 3 document.
+"""
+
+# Standard library imports
+import collections
+import hashlib
+import json
+import keyword
+import re
+
+__all__ = ["fingerprint", "generate", "load_document"]
+
+# Bump to invalidate precompiled plans of previously generated modules.
+_FORMAT_VERSION = 1
+
+_HTTP_METHODS = ("get", "put", "post", "delete", "patch", "head")
+_PRIMITIVES = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+}
+_SCHEMAS = "#/components/schemas/"
+_LINE_LENGTH = 88
+_INDENT = "    "
+
+# Field names that clash with `pydantic.BaseModel` attributes. Pydantic
+# v2 also reserves the "model_" prefix for its own attributes.
+_RESERVED_FIELDS = frozenset(
+    [
+        "construct",
+        "copy",
+        "dict",
+        "fields",
+        "from_orm",
+        "json",
+        "parse_file",
+        "parse_obj",
+        "parse_raw",
+        "schema",
+        "schema_json",
+        "update_forward_refs",
+        "validate",
+    ]
+)
+_RESERVED_PREFIX = "model_"
+
+
+def load_document(path):
+    """
+    Reads an OpenAPI document from a JSON or YAML file.
+
+    !!! note
+        Reading YAML documents requires the `pyyaml` package.
+    """
+    with open(path, encoding="utf-8") as fp:
+        text = fp.read()
+    if not path.endswith((".yaml", ".yml")):
+        return json.loads(text)
+    try:
+        import yaml
+    except ImportError:  # pragma: no cover
+        raise ImportError("No module named 'yaml'") from None
+    return yaml.safe_load(text)
+
+
+def fingerprint(document):
+    """
+    Returns a digest of the document, which identifies the precompiled
+    plans of the module generated from it.
+    """
+    data = json.dumps([_FORMAT_VERSION, document], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def _words(name):
+    # Splits "getHTTPStatus_v2" into ["get", "HTTP", "Status", "v2"].
+    return re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+", name)
+
+
+def _identifier(name):
+    if not name or name[0].isdigit():
+        name = "_" + name
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+def _snake_case(name):
+    return _identifier("_".join(word.lower() for word in _words(name)))
+
+
+def _pascal_case(name):
+    return _identifier("".join(word[0].upper() + word[1:] for word in _words(name)))
+
+
+def _literal(value):
+    # Double-quoted, like the rest of the generated code.
+    return json.dumps(value)
+
+
+def _docstring(text, indent):
+    text = (text or "").strip().replace("\\", "\\\\").replace('"""', '\\"""')
+    if not text:
+        return []
+    lines = text.splitlines()
+    if len(lines) == 1 and len(indent) + len(text) + 6 <= _LINE_LENGTH:
+        return [f'{indent}"""{text}"""']
+    body = [f"{indent}{line}".rstrip() for line in lines]
+    return [f'{indent}"""', *body, f'{indent}"""']
+
+
+def _unique(name, taken):
+    candidate, count = name, 1
+    while candidate in taken:
+        count += 1
+        candidate = f"{name}_{count}"
+    taken.add(candidate)
+    return candidate
+
+
+class _Generator:
+    def __init__(self, document, plans):
+        if not str(document.get("openapi", "")).startswith("3"):
+            raise ValueError("Expected an OpenAPI 3 document.")
+        self._document = document
+        self._plans = plans
+        self._schemas = document.get("components", {}).get("schemas", {})
+        self._models = {
+            name: _pascal_case(name) for name in sorted(self._schemas, key=str)
+        }
+        self._forward_refs = set()
+        self._defined = set()
+        self._pydantic_models = []
+
+    # --- References ---
+
+    def _lookup(self, ref):
+        if not ref.startswith("#/"):
+            raise ValueError(f"Unsupported reference: {ref!r}")
+        node = self._document
+        for part in ref[2:].split("/"):
+            node = node[part.replace("~1", "/").replace("~0", "~")]
+        return node
+
+    def _resolve(self, obj):
+        while isinstance(obj, dict) and "$ref" in obj:
+            obj = self._lookup(obj["$ref"])
+        return obj
+
+    # --- Types ---
+
+    def _model_name(self, ref):
+        if ref.startswith(_SCHEMAS):
+            return self._models.get(ref[len(_SCHEMAS) :])
+        return None
+
+    def _type_of(self, schema):
+        if not isinstance(schema, dict):
+            return "typing.Any"
+        if "$ref" in schema:
+            name = self._model_name(schema["$ref"])
+            if name is None:
+                return self._type_of(self._lookup(schema["$ref"]))
+            # Quote models that are referenced before they are defined.
+            return name if name in self._defined else _literal(name)
+        for key in ("oneOf", "anyOf"):
+            if key in schema:
+                types = list(dict.fromkeys(map(self._type_of, schema[key])))
+                if len(types) == 1:
+                    return types[0]
+                return f"typing.Union[{', '.join(types)}]"
+        if len(schema.get("allOf", ())) == 1:
+            return self._type_of(schema["allOf"][0])
+
+        type_ = schema.get("type")
+        nullable = schema.get("nullable", False)
+        if isinstance(type_, list):
+            # OpenAPI 3.1 expresses nullable types as ["string", "null"].
+            nullable = "null" in type_
+            types = [t for t in type_ if t != "null"]
+            type_ = types[0] if len(types) == 1 else None
+
+        if type_ == "array":
+            result = f"typing.List[{self._type_of(schema.get('items'))}]"
+        elif type_ == "object" or "properties" in schema:
+            values = schema.get("additionalProperties")
+            value_type = self._type_of(values) if isinstance(values, dict) else None
+            result = f"typing.Dict[str, {value_type or 'typing.Any'}]"
+        else:
+            result = _PRIMITIVES.get(type_, "typing.Any")
+        if nullable and result != "typing.Any":
+            result = f"typing.Optional[{result}]"
+        return result
+
+    def _dependencies(self, schema):
+        if isinstance(schema, dict):
+            ref = schema.get("$ref")
+            if isinstance(ref, str) and ref.startswith(_SCHEMAS):
+                yield ref[len(_SCHEMAS) :]
+            for value in schema.values():
+                yield from self._dependencies(value)
+        elif isinstance(schema, list):
+            for value in schema:
+                yield from self._dependencies(value)
+
+    def _ordered_schemas(self):
+        # Define each schema after the schemas it references, where
+        # possible; references that form a cycle become forward refs.
+        ordered, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done or name not in self._schemas:
+                return
+            if name in visiting:
+                self._forward_refs.add(self._models[name])
+                return
+            visiting.add(name)
+            for dependency in self._dependencies(self._schemas[name]):
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            ordered.append(name)
+
+        for name in self._models:
+            visit(name)
+        return ordered
+
+    # --- Models ---
+
+    def _is_model(self, schema):
+        schema = self._resolve(schema)
+        return isinstance(schema, dict) and (
+            "properties" in schema
+            or (schema.get("type") == "object" and "additionalProperties" not in schema)
+        )
+
+    def _emit_model(self, name, schema):
+        class_name = self._models[name]
+        if not self._is_model(schema):
+            lines = [f"{class_name} = {self._type_of(schema)}"]
+            self._defined.add(class_name)
+            return lines
+
+        self._pydantic_models.append(class_name)
+        lines = [f"class {class_name}(pydantic.BaseModel):"]
+        lines.extend(_docstring(schema.get("description"), _INDENT))
+        if len(lines) > 1:
+            lines.append("")
+        required = set(schema.get("required", ()))
+        fields, taken = [], set()
+        for prop, prop_schema in schema.get("properties", {}).items():
+            field = prop if prop.isidentifier() else _snake_case(prop)
+            if (
+                keyword.iskeyword(field)
+                or field.startswith("_")
+                or field in _RESERVED_FIELDS
+                or field.startswith(_RESERVED_PREFIX)
+            ):
+                field = _identifier(field.lstrip("_") + "_")
+            field = _unique(field, taken)
+            annotation = self._type_of(prop_schema)
+            if prop not in required and not annotation.startswith("typing.Optional"):
+                annotation = f"typing.Optional[{annotation}]"
+            if field != prop:
+                default = "..." if prop in required else "None"
+                value = f" = pydantic.Field({default}, alias={_literal(prop)})"
+            else:
+                value = "" if prop in required else " = None"
+            fields.append(f"{_INDENT}{field}: {annotation}{value}")
+        if any("alias=" in field for field in fields):
+            # Accept field names, and keep the document's names on the wire.
+            options = ["populate_by_name=True", "serialize_by_alias=True"]
+            if any(field.startswith(_RESERVED_PREFIX) for field in taken):
+                options.append("protected_namespaces=()")
+            config = f"{_INDENT}model_config = pydantic.ConfigDict("
+            if len(config) + len(", ".join(options)) + 1 <= _LINE_LENGTH:
+                lines.append(f"{config}{', '.join(options)})")
+            else:
+                lines.append(config)
+                lines.extend(f"{_INDENT * 2}{option}," for option in options)
+                lines.append(f"{_INDENT})")
+            lines.append("")
+        lines.extend(fields)
+        if len(lines) == 1:
+            lines.append(f"{_INDENT}pass")
+        self._defined.add(class_name)
+        return lines
+
+    # --- Consumers ---
+
+    def _parameters(self, path_item, operation):
+        parameters = collections.OrderedDict()
+        for parameter in path_item.get("parameters", []) + operation.get(
+            "parameters", []
+        ):
+            parameter = self._resolve(parameter)
+            parameters[parameter["name"], parameter["in"]] = parameter
+        return list(parameters.values())
+
+    def _return_type(self, operation):
+        # YAML documents may have integer status codes.
+        responses = {str(code): r for code, r in operation.get("responses", {}).items()}
+        for code in sorted(responses):
+            if not code.startswith("2"):
+                continue
+            content = self._resolve(responses[code]).get("content", {})
+            for media_type, media in content.items():
+                if media_type.endswith("json"):
+                    return self._type_of(media.get("schema"))
+            return None
+        return None
+
+    def _request_body(self, operation):
+        body = self._resolve(operation.get("requestBody"))
+        if not body:
+            return None
+        content = body.get("content", {})
+        for media_type, media in content.items():
+            schema = media.get("schema")
+            if media_type.endswith("json"):
+                return "uplink.json", self._body_annotation(schema), body
+            if media_type == "application/x-www-form-urlencoded":
+                return "uplink.form_url_encoded", "uplink.FieldMap", body
+            if media_type == "multipart/form-data":
+                return "uplink.multipart", "uplink.PartMap", body
+        return None, "uplink.Body", body
+
+    def _body_annotation(self, schema):
+        if isinstance(schema, dict) and "$ref" in schema:
+            name = self._model_name(schema["$ref"])
+            if name is not None and self._is_model(schema):
+                return f"uplink.Body(type={name})"
+        return "uplink.Body"
+
+    def _emit_method(self, path, method, path_item, operation, taken):
+        name = operation.get("operationId") or f"{method}_{path}"
+        name = _unique(_snake_case(name), taken)
+
+        required, optional, arg_names = [], [], {"self"}
+        uri = path.lstrip("/")
+        for parameter in self._parameters(path_item, operation):
+            location, original = parameter["in"], parameter["name"]
+            if location == "cookie":
+                continue
+            arg = _unique(_snake_case(original), arg_names)
+            if location == "path":
+                uri = uri.replace(f"{{{original}}}", f"{{{arg}}}")
+                annotation = "uplink.Path"
+            elif location == "query":
+                annotation = "uplink.Query"
+                if arg != original:
+                    annotation = f"uplink.Query({_literal(original)})"
+            else:
+                annotation = f"uplink.Header({_literal(original)})"
+            if location == "path" or parameter.get("required"):
+                required.append(f"{arg}: {annotation}")
+            else:
+                optional.append(f"{arg}: {annotation} = None")
+
+        decorators = []
+        return_type = self._return_type(operation)
+        if return_type == "typing.Any":
+            decorators.append("@uplink.returns.json")
+        elif return_type is not None:
+            decorators.append(f"@uplink.returns.json(type={return_type})")
+
+        body = self._request_body(operation)
+        if body is not None:
+            decorator, annotation, spec = body
+            if decorator is not None:
+                decorators.append(f"@{decorator}")
+            arg = _unique("body", arg_names)
+            if spec.get("required"):
+                required.append(f"{arg}: {annotation}")
+            else:
+                optional.append(f"{arg}: {annotation} = None")
+        decorators.append(f"@uplink.{method}({_literal(uri)})")
+
+        indent = _INDENT
+        lines = [indent + decorator for decorator in decorators]
+        args = ["self", *required, *optional]
+        signature = f"{indent}def {name}({', '.join(args)}):"
+        if len(signature) <= _LINE_LENGTH:
+            lines.append(signature)
+        else:
+            lines.append(f"{indent}def {name}(")
+            lines.extend(f"{indent * 2}{arg}," for arg in args)
+            lines.append(f"{indent}):")
+        doc = operation.get("summary") or operation.get("description")
+        lines.extend(_docstring(doc, indent * 2) or [f"{indent * 2}pass"])
+        return lines
+
+    def _consumers(self):
+        title = _pascal_case(self._document.get("info", {}).get("title", "")) or "Api"
+        descriptions = {
+            tag["name"]: tag.get("description")
+            for tag in self._document.get("tags", [])
+        }
+        taken = set(self._models.values())
+        names, consumers = {}, collections.OrderedDict()
+        for path, path_item in self._document.get("paths", {}).items():
+            path_item = self._resolve(path_item)
+            for method in _HTTP_METHODS:
+                operation = path_item.get(method)
+                if operation is None:
+                    continue
+                tag = (operation.get("tags") or [None])[0]
+                if tag not in names:
+                    name = title if tag is None else _pascal_case(tag)
+                    name = _unique(name + "Api" if name in taken else name, taken)
+                    names[tag] = name
+                    consumers[name] = (descriptions.get(tag), [])
+                consumers[names[tag]][1].append((path, method, path_item, operation))
+        return consumers
+
+    def _emit_consumer(self, name, description, operations):
+        lines = [f"class {name}(uplink.Consumer, lazy=True):"]
+        lines.extend(_docstring(description, _INDENT))
+        taken = set()
+        for operation in operations:
+            if len(lines) > 1:
+                lines.append("")
+            lines.extend(self._emit_method(*operation, taken))
+        return lines
+
+    # --- Module ---
+
+    def generate(self):
+        info = self._document.get("info", {})
+        schemas = self._ordered_schemas()
+        models = []
+        for name in schemas:
+            models.append("")
+            models.append("")
+            models.extend(self._emit_model(name, self._schemas[name]))
+        if self._forward_refs and self._pydantic_models:
+            # Resolve the forward references now that all models exist.
+            models.extend(["", ""])
+            loop = f"for _model in [{', '.join(self._pydantic_models)}]:"
+            if len(loop) <= _LINE_LENGTH:
+                models.append(loop)
+            else:
+                models.append("for _model in [")
+                models.extend(f"{_INDENT}{name}," for name in self._pydantic_models)
+                models.append("]:")
+            models.append(f'{_INDENT}if hasattr(_model, "model_rebuild"):')
+            models.append(f"{_INDENT * 2}_model.model_rebuild()")
+            models.append(f"{_INDENT}else:")
+            models.append(f"{_INDENT * 2}_model.update_forward_refs()")
+
+        consumers = []
+        names = self._consumers()
+        for name, (description, operations) in names.items():
+            consumers.append("")
+            consumers.append("")
+            consumers.extend(self._emit_consumer(name, description, operations))
+        if self._plans:
+            consumers = self._guard_with_plans(list(names), consumers)
+
+        title = info.get("title", "an OpenAPI document")
+        version = info.get("version")
+        source = f"{title} ({version})" if version else title
+        lines = [
+            '"""',
+            f"Generated by uplink.codegen from {source}.",
+            "",
+            "Don't edit this module by hand: regenerate it instead.",
+            '"""',
+            "",
+            "# Standard library imports",
+            "import typing",
+            "",
+            "# Third-party imports",
+        ]
+        if self._pydantic_models:
+            lines.append("import pydantic")
+        lines.append("import uplink")
+        if self._plans:
+            lines.append("from uplink import codegen")
+        servers = self._document.get("servers") or [{}]
+        base_url = servers[0].get("url", "")
+        if base_url and not base_url.endswith("/"):
+            base_url += "/"
+        lines.extend(["", f"BASE_URL = {_literal(base_url)}"])
+        return "\n".join(lines + models + consumers) + "\n"
+
+    def _guard_with_plans(self, names, consumers):
+        # Import the classes from the precompiled plans, if they're
+        # available and up to date, instead of defining them.
+        digest = fingerprint(self._document)
+        lines = [
+            "",
+            "",
+            f"_plans = codegen.load_plans(__name__, __file__, {_literal(digest)})",
+            "",
+            "if _plans is not None:",
+        ]
+        lines.extend(f"{_INDENT}{name} = _plans[{_literal(name)}]" for name in names)
+        lines.append("else:")
+        for line in consumers[1:]:
+            # Nested classes are separated by a single blank line.
+            if line or lines[-1]:
+                lines.append(f"{_INDENT}{line}" if line else line)
+        return lines
+
+
+def generate(document, plans=False):
+    """
+    Generates the source of a client module from an OpenAPI 3 document.
+
+    The module defines a Pydantic model (or type alias) for each schema
+    under `components/schemas`, and a consumer class for each tag, with
+    a method for each operation. Operations without tags belong to a
+    consumer named after the document's title.
+
+    Args:
+        document: The parsed OpenAPI document.
+        plans: Whether the module should import its consumer classes
+            from precompiled plans, when available. See
+            [`write_plans`][uplink.codegen.write_plans].
+
+    Returns:
+        The source of the module, as a string.
+
+    Raises:
+        ValueError: If the document isn't a valid OpenAPI 3 document
+            or uses external references.
+    """
+    return _Generator(document, plans).generate()
@@ -0,0 +1,192 @@
+"""
+This module serializes the request definitions of generated consumer
+classes, so that importing a large client doesn't need to reapply each
+method's decorators and analyze its signature.
+"""
+
+# Standard library imports
+import functools
+import inspect
+import os
+import pickle
+import sys
+import types
+
+# Local imports
+from uplink import __version__, builder
+
+__all__ = ["load_plans", "plans_path", "write_plans"]
+
+_FORMAT = 1
+
+
+def plans_path(module_file):
+    """Returns the path of the precompiled plans for the given module."""
+    return os.path.splitext(module_file)[0] + ".plans"
+
+
+def _header(module_name, fingerprint):
+    return {
+        "format": _FORMAT,
+        "uplink": __version__,
+        "python": tuple(sys.version_info[:2]),
+        "module": module_name,
+        "fingerprint": fingerprint,
+    }
+
+
+class _MethodStub:
+    """
+    Stands in for the function of a precompiled consumer method: the
+    request definition only needs the function's signature to bind
+    arguments, and its metadata (e.g., docstring).
+    """
+
+    def __init__(self, module, qualname, doc, parameters):
+        self.__module__ = module
+        self.__name__ = qualname.rpartition(".")[2]
+        self.__qualname__ = qualname
+        self.__doc__ = doc
+        self.__signature__ = inspect.Signature(
+            [
+                inspect.Parameter(name, kind, default=default)
+                for name, kind, default in parameters
+            ]
+        )
+
+    def __call__(self, *args, **kwargs):  # pragma: no cover
+        raise TypeError(f"{self.__qualname__} is a precompiled consumer method.")
+
+
+class _PrecompiledDefinition:
+    """Provides a built request definition to a `ConsumerMethod`."""
+
+    def __init__(self, definition, func):
+        self._definition = definition
+        self._func = func
+
+    def build(self):
+        return self._definition
+
+    def copy(self):
+        return _PrecompiledDefinition(self._definition, self._func)
+
+    def update_wrapper(self, wrapper):
+        functools.update_wrapper(wrapper, self._func, updated=())
+
+    def __call__(self, *args, **kwargs):
+        raise TypeError(
+            f"{self._func.__qualname__} is precompiled, so it can't be extended."
+        )
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, functions):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._functions = functions
+
+    def persistent_id(self, obj):
+        # Consumer method functions can't be pickled by reference, since
+        # their qualified names resolve to the consumer methods instead.
+        if isinstance(obj, types.FunctionType) and id(obj) in self._functions:
+            parameters = tuple(
+                (p.name, p.kind, p.default)
+                for p in inspect.signature(obj).parameters.values()
+            )
+            return (obj.__module__, obj.__qualname__, obj.__doc__, parameters)
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file):
+        super().__init__(file)
+        self._stubs = {}
+
+    def persistent_load(self, pid):
+        stub = self._stubs.get(pid[:2])
+        if stub is None:
+            stub = self._stubs[pid[:2]] = _MethodStub(*pid)
+        return stub
+
+
+def _consumer_methods(consumer_cls):
+    if consumer_cls.__bases__ != (builder.Consumer,):
+        raise ValueError(
+            f"Can't precompile {consumer_cls.__qualname__}: precompiled consumers "
+            f"must directly subclass uplink.Consumer."
+        )
+    for name, value in vars(consumer_cls).items():
+        if isinstance(value, builder.ConsumerMethod):
+            yield name, value.build(), value.__wrapped__
+
+
+def write_plans(module, fingerprint, path=None):
+    """
+    Writes the request definitions of the consumer classes defined in a
+    generated module to a file, which the module loads instead of
+    defining the classes.
+
+    Only the classes' consumer methods are precompiled, so this is
+    meant for modules generated by `uplink.codegen`, which define
+    nothing else on their consumers.
+
+    Args:
+        module: The generated module.
+        fingerprint: The fingerprint of the document that the module
+            was generated from.
+        path: The file to write. Defaults to the module's path, with
+            the `.plans` extension.
+    """
+    consumers, functions = {}, {}
+    for value in vars(module).values():
+        if (
+            isinstance(value, type)
+            and issubclass(value, builder.Consumer)
+            and value.__module__ == module.__name__
+        ):
+            methods = list(_consumer_methods(value))
+            functions.update((id(func), func) for _, _, func in methods)
+            consumers[value.__name__] = (value.__qualname__, value.__doc__, methods)
+
+    if path is None:
+        path = plans_path(module.__file__)
+    with open(path, "wb") as fp:
+        pickle.dump(_header(module.__name__, fingerprint), fp)
+        _Pickler(fp, functions).dump(consumers)
+
+
+def _define_consumer(module_name, name, qualname, doc, methods):
+    namespace = {"__module__": module_name, "__qualname__": qualname, "__doc__": doc}
+    for attr_name, definition, func in methods:
+        precompiled = _PrecompiledDefinition(definition, func)
+        method = builder.ConsumerMethod(name, attr_name, precompiled)
+        precompiled.update_wrapper(method)
+        namespace[attr_name] = method
+    return type(builder.Consumer)(name, (builder.Consumer,), namespace)
+
+
+def load_plans(module_name, module_file, fingerprint):
+    """
+    Loads the consumer classes of a generated module from its
+    precompiled plans.
+
+    !!! warning
+        Plans are unpickled, so only load plans that you generated.
+
+    Returns:
+        A dictionary that maps each class name to the class, or `None`
+        if the plans are missing or were written for a different
+        document, module, or version of Uplink or Python.
+    """
+    try:
+        with open(plans_path(module_file), "rb") as fp:
+            if pickle.load(fp) != _header(module_name, fingerprint):
+                return None
+            consumers = _Unpickler(fp).load()
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        # E.g., the plans are missing or reference a renamed model.
+        return None
+    return {
+        name: _define_consumer(module_name, name, *consumer)
+        for name, consumer in consumers.items()
+    }
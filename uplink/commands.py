@@ -8,6 +8,7 @@ from uplink import (
     decorators,
     exceptions,
     interfaces,
+    profiling,
     returns,
     utils,
 )
@@ -248,16 +249,24 @@ class RequestDefinitionBuilder(interfaces.RequestDefinitionBuilder):
             self._return_type,
             argument_handler,
             method_handler,
+            name=getattr(self._func, "__qualname__", None),
         )
 
 
 class RequestDefinition(interfaces.RequestDefinition):
-    def __init__(self, method, uri, return_type, argument_handler, method_handler):
+    def __init__(
+        self, method, uri, return_type, argument_handler, method_handler, name=None
+    ):
         self._method = method
         self._uri = uri
         self._return_type = return_type
         self._argument_handler = argument_handler
         self._method_handler = method_handler
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
 
     @property
     def argument_annotations(self):
@@ -272,10 +281,13 @@ class RequestDefinition(interfaces.RequestDefinition):
 
     def define_request(self, request_builder, func_args, func_kwargs):
         request_builder.method = self._method
+        request_builder.method_name = self._name
         request_builder.relative_url = self._uri
         request_builder.return_type = self._return_type
-        self._argument_handler.handle_call(request_builder, func_args, func_kwargs)
-        self._method_handler.handle_builder(request_builder)
+        with request_builder.measure(profiling.BIND_ARGUMENTS):
+            self._argument_handler.handle_call(request_builder, func_args, func_kwargs)
+        with request_builder.measure(profiling.METHOD_ANNOTATIONS):
+            self._method_handler.handle_builder(request_builder)
 
 
 class HttpMethodFactory:
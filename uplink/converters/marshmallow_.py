@@ -3,9 +3,11 @@ This module defines a converter that uses :py:mod:`marshmallow` schemas
 to deserialize and serialize values.
 """
 
-# Local imports
+# Standard library imports
+import functools
 import importlib.metadata
 
+# Local imports
 from uplink import utils
 from uplink.converters import interfaces, register_default_converter_factory
 
@@ -35,18 +37,17 @@ class MarshmallowConverter(interfaces.Factory):
         ```
     """
 
-    try:
-        import marshmallow
-    except ImportError:  # pragma: no cover
-        marshmallow = None
-        is_marshmallow_3 = None
-    else:
-        is_marshmallow_3 = importlib.metadata.version("marshmallow") >= "3.0"
+    # Imported on first use, since marshmallow is slow to import.
+    marshmallow = utils.lazy_import("marshmallow")
 
     def __init__(self):
         if self.marshmallow is None:
             raise ImportError("No module named 'marshmallow'")
 
+    @functools.cached_property
+    def is_marshmallow_3(self):
+        return importlib.metadata.version("marshmallow") >= "3.0"
+
     class ResponseBodyConverter(interfaces.Converter):
         def __init__(self, extract_data, schema):
             self._extract_data = extract_data
@@ -71,6 +72,9 @@ class MarshmallowConverter(interfaces.Factory):
 
     @classmethod
     def _get_schema(cls, type_):
+        if not utils.is_imported(cls.marshmallow):
+            # The type can't be a schema unless marshmallow is imported.
+            raise ValueError("Expected marshmallow.Scheme subclass or instance.")
         if utils.is_subclass(type_, cls.marshmallow.Schema):
             return type_()
         if isinstance(type_, cls.marshmallow.Schema):
@@ -1,3 +1,4 @@
+from uplink import utils
 from uplink.converters import register_default_converter_factory
 from uplink.converters.interfaces import Factory
 from uplink.utils import is_subclass
@@ -32,12 +33,9 @@ class PydanticConverter(Factory):
         ```
     """
 
-    try:
-        import pydantic
-        import pydantic.v1 as pydantic_v1
-    except ImportError:  # pragma: no cover
-        pydantic = None
-        pydantic_v1 = None
+    # Imported on first use, since pydantic is slow to import.
+    pydantic = utils.lazy_import("pydantic")
+    pydantic_v1 = utils.lazy_import("pydantic.v1")
 
     def __init__(self):
         """
@@ -47,7 +45,14 @@ class PydanticConverter(Factory):
             raise ImportError("No module named 'pydantic'")
 
     def _get_model(self, type_):
-        if is_subclass(type_, (self.pydantic_v1.BaseModel, self.pydantic.BaseModel)):
+        # A type can't be a model unless its version of pydantic is
+        # already imported, so skip importing the others.
+        bases = tuple(
+            module.BaseModel
+            for module in (self.pydantic_v1, self.pydantic)
+            if utils.is_imported(module)
+        )
+        if bases and is_subclass(type_, bases):
             return type_
         raise ValueError(
             "Expected pydantic.BaseModel or pydantic.v1.BaseModel subclass or instance"
@@ -61,13 +66,18 @@ class PydanticConverter(Factory):
 
         return converter(model)
 
+    def _is_v2_model(self, type_):
+        return utils.is_imported(self.pydantic) and is_subclass(
+            type_, self.pydantic.BaseModel
+        )
+
     def create_request_body_converter(self, type_, *args, **kwargs):
-        if is_subclass(type_, self.pydantic.BaseModel):
+        if self._is_v2_model(type_):
             return self._make_converter(_PydanticV2RequestBody, type_)
         return self._make_converter(_PydanticV1RequestBody, type_)
 
     def create_response_body_converter(self, type_, *args, **kwargs):
-        if is_subclass(type_, self.pydantic.BaseModel):
+        if self._is_v2_model(type_):
             return self._make_converter(_PydanticV2ResponseBody, type_)
         return self._make_converter(_PydanticV1ResponseBody, type_)
 
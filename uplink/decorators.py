@@ -8,16 +8,20 @@ import functools
 import inspect
 
 # Local imports
-from uplink import arguments, helpers, hooks, interfaces, utils
+from uplink import arguments, bodies, helpers, hooks, interfaces, utils
+from uplink.clients import interfaces as client_interfaces
 from uplink.compat import abc
 
 __all__ = [
     "args",
+    "compress",
+    "deadline",
     "error_handler",
     "form_url_encoded",
     "headers",
     "inject",
     "json",
+    "max_response_size",
     "multipart",
     "params",
     "response_handler",
@@ -262,16 +266,105 @@ class multipart(MethodAnnotation):
         def update_user(self, photo: Part, description: Part):
             \"""Upload a user profile photo.\"""
         ```
+
+    By default, the whole body is built in memory before it's sent. To
+    upload large files, set `stream` to encode the body as it's sent
+    instead: file parts are read lazily, and parts from in-memory
+    buffers (e.g., `mmap.mmap`) are sent without copying them.
+
+    Examples:
+        ```python
+        @multipart(stream=True)
+        @put("/user/video")
+        def upload_video(self, video: Part):
+            \"""Upload a video, without reading it into memory.\"""
+        ```
+
+    Args:
+        stream (bool, optional): Whether to stream the body with a
+            [`MultipartEncoder`][uplink.bodies.MultipartEncoder].
+            Defaults to `False`.
     """
 
     _http_method_blacklist = {"GET"}
     _can_be_static = True
 
-    # XXX: Let `requests` handle building multipart syntax.
-    # def modify_request(self, request_builder):
-    #     request_builder.info.headers(
-    #         {"Content-Type": "multipart/form-data"}
-    #     )
+    def __init__(self, stream=False):
+        self._stream = stream
+
+    # XXX: Unless streaming, let `requests` handle building multipart syntax.
+    def modify_request(self, request_builder):
+        """Streams the multipart body, if requested."""
+        if self._stream:
+            request_builder.add_transaction_hook(self._hook)
+
+    @staticmethod
+    def set_streaming_body(request_builder):
+        info = request_builder.info
+        data, files = info.pop("data", None), info.pop("files", None)
+        encoder = bodies.MultipartEncoder(data, files)
+        info["data"] = encoder
+        info["headers"]["Content-Type"] = encoder.content_type
+        if encoder.len is not None:
+            info["headers"]["Content-Length"] = str(encoder.len)
+
+    __hook = None
+
+    @property
+    def _hook(self):
+        if self.__hook is None:
+            self.__hook = hooks.RequestAuditor(self.set_streaming_body)
+        return self.__hook
+
+
+# noinspection PyPep8Naming
+class compress(MethodAnnotation):
+    """
+    Compresses the request body, and sets the `Content-Encoding`
+    header.
+
+    JSON, form, and multipart bodies are compressed once they're
+    encoded, and streamed bodies (e.g., files) are compressed as
+    they're sent. Make sure that the server accepts the encoding.
+
+    Examples:
+        ```python
+        @compress("gzip", min_size=1024)
+        @json
+        @post("/events")
+        def ingest(self, events: Body):
+            \"""Upload a batch of events.\"""
+        ```
+
+    When used as a class decorator, `compress` applies to all consumer
+    methods bound to the class. A method's `compress` overrides its
+    consumer's.
+
+    !!! note
+        The `"zstd"` encoding requires Python 3.14+ or the `zstandard`
+        package.
+
+    Args:
+        encoding (str, optional): The content encoding: `"gzip"`,
+            `"deflate"`, or `"zstd"`. Defaults to `"gzip"`.
+        min_size (int, optional): The size, in bytes, of the smallest
+            body to compress, since compressing small bodies rarely
+            pays off. Streamed bodies of unknown size are always
+            compressed. Defaults to `0`.
+    """
+
+    _http_method_blacklist = {"GET"}
+    _can_be_static = True
+
+    def __init__(self, encoding="gzip", min_size=0):
+        # Fail fast on an unsupported or unavailable encoding.
+        bodies.get_compressor(encoding)
+        self._encoding = encoding
+        self._min_size = min_size
+
+    def modify_request(self, request_builder):
+        """Modifies request body compression."""
+        request_builder.set_compression(self._encoding, self._min_size)
 
 
 # noinspection PyPep8Naming
@@ -405,6 +498,117 @@ class timeout(MethodAnnotation):
         request_builder.info["timeout"] = self._seconds
 
 
+class _ResponseSizeLimiter(client_interfaces.HttpClientAdapter):
+    """Wraps a client to send requests with a response size limit."""
+
+    def __init__(self, proxy, max_size):
+        self._proxy = proxy
+        self._max_size = max_size
+
+    @property
+    def exceptions(self):
+        return self._proxy.exceptions
+
+    def io(self):
+        return self._proxy.io()
+
+    def apply_callback(self, callback, response):
+        return self._proxy.apply_callback(callback, response)
+
+    def release(self, response):
+        self._proxy.release(response)
+
+    def send(self, request):
+        return self._proxy.send_limited(request, self._max_size)
+
+    def send_limited(self, request, max_size):
+        return self._proxy.send_limited(request, min(max_size, self._max_size))
+
+
+# noinspection PyPep8Naming
+class max_response_size(MethodAnnotation):
+    """
+    Limits the size of response bodies, in bytes.
+
+    The client reads the response body in chunks. Once the body's
+    `Content-Length`, or the number of bytes read so far, exceeds the
+    limit, the client stops reading, closes the connection, and raises
+    `uplink.ResponseTooLarge`, which is
+    also exposed as `Consumer.exceptions.ResponseTooLarge`.
+
+    Example:
+        ```python
+        @max_response_size(10 * 1024 * 1024)
+        @get("/reports/{report_id}")
+        def get_report(self, report_id):
+            \"""Fetch a report, unless it's larger than 10 MiB.\"""
+        ```
+
+    When used as a class decorator, `max_response_size` applies to all
+    consumer methods bound to the class. If a call has several limits,
+    the smallest applies.
+
+    !!! note
+        The limit is supported by `RequestsClient`, `AiohttpClient`, and
+        `TwistedClient`. Responses are read into memory (up to the
+        limit) before they're returned, even if the `requests` `stream`
+        option is set. Custom clients can support the limit by
+        overriding `HttpClientAdapter.send_limited`; otherwise,
+        responses are returned without a limit.
+
+    Args:
+        max_size (int): The maximum size of a response body, in bytes.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+
+    def modify_request(self, request_builder):
+        """Modifies the response size limit."""
+        # The client applies the limit, so that it isn't sent along
+        # with the request's options.
+        request_builder.client = _ResponseSizeLimiter(
+            request_builder.client, self._max_size
+        )
+
+
+# noinspection PyPep8Naming
+class deadline(MethodAnnotation):
+    """Time to wait for a consumer method call to complete, overall.
+
+    Unlike [`uplink.timeout`][uplink.timeout], which applies to each
+    attempt to send the request, the deadline bounds the entire call,
+    including retries and waits imposed by rate limits. Each attempt's
+    timeout is reduced to the time remaining, and the call fails with
+    [`DeadlineExceeded`][uplink.exceptions.DeadlineExceeded] instead of
+    pausing past the deadline.
+
+    Example:
+        ```python
+        @deadline(10)
+        @retry(max_attempts=5)
+        @get("/user/posts")
+        def get_posts(self):
+            \"""Fetch all posts for the current users.\"""
+        ```
+
+    When used as a class decorator, `deadline` applies to all
+    consumer methods bound to the class. If a call has several
+    deadlines, the shortest applies.
+
+    Args:
+        seconds: The number of seconds to wait for the call to
+            complete.
+    """
+
+    def __init__(self, seconds):
+        self._seconds = seconds
+
+    def modify_request(self, request_builder):
+        """Modifies request deadline."""
+        request_builder.add_deadline(self._seconds)
+
+
 # noinspection PyPep8Naming
 class args(MethodAnnotation):
     """Annotate method arguments using positional or keyword arguments.
@@ -24,3 +24,53 @@ class InvalidRequestDefinition(Error):
 
 class AnnotationError(Error):
     """Something went wrong with an annotation."""
+
+
+class DeadlineExceeded(Error, TimeoutError):
+    """A request failed because it exceeded its overall deadline."""
+
+    message = "Exceeded deadline of [%s] seconds."
+
+    def __init__(self, seconds):
+        self.message = self.message % seconds
+        self.seconds = seconds
+
+
+class ResponseTooLarge(Error):
+    """
+    A response was abandoned, since its body exceeded the size limit set
+    with `uplink.max_response_size`.
+    """
+
+    message = "Response body exceeded the limit of [%s] bytes."
+
+    def __init__(self, max_size, response=None):
+        self.message = self.message % max_size
+        self.max_size = max_size
+        self.response = response
+
+
+class UnreplayableBody(Error):
+    """
+    A request couldn't be sent again (e.g., to retry it), since its
+    streamed body (e.g., a generator) can't be rewound.
+    """
+
+    message = "Can't send the request again: its body [%r] can't be rewound."
+
+    def __init__(self, body):
+        self.message = self.message % (body,)
+        self.body = body
+
+
+class InvalidRequestBody(Error):
+    """
+    A request wasn't sent, since its body couldn't be encoded (e.g., a
+    JSON body with a `NaN` value).
+    """
+
+    message = "Can't encode the request body: %s"
+
+    def __init__(self, error):
+        self.message = self.message % (error,)
+        self.error = error
@@ -0,0 +1,309 @@
+# Standard library imports
+import asyncio
+import collections
+import functools
+import threading
+import time
+from concurrent import futures
+
+# Local imports
+from uplink import bodies, decorators
+from uplink.clients import interfaces, io
+
+__all__ = ["hedge"]
+
+# Use monotonic time if available, otherwise fall back to the system clock.
+now = time.monotonic if hasattr(time, "monotonic") else time.time
+
+
+def _discard_result(release, future):
+    if not future.cancelled() and future.exception() is None:
+        release(future.result())
+
+
+def _discard(release, pending):
+    discard = functools.partial(_discard_result, release)
+    for future in pending:
+        # Requests already in flight can't be interrupted, so discard
+        # their responses once they complete.
+        if not future.cancel():
+            future.add_done_callback(discard)
+
+
+def _pick_winner(done, errors, release):
+    winner = None
+    for future in done:
+        if future.exception() is not None:
+            errors.append(future.exception())
+        elif winner is None:
+            winner = future
+        else:
+            _discard_result(release, future)
+    return winner
+
+
+class LatencyTracker:
+    """Tracks a percentile over the most recent request latencies."""
+
+    def __init__(self, percentile, window=1000, refresh_every=50):
+        self._percentile = percentile
+        self._samples = collections.deque(maxlen=window)
+        self._refresh_every = refresh_every
+        self._pending = 0
+        self._value = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, latency):
+        with self._lock:
+            self._samples.append(latency)
+            self._pending += 1
+            # Refresh on every sample until there are enough to go stale.
+            if (
+                len(self._samples) <= self._refresh_every
+                or self._pending >= self._refresh_every
+            ):
+                self._refresh()
+
+    def _refresh(self):
+        ordered = sorted(self._samples)
+        index = round((len(ordered) - 1) * self._percentile / 100.0)
+        self._value = ordered[index]
+        self._pending = 0
+
+    @property
+    def value(self):
+        return self._value
+
+
+class HedgingClient(interfaces.HttpClientAdapter):
+    """
+    Wraps a client to send duplicate requests when the original is
+    slow to complete, returning the first successful response.
+
+    Hedging is supported for clients that use the blocking and asyncio
+    execution strategies. Requests sent through any other client are
+    not hedged.
+    """
+
+    def __init__(self, proxy, policy):
+        self._proxy = proxy
+        self._policy = policy
+
+    @property
+    def exceptions(self):
+        return self._proxy.exceptions
+
+    def io(self):
+        return self._proxy.io()
+
+    def apply_callback(self, callback, response):
+        return self._proxy.apply_callback(callback, response)
+
+    def release(self, response):
+        self._proxy.release(response)
+
+    def send(self, request):
+        return self._hedge(self._proxy.send, request)
+
+    def send_limited(self, request, max_size):
+        send = functools.partial(self._proxy.send_limited, max_size=max_size)
+        return self._hedge(send, request)
+
+    def _hedge(self, send, request):
+        if bodies.is_stream(request[2].get("data")):
+            # A streamed body can only be read by one request.
+            return send(request)
+        strategy = self._proxy.io()
+        if isinstance(strategy, io.AsyncioStrategy):
+            return self._send_async(send, request)
+        if isinstance(strategy, io.BlockingStrategy):
+            return self._send_blocking(send, request)
+        return send(request)
+
+    def _timed_send(self, send, request):
+        start = now()
+        response = send(request)
+        self._policy.record_latency(now() - start)
+        return response
+
+    async def _timed_send_async(self, send, request):
+        start = now()
+        response = await send(request)
+        self._policy.record_latency(now() - start)
+        return response
+
+    def _send_blocking(self, send, request):
+        executor = self._policy.executor
+        pending = {executor.submit(self._timed_send, send, request)}
+        num_extra, errors = 0, []
+        while pending:
+            can_hedge = num_extra < self._policy.max_extra
+            done, pending = futures.wait(
+                pending,
+                timeout=self._policy.delay if can_hedge else None,
+                return_when=futures.FIRST_COMPLETED,
+            )
+            if not done:
+                pending.add(executor.submit(self._timed_send, send, request))
+                num_extra += 1
+                continue
+            winner = _pick_winner(done, errors, self._proxy.release)
+            if winner is not None:
+                _discard(self._proxy.release, pending)
+                return winner.result()
+        raise errors[0]
+
+    async def _send_async(self, send, request):
+        pending = {asyncio.ensure_future(self._timed_send_async(send, request))}
+        num_extra, errors = 0, []
+        try:
+            while pending:
+                can_hedge = num_extra < self._policy.max_extra
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self._policy.delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    pending.add(
+                        asyncio.ensure_future(self._timed_send_async(send, request))
+                    )
+                    num_extra += 1
+                    continue
+                winner = _pick_winner(done, errors, self._proxy.release)
+                if winner is not None:
+                    return winner.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise errors[0]
+
+
+# noinspection PyPep8Naming
+class hedge(decorators.MethodAnnotation):
+    """
+    A decorator that sends a duplicate request when the original
+    request takes longer than a given delay to complete, then uses
+    whichever response arrives first and cancels the other requests.
+
+    Hedging reduces tail latency for idempotent requests against
+    replicated backends. Retries and response handlers apply to the
+    winning response as usual.
+
+    ```python
+    @hedge(delay=0.05)
+    @get("/users/{user}")
+    def get_user(self, user):
+        \"""Get user by username.\"""
+    ```
+
+    To hedge once a request is slower than most recent requests, set
+    `percentile` to base the delay on the tracked latency of the
+    decorated method. Until enough requests are tracked, the fixed
+    `delay` is used.
+
+    ```python
+    # Send a duplicate when a request is slower than 95% of requests.
+    @hedge(percentile=95)
+    @get("/users/{user}")
+    def get_user(self, user):
+        \"""Get user by username.\"""
+    ```
+
+    !!! note
+        Hedging is supported for clients that use blocking
+        (e.g., `RequestsClient`) or asyncio (e.g., `AiohttpClient`)
+        execution. Blocking clients send requests through a thread
+        pool, which is created on first use and can be released with
+        [`shutdown`][uplink.hedge.hedge.shutdown].
+
+    !!! note
+        When used as a class decorator, `hedge` applies only to `GET`,
+        `HEAD`, and `OPTIONS` requests.
+
+    Args:
+        delay: The number of seconds to wait for a response before
+            sending each duplicate request.
+        max_extra: The maximum number of duplicate requests to send.
+        percentile: If specified, the percentile of recent request
+            latencies to use as the delay.
+        min_samples: The number of requests to track before using
+            `percentile` as the delay.
+        max_workers: The maximum number of threads used to send
+            requests for blocking clients.
+    """
+
+    _http_method_whitelist = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(
+        self,
+        delay=0.1,
+        max_extra=1,
+        percentile=None,
+        min_samples=20,
+        max_workers=None,
+    ):
+        self._delay = delay
+        self._max_extra = max(0, max_extra)
+        self._min_samples = min_samples
+        self._max_workers = max_workers
+        self._tracker = None if percentile is None else LatencyTracker(percentile)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def delay(self):
+        if self._tracker is not None and len(self._tracker) >= self._min_samples:
+            return self._tracker.value
+        return self._delay
+
+    @property
+    def max_extra(self):
+        return self._max_extra
+
+    @property
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="uplink-hedge",
+                )
+            return self._executor
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down the thread pool used to send requests for blocking
+        clients. A new pool is created if the decorated methods are
+        called again.
+
+        ```python
+        hedge_user_requests = hedge(delay=0.05)
+
+        class GitHub(Consumer):
+            @hedge_user_requests
+            @get("/users/{user}")
+            def get_user(self, user):
+                \"""Get user by username.\"""
+
+        ...
+        hedge_user_requests.shutdown()
+        ```
+
+        Args:
+            wait: Whether to wait for requests in flight to complete.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def record_latency(self, latency):
+        if self._tracker is not None:
+            self._tracker.record(latency)
+
+    def modify_request(self, request_builder):
+        request_builder.client = HedgingClient(request_builder.client, self)
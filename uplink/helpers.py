@@ -2,7 +2,7 @@
 import collections
 
 # Local imports
-from uplink import interfaces, utils
+from uplink import bodies, interfaces, profiling, utils
 from uplink.clients import io
 
 
@@ -39,11 +39,38 @@ def set_api_definition(service, name, definition):
     setattr(service, name, definition)
 
 
+# Shared by requests without templates: the composite has no state of its own.
+_NO_REQUEST_TEMPLATES = io.CompositeRequestTemplate(())
+
+
 class RequestBuilder:
+    __slots__ = (
+        "_base_url",
+        "_client",
+        "_compression",
+        "_context",
+        "_converter_registry",
+        "_deadline",
+        "_destination",
+        "_info",
+        "_method",
+        "_method_name",
+        "_profile",
+        "_relative_url_template",
+        "_request_templates",
+        "_return_type",
+        "_transaction_hooks",
+    )
+
     def __init__(self, client, converter_registry, base_url):
         self._method = None
+        self._method_name = None
         self._relative_url_template = utils.URIBuilder("")
         self._return_type = None
+        self._deadline = None
+        self._compression = None
+        self._destination = None
+        self._profile = None
         self._client = client
         self._base_url = base_url
 
@@ -60,6 +87,10 @@ class RequestBuilder:
     def client(self):
         return self._client
 
+    @client.setter
+    def client(self, client):
+        self._client = client
+
     @property
     def method(self):
         return self._method
@@ -68,6 +99,15 @@ class RequestBuilder:
     def method(self, method):
         self._method = method
 
+    @property
+    def method_name(self):
+        """The qualified name of the consumer method being invoked."""
+        return self._method_name
+
+    @method_name.setter
+    def method_name(self, name):
+        self._method_name = name
+
     @property
     def base_url(self):
         return self._base_url
@@ -96,7 +136,11 @@ class RequestBuilder:
         return iter(self._transaction_hooks)
 
     def get_converter(self, converter_key, *args, **kwargs):
-        return self._converter_registry[converter_key](*args, **kwargs)
+        if self._profile is None:
+            return self._converter_registry[converter_key](*args, **kwargs)
+        with self._profile.measure(profiling.CONVERT_REQUEST):
+            converter = self._converter_registry[converter_key](*args, **kwargs)
+        return converter and self._profile.timed_converter(converter)
 
     @property
     def return_type(self):
@@ -106,8 +150,73 @@ class RequestBuilder:
     def return_type(self, return_type):
         self._return_type = return_type
 
+    @property
+    def deadline(self):
+        return self._deadline
+
+    def add_deadline(self, seconds):
+        # The tightest of the deadlines set on a request applies.
+        if self._deadline is None or seconds < self._deadline:
+            self._deadline = seconds
+
+    @property
+    def destination(self):
+        """The file to write the response body to, if set for the call."""
+        return self._destination
+
+    @destination.setter
+    def destination(self, destination):
+        self._destination = destination
+
+    @property
+    def compression(self):
+        return self._compression
+
+    def set_compression(self, encoding, min_size=0):
+        # A method's setting overrides its consumer's, since class
+        # annotations modify the request first.
+        self._compression = (encoding, min_size)
+
+    def compress_body(self):
+        """Compresses the request body, if compression is set."""
+        if self._compression is not None:
+            bodies.compress(self._info, *self._compression)
+
+    @property
+    def profile(self):
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile):
+        self._profile = profile
+
+    def measure(self, phase):
+        if self._profile is None:
+            return profiling.NO_PROFILE
+        return self._profile.measure(phase)
+
+    @property
+    def has_request_templates(self):
+        return bool(self._request_templates)
+
+    def prepare_to_resend(self):
+        """
+        Prepares the request to be sent more than once (e.g., retried),
+        encoding its body once rather than on each attempt.
+        """
+        replay = bodies.prepare(self._info)
+        if replay is not None:
+            # Rewind the body before any other template sends the request.
+            self._request_templates.insert(0, replay)
+
+    def reject(self, error):
+        """Fails the request with the given error, instead of sending it."""
+        self._request_templates.insert(0, bodies.reject(error))
+
     @property
     def request_template(self):
+        if not self._request_templates:
+            return _NO_REQUEST_TEMPLATES
         return io.CompositeRequestTemplate(self._request_templates)
 
     @property
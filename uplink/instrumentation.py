@@ -0,0 +1,273 @@
+"""
+This module defines an interface for observing the lifecycle of each
+request, with adapters for common monitoring libraries.
+"""
+
+# Local imports
+from uplink import hooks
+
+__all__ = [
+    "Instrument",
+    "InstrumentChain",
+    "OpenTelemetryInstrument",
+    "PrometheusInstrument",
+    "RequestEvent",
+]
+
+
+class RequestEvent:
+    """
+    Describes a step in the execution of a consumer method call.
+
+    Attributes:
+        kind: The step's name: `"prepare"`, `"send"`, `"response"`,
+            `"exception"`, `"sleep"`, or `"finish"`.
+        method_name: The qualified name of the consumer method (e.g.,
+            `"GitHub.get_user"`).
+        attempt: The number of the attempt to send the request,
+            starting from 1.
+        timestamp: The monotonic time at which the event occurred.
+        elapsed: The number of seconds since the call started.
+        request: The request as a `(method, url, info)` tuple.
+        response: The response, for `"response"` events, or the call's
+            result after any response handlers, for successful
+            `"finish"` events.
+        exc_info: The `(type, value, traceback)` of the error, for
+            `"exception"` and failed `"finish"` events.
+        duration: The duration of the attempt for `"response"` and
+            `"exception"` events, the pause for `"sleep"` events, and
+            the entire call for `"finish"` events.
+        reason: For `"sleep"` events, `"throttle"` if the pause
+            precedes sending the request (e.g., waiting for a rate
+            limit), or `"retry"` if it follows a failed attempt.
+        scope: A dictionary shared by all events of the same call,
+            which instruments can use to store state for the call.
+    """
+
+    def __init__(
+        self,
+        kind,
+        method_name,
+        attempt,
+        timestamp,
+        elapsed,
+        request,
+        scope,
+        response=None,
+        exc_info=None,
+        duration=None,
+        reason=None,
+    ):
+        self.kind = kind
+        self.method_name = method_name
+        self.attempt = attempt
+        self.timestamp = timestamp
+        self.elapsed = elapsed
+        self.request = request
+        self.scope = scope
+        self.response = response
+        self.exc_info = exc_info
+        self.duration = duration
+        self.reason = reason
+
+    @property
+    def failed(self):
+        return self.exc_info is not None
+
+    def __repr__(self):
+        return (
+            f"RequestEvent(kind={self.kind!r}, method_name={self.method_name!r}, "
+            f"attempt={self.attempt!r}, elapsed={self.elapsed!r})"
+        )
+
+
+class Instrument(hooks.TransactionHook):
+    """
+    Observes each step in the execution of consumer method calls.
+
+    Override the methods for the events of interest, then add the
+    instrument to a consumer like any other hook:
+
+    ```python
+    class LogSleeps(Instrument):
+        def on_sleep(self, event):
+            logger.info("%s paused %.2fs", event.method_name, event.duration)
+
+    github = GitHub(BASE_URL, hooks=[LogSleeps()])
+    ```
+    """
+
+    def on_prepare(self, event):
+        """Called before each attempt to send the request is prepared."""
+
+    def on_send(self, event):
+        """Called when an attempt to send the request starts."""
+
+    def on_response(self, event):
+        """Called when an attempt receives a response."""
+
+    def on_exception(self, event):
+        """Called when an attempt fails with an exception."""
+
+    def on_sleep(self, event):
+        """Called when the execution pauses (e.g., for retry backoff)."""
+
+    def on_finish(self, event):
+        """Called when the call completes, successfully or not."""
+
+
+class InstrumentChain(Instrument):
+    """Notifies several instruments of each event, in order."""
+
+    def __init__(self, *instruments):
+        self._instruments = instruments
+
+    def on_prepare(self, event):
+        for instrument in self._instruments:
+            instrument.on_prepare(event)
+
+    def on_send(self, event):
+        for instrument in self._instruments:
+            instrument.on_send(event)
+
+    def on_response(self, event):
+        for instrument in self._instruments:
+            instrument.on_response(event)
+
+    def on_exception(self, event):
+        for instrument in self._instruments:
+            instrument.on_exception(event)
+
+    def on_sleep(self, event):
+        for instrument in self._instruments:
+            instrument.on_sleep(event)
+
+    def on_finish(self, event):
+        for instrument in self._instruments:
+            instrument.on_finish(event)
+
+
+class OpenTelemetryInstrument(Instrument):
+    """
+    Records each consumer method call as an OpenTelemetry span, with
+    span events for each attempt and pause.
+
+    !!! note
+        This instrument is an optional feature and requires the
+        `opentelemetry-api` package.
+
+    Args:
+        tracer: The tracer that creates spans. Defaults to the tracer
+            named `"uplink"` from the global tracer provider.
+    """
+
+    def __init__(self, tracer=None):
+        try:
+            from opentelemetry import trace
+        except ImportError:  # pragma: no cover
+            raise ImportError("No module named 'opentelemetry'") from None
+        self._trace = trace
+        self._tracer = trace.get_tracer("uplink") if tracer is None else tracer
+
+    def _get_span(self, event):
+        return event.scope.get(self)
+
+    def on_prepare(self, event):
+        if self._get_span(event) is not None:
+            return
+        method, url, _ = event.request
+        event.scope[self] = self._tracer.start_span(
+            event.method_name or method,
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={"http.request.method": method, "url.full": url},
+        )
+
+    def on_send(self, event):
+        span = self._get_span(event)
+        span.set_attribute("http.request.resend_count", event.attempt - 1)
+
+    def on_response(self, event):
+        status_code = getattr(event.response, "status_code", None)
+        if status_code is not None:
+            self._get_span(event).set_attribute(
+                "http.response.status_code", status_code
+            )
+
+    def on_exception(self, event):
+        self._get_span(event).record_exception(event.exc_info[1])
+
+    def on_sleep(self, event):
+        self._get_span(event).add_event(
+            "sleep", {"duration": event.duration, "reason": event.reason}
+        )
+
+    def on_finish(self, event):
+        span = event.scope.pop(self, None)
+        if span is None:  # pragma: no cover
+            return
+        if event.failed:
+            span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, str(event.exc_info[1]))
+            )
+        span.end()
+
+
+class PrometheusInstrument(Instrument):
+    """
+    Records call latency, attempt counts, and pauses as Prometheus
+    metrics, labeled by consumer method.
+
+    The instrument exports the following metrics:
+
+    - `<prefix>_request_duration_seconds`: A histogram of call latency,
+      labeled by method and outcome.
+    - `<prefix>_attempts_total`: A counter of attempts to send a
+      request, labeled by method.
+    - `<prefix>_sleep_seconds`: A histogram of pauses, labeled by method
+      and reason (`"retry"` or `"throttle"`).
+
+    !!! note
+        This instrument is an optional feature and requires the
+        `prometheus_client` package.
+
+    Args:
+        registry: The collector registry for the metrics. Defaults
+            to the global registry.
+        prefix: The prefix for the metric names.
+    """
+
+    def __init__(self, registry=None, prefix="uplink"):
+        try:
+            import prometheus_client
+        except ImportError:  # pragma: no cover
+            raise ImportError("No module named 'prometheus_client'") from None
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        self._duration = prometheus_client.Histogram(
+            f"{prefix}_request_duration_seconds",
+            "Latency of consumer method calls, including retries.",
+            ["method", "outcome"],
+            registry=registry,
+        )
+        self._attempts = prometheus_client.Counter(
+            f"{prefix}_attempts",
+            "Attempts to send a request.",
+            ["method"],
+            registry=registry,
+        )
+        self._sleep = prometheus_client.Histogram(
+            f"{prefix}_sleep_seconds",
+            "Pauses between attempts or before sending a request.",
+            ["method", "reason"],
+            registry=registry,
+        )
+
+    def on_send(self, event):
+        self._attempts.labels(event.method_name).inc()
+
+    def on_sleep(self, event):
+        self._sleep.labels(event.method_name, event.reason).observe(event.duration)
+
+    def on_finish(self, event):
+        outcome = "error" if event.failed else "success"
+        self._duration.labels(event.method_name, outcome).observe(event.duration)
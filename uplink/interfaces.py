@@ -106,6 +106,10 @@ class RequestDefinitionBuilder:
 
 
 class RequestDefinition:
+    @property
+    def name(self):
+        raise NotImplementedError
+
     def make_converter_registry(self, converters):
         raise NotImplementedError
 
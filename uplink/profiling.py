@@ -0,0 +1,280 @@
+"""
+This module records how long each consumer method call spends in each
+phase of its execution, and how long consumer classes take to build.
+"""
+
+# Standard library imports
+import collections
+import contextlib
+import functools
+import threading
+import time
+
+# Local imports
+from uplink import hooks, instrumentation
+
+__all__ = ["PhaseStats", "Profile", "Profiler", "definition_costs"]
+
+# Phases, in the order they typically occur during a call.
+BIND_ARGUMENTS = "bind_arguments"
+METHOD_ANNOTATIONS = "method_annotations"
+CONVERT_REQUEST = "convert_request"
+AUDIT_HOOKS = "audit_hooks"
+THROTTLE = "throttle"
+RETRY_SLEEP = "retry_sleep"
+SEND = "send"
+CALLBACKS = "callbacks"
+CONVERT_RESPONSE = "convert_response"
+
+PHASES = (
+    BIND_ARGUMENTS,
+    METHOD_ANNOTATIONS,
+    CONVERT_REQUEST,
+    AUDIT_HOOKS,
+    THROTTLE,
+    RETRY_SLEEP,
+    SEND,
+    CALLBACKS,
+    CONVERT_RESPONSE,
+)
+
+_SLEEP_PHASES = {"throttle": THROTTLE, "retry": RETRY_SLEEP}
+
+# A reusable context manager for requests that aren't profiled.
+NO_PROFILE = contextlib.nullcontext()
+
+
+class Profile(instrumentation.Instrument):
+    """
+    The breakdown of a single consumer method call by phase.
+
+    Phases that involve user code (e.g., converters and response
+    handlers) are measured exclusively: time spent in a nested phase
+    counts toward that phase only.
+
+    Attributes:
+        method_name: The qualified name of the consumer method.
+        phases: A mapping of each phase to the number of seconds spent
+            in that phase. The phases are:
+
+            - `"bind_arguments"`: Applying the method's argument
+              annotations.
+            - `"method_annotations"`: Applying the method's decorators.
+            - `"convert_request"`: Resolving converters and converting
+              arguments.
+            - `"audit_hooks"`: Auditing the request with transaction
+              hooks.
+            - `"throttle"`: Waiting before sending the request (e.g.,
+              for a rate limit).
+            - `"retry_sleep"`: Waiting between attempts.
+            - `"send"`: Sending each attempt and waiting for its
+              response.
+            - `"callbacks"`: Running response and error handlers.
+            - `"convert_response"`: Converting the response into the
+              method's return type.
+        total: The number of seconds the call took, or `None` if the
+            call hasn't finished.
+        failed: Whether the call failed with an exception.
+    """
+
+    def __init__(self, method_name, profilers=(), clock=time.perf_counter):
+        self.method_name = method_name
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.total = None
+        self.failed = False
+        self._profilers = profilers
+        self._clock = clock
+        self._started_at = clock()
+        self._stack = []
+        self._measured = 0.0
+        self._attempt_ended_at = None
+        self._measured_at_attempt_end = 0.0
+
+    @contextlib.contextmanager
+    def measure(self, phase):
+        """Attributes the time spent in the block to the given phase."""
+        start = self._clock()
+        self._stack.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start
+            nested = self._stack.pop()
+            self.phases[phase] += elapsed - nested
+            if self._stack:
+                self._stack[-1] += elapsed
+            else:
+                self._measured += elapsed
+
+    def timed(self, phase, func):
+        """Wraps the function to attribute each call to the given phase."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.measure(phase):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def timed_converter(self, converter):
+        """
+        Wraps the converter to attribute each call to the request or
+        response conversion phase, depending on when it is called.
+        """
+
+        def wrapper(*args, **kwargs):
+            phase = (
+                CONVERT_REQUEST if self._attempt_ended_at is None else CONVERT_RESPONSE
+            )
+            with self.measure(phase):
+                return converter(*args, **kwargs)
+
+        return wrapper
+
+    def _end_attempt(self, event):
+        self.phases[SEND] += event.duration
+        self._attempt_ended_at = self._clock()
+        self._measured_at_attempt_end = self._measured
+
+    def on_response(self, event):
+        self._end_attempt(event)
+
+    def on_exception(self, event):
+        self._end_attempt(event)
+
+    def on_sleep(self, event):
+        self.phases[_SLEEP_PHASES.get(event.reason, RETRY_SLEEP)] += event.duration
+
+    def on_finish(self, event):
+        finished_at = self._clock()
+        if self._attempt_ended_at is not None:
+            # Attribute the rest of the time since the final attempt,
+            # except for measured phases like response conversion.
+            measured = self._measured - self._measured_at_attempt_end
+            self.phases[CALLBACKS] += max(
+                0.0, finished_at - self._attempt_ended_at - measured
+            )
+        self.total = finished_at - self._started_at
+        self.failed = event.failed
+        for profiler in self._profilers:
+            profiler.record(self)
+
+    def __repr__(self):
+        return f"Profile(method_name={self.method_name!r}, total={self.total!r})"
+
+
+class PhaseStats:
+    """
+    Aggregates the profiles of calls to a consumer method.
+
+    Attributes:
+        count: The number of profiled calls.
+        total: The number of seconds spent in all profiled calls.
+        phases: A mapping of each phase to the total number of seconds
+            spent in that phase across all profiled calls.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+
+    def add(self, profile):
+        self.count += 1
+        self.total += profile.total
+        for phase, seconds in profile.phases.items():
+            self.phases[phase] += seconds
+
+    def mean(self, phase=None):
+        """
+        Returns the average number of seconds per call spent in the
+        given phase, or in the entire call if no phase is given.
+        """
+        if not self.count:
+            return 0.0
+        seconds = self.total if phase is None else self.phases[phase]
+        return seconds / self.count
+
+    def __repr__(self):
+        return f"PhaseStats(count={self.count!r}, total={self.total!r})"
+
+
+class Profiler(hooks.TransactionHook):
+    """
+    Records how long each consumer method call spends in each phase,
+    from binding arguments to converting the response.
+
+    Add the profiler to a consumer like any other hook, then inspect the
+    aggregate breakdown for each method:
+
+    ```python
+    profiler = Profiler()
+    github = GitHub(BASE_URL, hooks=[profiler])
+    github.get_user("prkumar")
+
+    stats = profiler.stats["GitHub.get_user"]
+    print(stats.mean("send"), stats.mean("convert_response"))
+    ```
+
+    Profiling adds overhead to each call, so it is disabled unless a
+    profiler is added.
+
+    Args:
+        callback: An optional function that receives the
+            [`Profile`][uplink.profiling.Profile] of each call once the
+            call finishes.
+    """
+
+    def __init__(self, callback=None):
+        self._callback = callback
+        self._stats = collections.defaultdict(PhaseStats)
+        self._lock = threading.Lock()
+
+    def record(self, profile):
+        with self._lock:
+            self._stats[profile.method_name].add(profile)
+        if self._callback is not None:
+            self._callback(profile)
+
+    @property
+    def stats(self):
+        """A mapping of each profiled method's name to its `PhaseStats`."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self):
+        """Discards the aggregated stats."""
+        with self._lock:
+            self._stats.clear()
+
+
+def definition_costs(consumer_cls, clock=time.perf_counter):
+    """
+    Measures how long it takes to build the request definition of each
+    method of a consumer class, which is the bulk of the work done when
+    the class is defined (or on first use, for lazy consumers).
+
+    ```python
+    for name, seconds in definition_costs(GitHub).items():
+        print(f"{name}: {seconds * 1000:.2f} ms")
+    ```
+
+    The class isn't modified: each definition is built from a copy.
+
+    Args:
+        consumer_cls: A `Consumer` subclass.
+        clock: The timer to measure with.
+
+    Returns:
+        A dictionary that maps each method's name to the number of
+        seconds spent building its definition, from slowest to fastest.
+    """
+    # Avoid a circular import: the helpers module depends on this one.
+    from uplink import helpers
+
+    costs = {}
+    for name, definition_builder in helpers.get_api_definitions(consumer_cls):
+        start = clock()
+        definition_builder.build()
+        costs[name] = clock() - start
+    return dict(sorted(costs.items(), key=lambda item: item[1], reverse=True))
@@ -1,5 +1,6 @@
 from uplink.retry.backoff import RetryBackoff
+from uplink.retry.budget import RetryBudget
 from uplink.retry.retry import retry
 from uplink.retry.when import RetryPredicate
 
-__all__ = ["RetryBackoff", "RetryPredicate", "retry"]
+__all__ = ["RetryBackoff", "RetryBudget", "RetryPredicate", "retry"]
@@ -1,11 +1,18 @@
 # Standard imports
+import email.utils
+import math
 import random
 import sys
+import time
 
 # Constants
 MAX_VALUE = sys.maxsize / 2
 
-__all__ = ["exponential", "fixed", "jittered"]
+# Reset headers holding a value at least this large are treated as an
+# absolute Unix timestamp rather than a number of seconds to wait.
+_EPOCH_THRESHOLD = 10**9
+
+__all__ = ["exponential", "fixed", "jittered", "retry_after"]
 
 
 def from_iterable(iterable):
@@ -73,6 +80,17 @@ class RetryBackoff:
         """
         pass  # pragma: no cover
 
+    def for_request(self):
+        """
+        Returns the strategy to use for a single request's retries.
+
+        A strategy that keeps state between retry attempts (e.g., to
+        increase the timeout after each attempt) should return a new
+        object that holds the state, since concurrent requests share
+        the same `retry` decorator. By default, returns this strategy.
+        """
+        return self
+
     def __or__(self, other):
         """Composes the current strategy with another."""
         assert isinstance(other, RetryBackoff), "Both objects should be backoffs."
@@ -104,6 +122,31 @@ class _Or(RetryBackoff):
         self._left.handle_after_final_retry()
         self._right.handle_after_final_retry()
 
+    def for_request(self):
+        left, right = self._left.for_request(), self._right.for_request()
+        if left is self._left and right is self._right:
+            return self
+        return _Or(left, right)
+
+
+class _BackoffIterator(RetryBackoff):
+    """The timeouts of an iterable strategy for a single request."""
+
+    def __init__(self, iterator):
+        self._iterator = iterator
+
+    def _next(self):
+        return next(self._iterator, None)
+
+    def get_timeout_after_response(self, request, response):
+        return self._next()
+
+    def get_timeout_after_exception(self, request, exc_type, exc_val, exc_tb):
+        return self._next()
+
+    def handle_after_final_retry(self):
+        pass
+
 
 class _IterableBackoff(RetryBackoff):
     __iterator = None
@@ -132,6 +175,9 @@ class _IterableBackoff(RetryBackoff):
     def handle_after_final_retry(self):
         self.__iterator = None
 
+    def for_request(self):
+        return _BackoffIterator(iter(self))
+
 
 class jittered(_IterableBackoff):
     """
@@ -183,3 +229,85 @@ class fixed(_IterableBackoff):
     def __iter__(self):
         while True:
             yield self._seconds
+
+
+# noinspection PyPep8Naming
+class retry_after(RetryBackoff):
+    """
+    Waits for the duration that the server requests through the
+    `Retry-After` header or a similar rate limit reset header.
+
+    The `Retry-After` header may hold either a number of seconds or an
+    HTTP-date. Reset headers, such as `X-RateLimit-Reset`, may hold
+    either a number of seconds or a Unix timestamp.
+
+    When the response doesn't specify a delay, this strategy returns
+    `None`, so you can fall back to another strategy with the `|`
+    operator:
+
+    ```python
+    @retry(when=retry.when.status(429, 503), backoff=retry_after() | jittered())
+    @get("/users/{user}")
+    def get_user(self, user):
+        \"""Get user by username.\"""
+    ```
+
+    Args:
+        headers: The names of the headers to inspect, in order of
+            precedence.
+        maximum: The longest delay to honor, in seconds. Longer
+            delays are capped to this value.
+    """
+
+    DEFAULT_HEADERS = (
+        "Retry-After",
+        "RateLimit-Reset",
+        "X-RateLimit-Reset",
+        "X-Rate-Limit-Reset",
+    )
+
+    def __init__(self, headers=DEFAULT_HEADERS, maximum=MAX_VALUE, clock=time.time):
+        self._headers = tuple(headers)
+        self._maximum = maximum
+        self._clock = clock
+
+    def _parse(self, value):
+        value = value.strip()
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                date = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            seconds = date.timestamp() - self._clock()
+        else:
+            if not math.isfinite(seconds):
+                # E.g., "nan" or "inf", which `float` accepts.
+                return None
+            if seconds >= _EPOCH_THRESHOLD:
+                seconds -= self._clock()
+        return min(max(seconds, 0), self._maximum)
+
+    def _get_delay(self, response):
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            return None
+        for name in self._headers:
+            value = headers.get(name)
+            if value is not None:
+                delay = self._parse(str(value))
+                if delay is not None:
+                    return delay
+        return None
+
+    def get_timeout_after_response(self, request, response):
+        return self._get_delay(response)
+
+    def get_timeout_after_exception(self, request, exc_type, exc_val, exc_tb):
+        # Some client errors (e.g., `requests.HTTPError`) carry the
+        # offending response.
+        return self._get_delay(getattr(exc_val, "response", None))
+
+    def handle_after_final_retry(self):
+        pass
@@ -0,0 +1,110 @@
+"""
+Defines retry budgets, which cap the number of retries across many
+requests.
+
+This module provides classes to prevent retry storms, where every
+in-flight request independently retries against a failing service.
+"""
+
+# Standard library imports
+import threading
+import time
+
+__all__ = ["RetryBudget"]
+
+# Use monotonic time if available, otherwise fall back to the system clock.
+now = time.monotonic if hasattr(time, "monotonic") else time.time
+
+
+class _SlidingWindowCounter:
+    """Counts events that occurred within a recent window of time."""
+
+    def __init__(self, window, clock, num_buckets=10):
+        self._bucket_width = window / num_buckets
+        self._clock = clock
+        self._counts = [0] * num_buckets
+        self._epochs = [None] * num_buckets
+
+    def _current_epoch(self):
+        return int(self._clock() // self._bucket_width)
+
+    def add(self, amount=1):
+        epoch = self._current_epoch()
+        index = epoch % len(self._counts)
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._counts[index] = 0
+        self._counts[index] += amount
+
+    def total(self):
+        oldest = self._current_epoch() - len(self._counts)
+        return sum(
+            count
+            for epoch, count in zip(self._epochs, self._counts, strict=True)
+            if epoch is not None and epoch > oldest
+        )
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of recent successful requests.
+
+    A budget is safe to share across consumer methods (e.g., by
+    decorating the consumer class with
+    [`retry`][uplink.retry.retry]) and across threads. While a
+    dependency is unavailable, requests sharing the budget stop retrying
+    once the budget is exhausted, instead of multiplying the load on the
+    failing service.
+
+    ```python
+    budget = RetryBudget(ratio=0.1, min_retries_per_second=5)
+
+    @retry(when=retry.when.status_5xx(), budget=budget)
+    class GitHub(Consumer):
+        ...
+    ```
+
+    Args:
+        ratio: The number of retries allowed per successful request
+            within the window (e.g., `0.2` allows one retry for every
+            five successful requests).
+        min_retries_per_second: The number of retries allowed per
+            second regardless of the number of successful requests, so
+            that infrequently called methods can still retry.
+        window: The number of seconds over which requests are counted.
+    """
+
+    def __init__(self, ratio=0.2, min_retries_per_second=10, window=10, clock=now):
+        self._ratio = ratio
+        self._reserve = min_retries_per_second * window
+        self._deposits = _SlidingWindowCounter(window, clock)
+        self._withdrawals = _SlidingWindowCounter(window, clock)
+        self._lock = threading.RLock()
+
+    @property
+    def balance(self):
+        """The number of retries currently allowed by this budget."""
+        with self._lock:
+            return (
+                self._reserve
+                + self._ratio * self._deposits.total()
+                - self._withdrawals.total()
+            )
+
+    def deposit(self):
+        """Records a successful request."""
+        with self._lock:
+            self._deposits.add()
+
+    def try_withdraw(self):
+        """
+        Reserves a retry from the budget.
+
+        Returns:
+            bool: `True` if the retry is allowed, `False` otherwise.
+        """
+        with self._lock:
+            if self.balance < 1:
+                return False
+            self._withdrawals.add()
+            return True
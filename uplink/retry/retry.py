@@ -4,6 +4,9 @@ from uplink.clients.io import RequestTemplate, transitions
 from uplink.retry import (
     backoff as backoff_mod,
 )
+from uplink.retry import (
+    budget as budget_mod,
+)
 from uplink.retry import (
     stop as stop_mod,
 )
@@ -46,6 +49,12 @@ class retry(decorators.MethodAnnotation):
         doesn't break the retry's stop condition (e.g., stop retrying
         after 5 attempts).
 
+    !!! note
+        A retried request's body is encoded once and reused for each
+        attempt. A streamed body is rewound before each attempt if
+        it's a seekable file; otherwise (e.g., a generator), retrying
+        the request raises `uplink.exceptions.UnreplayableBody`.
+
     Args:
         when: A predicate that determines when a retry
             should be attempted.
@@ -59,6 +68,10 @@ class retry(decorators.MethodAnnotation):
         backoff: A backoff strategy or a function that creates an iterator
             over the ordered sequence of timeouts between retries. If
             not specified, exponential backoff is used.
+        budget: A [`RetryBudget`][uplink.retry.budget.RetryBudget]
+            that caps retries relative to recent successful requests.
+            Share one budget between decorators to enforce a single
+            limit across several consumer methods.
     """
 
     _DEFAULT_PREDICATE = when_mod.raises(Exception)
@@ -66,6 +79,7 @@ class retry(decorators.MethodAnnotation):
     stop = stop_mod
     backoff = backoff_mod
     when = when_mod
+    budget = budget_mod
 
     def __init__(
         self,
@@ -74,6 +88,7 @@ class retry(decorators.MethodAnnotation):
         on_exception=None,
         stop=None,
         backoff=None,
+        budget=None,
     ):
         if stop is None:
             if max_attempts is not None:
@@ -96,6 +111,7 @@ class retry(decorators.MethodAnnotation):
         self._when = when
         self._backoff = backoff
         self._stop = stop
+        self._budget = budget
 
     BASE_CLIENT_EXCEPTION = ClientExceptionProxy(lambda ex: ex.BaseClientException)
     CONNECTION_ERROR = ClientExceptionProxy(lambda ex: ex.ConnectionError)
@@ -107,22 +123,31 @@ class retry(decorators.MethodAnnotation):
         request_builder.add_request_template(
             _RetryTemplate(
                 self._when(request_builder),
-                self._backoff,
+                self._backoff.for_request(),
                 self._stop,
+                self._budget,
             )
         )
 
 
 class _RetryTemplate(RequestTemplate):
-    def __init__(self, condition, backoff, stop):
+    def __init__(self, condition, backoff, stop, budget=None):
         self._condition = condition
         self._backoff = backoff
         self._stop = stop
+        self._budget = budget
         self._stop_iter = self._stop()
 
+    def _is_within_budget(self):
+        return self._budget is None or self._budget.try_withdraw()
+
     def _process_timeout(self, timeout):
         next(self._stop_iter)
-        if timeout is None or self._stop_iter.send(timeout):
+        if (
+            timeout is None
+            or self._stop_iter.send(timeout)
+            or not self._is_within_budget()
+        ):
             self._backoff.handle_after_final_retry()
             self._stop_iter = self._stop()
             return None
@@ -130,6 +155,8 @@ class _RetryTemplate(RequestTemplate):
 
     def after_response(self, request, response):
         if not self._condition.should_retry_after_response(response):
+            if self._budget is not None:
+                self._budget.deposit()
             return self._process_timeout(None)
         return self._process_timeout(
             self._backoff.get_timeout_after_response(request, response)
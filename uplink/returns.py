@@ -1,12 +1,18 @@
 # Standard library imports
+import asyncio
+import collections
+import contextlib
+import hashlib
+import os
 import sys
 import warnings
 
 # Local imports
 from uplink import decorators
+from uplink.clients import io
 from uplink.converters import interfaces, keys
 
-__all__ = ["from_json", "json", "schema"]
+__all__ = ["Download", "from_json", "json", "schema", "to_file"]
 
 
 class ReturnType:
@@ -35,6 +41,10 @@ class CallableReturnType(ReturnType):
         super().__init__(decorator, type_)
         self._strategy = strategy
 
+        # Lets clients see through to the strategy (e.g., to await a
+        # coroutine strategy).
+        self.__wrapped__ = strategy
+
     def __call__(self, *args, **kwargs):
         return self._strategy(*args, **kwargs)
 
@@ -283,12 +293,192 @@ class schema(_ReturnsBase):
         return converter
 
 
+class Download(collections.namedtuple("Download", "destination size digest headers")):
+    """
+    Describes a response body that was written to a file by
+    [`returns.to_file`][uplink.returns.to_file].
+
+    Attributes:
+        destination: The path or file object that the body was written
+            to.
+        size (int): The size of the body, in bytes.
+        digest (str): The hexadecimal checksum of the body, or `None` if
+            no checksum was requested.
+        headers: The headers of the response.
+    """
+
+    __slots__ = ()
+
+
+class _Sink:
+    """Writes a response body to a file, measuring it along the way."""
+
+    def __init__(self, destination, checksum):
+        self._destination = destination
+        self._hash = None if checksum is None else hashlib.new(checksum)
+        self._owns_file = not hasattr(destination, "write")
+        self._fp = None if self._owns_file else destination
+        self._size = 0
+
+    def write(self, chunk):
+        self._fp.write(chunk)
+        self._size += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+
+    def __enter__(self):
+        if self._owns_file:
+            # Closed on exit, so that a failed download can be removed.
+            self._fp = open(self._destination, "wb")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._owns_file:
+            self._fp.close()
+            if exc_type is not None:
+                # Don't leave a partial download behind.
+                with contextlib.suppress(OSError):
+                    os.remove(self._destination)
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.__enter__)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.__exit__, exc_type, exc_val, exc_tb)
+
+    def download(self, headers):
+        digest = None if self._hash is None else self._hash.hexdigest()
+        return Download(self._destination, self._size, digest, headers)
+
+
+class FileStrategy:
+    def __init__(self, destination, checksum=None, chunk_size=64 * 1024):
+        self._destination = destination
+        self._checksum = checksum
+        self._chunk_size = chunk_size
+
+    def __call__(self, response):
+        with (
+            contextlib.closing(response),
+            _Sink(self._destination, self._checksum) as sink,
+        ):
+            for chunk in response.iter_content(self._chunk_size):
+                sink.write(chunk)
+        return sink.download(response.headers)
+
+    async def call_async(self, response):
+        # Write to the file in a thread, to avoid blocking the event loop.
+        loop = asyncio.get_running_loop()
+        try:
+            async with _Sink(self._destination, self._checksum) as sink:
+                if response.content.at_eof():
+                    # The body has already been read (e.g., by
+                    # `uplink.max_response_size`).
+                    body = await response.read()
+                    await loop.run_in_executor(None, sink.write, body)
+                chunks = response.content.iter_chunked(self._chunk_size)
+                async for chunk in chunks:
+                    await loop.run_in_executor(None, sink.write, chunk)
+        finally:
+            response.release()
+        return sink.download(response.headers)
+
+
+# noinspection PyPep8Naming
+class to_file(_ReturnsBase):
+    """
+    Specifies that the decorated consumer method should write the
+    response body to a file, and return a
+    [`Download`][uplink.returns.Download] that describes it, instead of
+    the response.
+
+    The body is streamed to the file in chunks, so it's never held in
+    memory in full. Optionally, a checksum of the body is computed along
+    the way.
+
+    ```python
+    @returns.to_file("latest.tar.gz", checksum="sha256")
+    @get("/releases/latest/archive")
+    def download_latest_release(self):
+        \"""Download the latest release.\"""
+    ```
+
+    To choose the file for each call, annotate a method argument with
+    [`Destination`][uplink.Destination] instead:
+
+    ```python
+    @returns.to_file
+    @get("/releases/{version}/archive")
+    def download_release(self, version, destination: Destination):
+        \"""Download a release.\"""
+    ```
+
+    A partially written file is removed if the download fails, unless
+    the destination is a file object.
+
+    !!! note
+        Responses are streamed with `iter_content` by blocking clients
+        (i.e., `RequestsClient` and `TwistedClient`), which are sent
+        with the `requests` `stream` option, and with
+        `content.iter_chunked` by `AiohttpClient`.
+
+    Args:
+        destination (optional): The path or writable binary file object
+            to write the body to.
+        checksum (str, optional): The name of a `hashlib` algorithm
+            (e.g., `"sha256"`) to compute a checksum of the body with.
+        chunk_size (int, optional): The size of the chunks in which the
+            body is read, in bytes.
+    """
+
+    _can_be_static = True
+
+    def __init__(self, destination=None, checksum=None, chunk_size=64 * 1024):
+        if checksum is not None:
+            # Fail fast on an unsupported algorithm.
+            hashlib.new(checksum)
+        self._destination = destination
+        self._checksum = checksum
+        self._chunk_size = chunk_size
+
+    @property
+    def return_type(self):
+        return Download
+
+    def modify_request(self, request_builder):
+        return_type = request_builder.return_type
+        if not return_type.is_applicable(self):
+            return
+
+        destination = request_builder.destination
+        if destination is None:
+            destination = self._destination
+        if destination is None:
+            raise ValueError(
+                "No file to write the response body to: pass a destination "
+                "to `returns.to_file`, or annotate an argument with "
+                "`uplink.Destination`."
+            )
+
+        strategy = FileStrategy(destination, self._checksum, self._chunk_size)
+        if isinstance(request_builder.client.io(), io.AsyncioStrategy):
+            strategy = strategy.call_async
+        else:
+            # Let `requests` stream the body, instead of reading it first.
+            request_builder.info["stream"] = True
+        request_builder.return_type = return_type.with_strategy(strategy)
+
+
 class _ModuleProxy:
     __module = sys.modules[__name__]
 
     schema = model = schema
     json = json
     from_json = from_json
+    to_file = to_file
+    Download = Download
     __all__ = __module.__all__
 
     def __getattr__(self, item):
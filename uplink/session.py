@@ -20,6 +20,17 @@ class Session:
     def create(self, consumer, definition):
         return self.__builder.build(definition, consumer)
 
+    def derive(self, base_url=None, auth=None):
+        """
+        Returns a new session that shares this session's client,
+        converters, and hooks.
+        """
+        builder = self.__builder.derive()
+        if base_url is not None:
+            builder.base_url = base_url
+        builder.auth = auth
+        return Session(builder)
+
     @property
     def base_url(self):
         """
@@ -1,6 +1,9 @@
 # Standard library imports
 import collections
+import importlib
+import importlib.util
 import inspect
+import sys
 
 try:
     # Python 3.2+
@@ -83,6 +86,55 @@ def no_op(*_, **__):
     pass
 
 
+class _LazyModule:
+    """A proxy that imports a module on first attribute access."""
+
+    def __init__(self, name):
+        self.__name = name
+
+    @property
+    def module_name(self):
+        return self.__name
+
+    def __getattr__(self, item):
+        return getattr(importlib.import_module(self.__name), item)
+
+    def __repr__(self):
+        return f"<lazy module {self.__name!r}>"
+
+
+def lazy_import(name):
+    """
+    Returns a proxy for the named module that defers importing the
+    module until one of its attributes is accessed, or `None` if the
+    module's top-level package is not installed.
+
+    This keeps heavy optional dependencies (e.g., `aiohttp`) from
+    slowing down `import uplink` when they aren't used.
+    """
+    try:
+        spec = importlib.util.find_spec(name.partition(".")[0])
+    except (ImportError, ValueError):  # pragma: no cover
+        spec = None
+    return None if spec is None else _LazyModule(name)
+
+
+def is_imported(module):
+    """
+    Returns whether the given module, which may be a proxy returned by
+    `lazy_import`, has already been imported.
+
+    Types defined with an optional library (e.g., a `marshmallow`
+    schema) can only exist once the library is imported, so this check
+    lets callers rule out such types without importing the library.
+    """
+    if module is None:
+        return False
+    if isinstance(module, _LazyModule):
+        return module.module_name in sys.modules
+    return True
+
+
 class URIBuilder:
     @staticmethod
     def variables(uri):